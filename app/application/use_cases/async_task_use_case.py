@@ -0,0 +1,112 @@
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional, Union
+from app.domain.models.task import (
+    TaskCreate,
+    TaskUpdate,
+    Task,
+    TaskStatus,
+    TaskPriority,
+    TaskProjection,
+    TaskSort,
+    TaskStats,
+)
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.domain.exceptions.custom_exceptions import TaskNotFoundException
+from app.domain.exceptions.custom_exceptions import (
+    ToDoListNotFoundException,
+    PreconditionFailedException,
+)
+from app.domain.repositories.async_task_repository_interface import (
+    AsyncTaskRepositoryInterface,
+)
+from app.domain.repositories.async_todo_list_repository_interface import (
+    AsyncToDoListRepositoryInterface,
+)
+
+
+class AsyncTaskUseCase:
+    def __init__(
+        self,
+        task_repository: AsyncTaskRepositoryInterface,
+        todo_list_repository: AsyncToDoListRepositoryInterface,
+    ):
+        self.task_repository = task_repository
+        self.todo_list_repository = todo_list_repository
+
+    async def create_task(self, list_id: UUID, data: TaskCreate) -> Task:
+        todo_list = await self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        task = await self.task_repository.create(list_id, data)
+        if task is None:
+            raise ToDoListNotFoundException(str(list_id))
+        return task
+
+    async def get_task(self, list_id: UUID, task_id: UUID) -> Task:
+        task = await self.task_repository.get_by_id(list_id, task_id)
+        if not task:
+            raise TaskNotFoundException(str(task_id))
+        return task
+
+    async def update_task(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        data: TaskUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task:
+        updated = await self.task_repository.update(list_id, task_id, data, if_match)
+        if not updated:
+            if if_match is not None and await self.task_repository.get_by_id(
+                list_id, task_id
+            ):
+                raise PreconditionFailedException(str(task_id))
+            raise TaskNotFoundException(str(task_id))
+        return updated
+
+    async def delete_task(self, list_id: UUID, task_id: UUID) -> None:
+        if not await self.task_repository.delete(list_id, task_id):
+            raise TaskNotFoundException(str(task_id))
+
+    async def change_status(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        status: TaskStatus,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task:
+        data = TaskUpdate(status=status)
+        return await self.update_task(list_id, task_id, data, if_match)
+
+    async def get_tasks_version(self, list_id: UUID) -> int:
+        version = await self.todo_list_repository.get_tasks_version(list_id)
+        if version is None:
+            raise ToDoListNotFoundException(str(list_id))
+        return version
+
+    async def list_tasks(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: Optional[TaskSort] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Page[Task], Page[TaskProjection]]:
+        todo_list = await self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        return await self.task_repository.list_page_by_filters(
+            list_id, status, priority, limit, after, sort, fields
+        )
+
+    async def get_stats(self, list_id: UUID) -> TaskStats:
+        todo_list = await self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        return await self.task_repository.get_stats(list_id)
+
+    async def get_completion_percentage(self, list_id: UUID) -> float:
+        return (await self.get_stats(list_id)).completion_percentage
@@ -0,0 +1,98 @@
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional
+from app.domain.models.todo_list import (
+    ToDoListCreate,
+    ToDoListUpdate,
+    ToDoList,
+    ToDoListWithTasks,
+)
+from app.domain.models.task import TaskStatus
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.domain.exceptions.custom_exceptions import (
+    ToDoListNotFoundException,
+    PreconditionFailedException,
+)
+from app.domain.repositories.async_task_repository_interface import (
+    AsyncTaskRepositoryInterface,
+)
+from app.domain.repositories.async_todo_list_repository_interface import (
+    AsyncToDoListRepositoryInterface,
+)
+
+
+# task_repository solo hace falta para incluir las tareas en las listas.
+class AsyncToDoListUseCase:
+    def __init__(
+        self,
+        repository: AsyncToDoListRepositoryInterface,
+        task_repository: Optional[AsyncTaskRepositoryInterface] = None,
+    ):
+        self.repository = repository
+        self.task_repository = task_repository
+
+    async def create_list(self, data: ToDoListCreate) -> ToDoList:
+        return await self.repository.create(data)
+
+    async def get_list(self, list_id: UUID) -> ToDoList:
+        todo_list = await self.repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        return todo_list
+
+    async def update_list(
+        self,
+        list_id: UUID,
+        data: ToDoListUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> ToDoList:
+        updated = await self.repository.update(list_id, data, if_match)
+        if not updated:
+            if if_match is not None and await self.repository.get_by_id(list_id):
+                raise PreconditionFailedException(str(list_id))
+            raise ToDoListNotFoundException(str(list_id))
+        return updated
+
+    async def delete_list(self, list_id: UUID) -> None:
+        if not await self.repository.delete(list_id):
+            raise ToDoListNotFoundException(str(list_id))
+
+    async def list_all(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> Page[ToDoList]:
+        return await self.repository.list_page(limit, after)
+
+    # Dos consultas (listas y tareas) sea cual sea el número de listas.
+    async def list_all_with_tasks(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[ToDoListWithTasks]:
+        page = await self.repository.list_page(limit, after)
+        items = await self._with_tasks(page.items, status, per_list)
+        return Page(items=items, next_cursor=page.next_cursor)
+
+    async def get_list_with_tasks(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> ToDoListWithTasks:
+        todo_list = await self.get_list(list_id)
+        return (await self._with_tasks([todo_list], status, per_list))[0]
+
+    async def _with_tasks(
+        self,
+        todo_lists: List[ToDoList],
+        status: Optional[TaskStatus],
+        per_list: int,
+    ) -> List[ToDoListWithTasks]:
+        ids = [todo_list.id for todo_list in todo_lists]
+        tasks = (
+            await self.task_repository.list_by_lists(ids, status, per_list)
+            if ids
+            else []
+        )
+        return ToDoListWithTasks.group(todo_lists, tasks)
@@ -0,0 +1,43 @@
+from uuid import UUID
+from app.domain.models.job import Job, JobKind, JobRequest, JobStatus
+from app.domain.exceptions.custom_exceptions import (
+    JobNotFinishedException,
+    JobNotFoundException,
+    ToDoListNotFoundException,
+)
+from app.domain.repositories.job_repository_interface import JobRepositoryInterface
+from app.domain.repositories.todo_list_repository_interface import (
+    ToDoListRepositoryInterface,
+)
+
+
+class JobUseCase:
+    def __init__(
+        self,
+        job_repository: JobRepositoryInterface,
+        todo_list_repository: ToDoListRepositoryInterface,
+    ):
+        self.job_repository = job_repository
+        self.todo_list_repository = todo_list_repository
+
+    # Solo se comprueba la lista y se encola: el trabajo lo hace un worker.
+    def enqueue(self, list_id: UUID, data: JobRequest) -> Job:
+        todo_list = self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        params = data.model_dump(mode="json", exclude={"kind"})
+        return self.job_repository.create(list_id, data.kind, params)
+
+    def get_job(self, job_id: UUID) -> Job:
+        job = self.job_repository.get_by_id(job_id)
+        if not job:
+            raise JobNotFoundException(str(job_id))
+        return job
+
+    def get_finished_export(self, job_id: UUID) -> Job:
+        job = self.get_job(job_id)
+        if job.kind != JobKind.EXPORT:
+            raise JobNotFoundException(str(job_id))
+        if job.status != JobStatus.SUCCEEDED:
+            raise JobNotFinishedException(str(job_id))
+        return job
@@ -0,0 +1,36 @@
+from typing import Optional
+from uuid import UUID
+from app.domain.models.task import TaskSearchHit
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.domain.exceptions.custom_exceptions import ToDoListNotFoundException
+from app.domain.repositories.task_search_repository_interface import (
+    TaskSearchRepositoryInterface,
+)
+from app.domain.repositories.todo_list_repository_interface import (
+    ToDoListRepositoryInterface,
+)
+from app.shared.utils.search import tokenize
+
+
+class TaskSearchUseCase:
+    def __init__(
+        self,
+        search_repository: TaskSearchRepositoryInterface,
+        todo_list_repository: ToDoListRepositoryInterface,
+    ):
+        self.search_repository = search_repository
+        self.todo_list_repository = todo_list_repository
+
+    # Un texto sin palabras (solo signos) no puede coincidir con nada.
+    def search_tasks(
+        self,
+        text: str,
+        list_id: Optional[UUID] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Page[TaskSearchHit]:
+        if list_id is not None and not self.todo_list_repository.get_by_id(list_id):
+            raise ToDoListNotFoundException(str(list_id))
+        if not tokenize(text):
+            return Page(items=[])
+        return self.search_repository.search(text, list_id, limit, after)
@@ -1,15 +1,35 @@
+from datetime import datetime
 from uuid import UUID
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from pydantic import ValidationError
 from app.domain.models.task import (
     TaskCreate,
     TaskUpdate,
     Task,
     TaskStatus,
     TaskPriority,
+    TaskProjection,
+    TaskSort,
+    TaskStats,
+    TaskBatchUpdateItem,
+    TaskStatusTransition,
+    TaskStatusTransitionResult,
 )
+from app.domain.models.batch import (
+    BatchItemError,
+    BatchResult,
+    ImportReport,
+    IMPORT_CHUNK_SIZE,
+    MAX_BATCH_SIZE,
+    MAX_REPORTED_ERRORS,
+)
+from app.domain.models.changes import TaskChanges
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
 from app.domain.exceptions.custom_exceptions import TaskNotFoundException
 from app.domain.exceptions.custom_exceptions import (
     ToDoListNotFoundException,
+    BatchTooLargeException,
+    PreconditionFailedException,
 )
 from app.domain.repositories.task_repository_interface import (
     TaskRepositoryInterface,
@@ -32,7 +52,10 @@ class TaskUseCase:
         todo_list = self.todo_list_repository.get_by_id(list_id)
         if not todo_list:
             raise ToDoListNotFoundException(str(list_id))
-        return self.task_repository.create(list_id, data)
+        task = self.task_repository.create(list_id, data)
+        if task is None:
+            raise ToDoListNotFoundException(str(list_id))
+        return task
 
     def get_task(self, list_id: UUID, task_id: UUID) -> Task:
         task = self.task_repository.get_by_id(list_id, task_id)
@@ -40,9 +63,20 @@ class TaskUseCase:
             raise TaskNotFoundException(str(task_id))
         return task
 
-    def update_task(self, list_id: UUID, task_id: UUID, data: TaskUpdate) -> Task:
-        updated = self.task_repository.update(list_id, task_id, data)
+    # Con If-Match, un UPDATE sin filas es un 412 si la tarea sigue existiendo.
+    def update_task(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        data: TaskUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task:
+        updated = self.task_repository.update(list_id, task_id, data, if_match)
         if not updated:
+            if if_match is not None and self.task_repository.get_by_id(
+                list_id, task_id
+            ):
+                raise PreconditionFailedException(str(task_id))
             raise TaskNotFoundException(str(task_id))
         return updated
 
@@ -50,30 +84,186 @@ class TaskUseCase:
         if not self.task_repository.delete(list_id, task_id):
             raise TaskNotFoundException(str(task_id))
 
-    def change_status(self, list_id: UUID, task_id: UUID, status: TaskStatus) -> Task:
-        task = self.task_repository.get_by_id(list_id, task_id)
-        if not task:
-            raise TaskNotFoundException(str(task_id))
-        task.status = status
-        return self.task_repository.update(list_id, task_id, TaskUpdate(status=status))
+    def change_status(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        status: TaskStatus,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task:
+        return self.update_task(list_id, task_id, TaskUpdate(status=status), if_match)
+
+    # Una consulta por clave primaria: basta para responder 304 a un sondeo.
+    def get_tasks_version(self, list_id: UUID) -> int:
+        version = self.todo_list_repository.get_tasks_version(list_id)
+        if version is None:
+            raise ToDoListNotFoundException(str(list_id))
+        return version
 
     def list_tasks(
         self,
         list_id: UUID,
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
-    ) -> List[Task]:
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: Optional[TaskSort] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Page[Task], Page[TaskProjection]]:
         todo_list = self.todo_list_repository.get_by_id(list_id)
         if not todo_list:
             raise ToDoListNotFoundException(str(list_id))
-        return self.task_repository.list_by_filters(list_id, status, priority)
+        return self.task_repository.list_page_by_filters(
+            list_id, status, priority, limit, after, sort, fields
+        )
+
+    # El coste depende del número de cambios desde since, no del tamaño de la
+    # lista: una lectura de la lista y un recorrido acotado de dos índices.
+    def list_changes(
+        self, list_id: UUID, since: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> TaskChanges:
+        changes = self.task_repository.list_changes(list_id, since, limit)
+        if changes is None:
+            raise ToDoListNotFoundException(str(list_id))
+        return changes
+
+    def get_stats(self, list_id: UUID) -> TaskStats:
+        todo_list = self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        return self.task_repository.get_stats(list_id)
 
     def get_completion_percentage(self, list_id: UUID) -> float:
+        return self.get_stats(list_id).completion_percentage
+
+    def export_tasks(self, list_id: UUID, batch_size: int) -> Iterator[Task]:
+        todo_list = self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        return self.task_repository.stream_by_list(list_id, batch_size)
+
+    # Las filas llegan como texto JSON (NDJSON) o como diccionarios (CSV) y se
+    # consumen de forma perezosa: en memoria solo vive el bloque en curso.
+    def import_tasks(self, list_id: UUID, rows: Iterable[Any]) -> ImportReport:
         todo_list = self.todo_list_repository.get_by_id(list_id)
         if not todo_list:
             raise ToDoListNotFoundException(str(list_id))
-        tasks = self.task_repository.list_by_filters(list_id)
-        if not tasks:
-            return 0.0
-        completed = [t for t in tasks if t.status == TaskStatus.COMPLETED]
-        return round(len(completed) / len(tasks) * 100, 2)
+        report, chunk = ImportReport(), []
+        for index, row in enumerate(rows):
+            try:
+                if isinstance(row, str):
+                    chunk.append(TaskCreate.model_validate_json(row))
+                else:
+                    chunk.append(TaskCreate.model_validate(row))
+            except ValidationError as exc:
+                report.rejected += 1
+                if len(report.errors) < MAX_REPORTED_ERRORS:
+                    detail = exc.errors(include_url=False, include_context=False)
+                    report.errors.append(BatchItemError(index=index, detail=detail))
+                continue
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                report.imported += self._copy_chunk(list_id, chunk)
+                chunk = []
+        if chunk:
+            report.imported += self._copy_chunk(list_id, chunk)
+        return report
+
+    # La lista puede borrarse a mitad de la importación: los bloques ya
+    # confirmados se purgarán con ella.
+    def _copy_chunk(self, list_id: UUID, chunk: List[TaskCreate]) -> int:
+        copied = self.task_repository.copy_many(list_id, chunk)
+        if copied is None:
+            raise ToDoListNotFoundException(str(list_id))
+        return copied
+
+    def create_tasks(
+        self, list_id: UUID, items: List[Dict[str, Any]]
+    ) -> BatchResult[Task]:
+        self._check_batch_size(items)
+        todo_list = self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        valid, errors = self._validate_items(items, TaskCreate)
+        data = [item for _, item in valid]
+        created = self.task_repository.create_many(list_id, data) if data else []
+        if created is None:
+            raise ToDoListNotFoundException(str(list_id))
+        return BatchResult(items=created, errors=errors)
+
+    def update_tasks(
+        self, list_id: UUID, items: List[Dict[str, Any]]
+    ) -> BatchResult[Task]:
+        self._check_batch_size(items)
+        todo_list = self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        valid, errors = self._validate_items(items, TaskBatchUpdateItem)
+        indexes, unique = {}, []
+        for index, item in valid:
+            if item.id in indexes:
+                errors.append(
+                    BatchItemError(
+                        index=index, id=item.id, detail="Duplicated task id."
+                    )
+                )
+                continue
+            indexes[item.id] = index
+            unique.append(item)
+        updated = self.task_repository.update_many(list_id, unique) if unique else []
+        errors.extend(self._not_found_errors(indexes, {task.id for task in updated}))
+        return BatchResult(items=updated, errors=sorted(errors, key=lambda e: e.index))
+
+    def delete_tasks(self, list_id: UUID, task_ids: List[UUID]) -> BatchResult[UUID]:
+        self._check_batch_size(task_ids)
+        todo_list = self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        indexes = {}
+        for index, task_id in enumerate(task_ids):
+            indexes.setdefault(task_id, index)
+        ids = list(indexes)
+        deleted = self.task_repository.delete_many(list_id, ids) if ids else []
+        errors = self._not_found_errors(indexes, set(deleted))
+        return BatchResult(items=deleted, errors=errors)
+
+    # Una lectura de la lista (cacheada) para el 404 y un único UPDATE, sea
+    # cual sea el número de tareas afectadas.
+    def transition_status(
+        self, list_id: UUID, data: TaskStatusTransition
+    ) -> TaskStatusTransitionResult:
+        self._check_batch_size(data.source.ids or [])
+        todo_list = self.todo_list_repository.get_by_id(list_id)
+        if not todo_list:
+            raise ToDoListNotFoundException(str(list_id))
+        # Los ids solo sirven para invalidar la caché: sin límite de lote, la
+        # respuesta no los devuelve.
+        changed = self.task_repository.transition_status(list_id, data)
+        return TaskStatusTransitionResult(updated=len(changed))
+
+    @staticmethod
+    def _check_batch_size(items: List) -> None:
+        if len(items) > MAX_BATCH_SIZE:
+            raise BatchTooLargeException(len(items), MAX_BATCH_SIZE)
+
+    @staticmethod
+    def _validate_items(
+        items: List[Dict[str, Any]], model
+    ) -> Tuple[List[Tuple[int, Any]], List[BatchItemError]]:
+        valid, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, model.model_validate(item)))
+            except ValidationError as exc:
+                detail = exc.errors(include_url=False, include_context=False)
+                errors.append(BatchItemError(index=index, detail=detail))
+        return valid, errors
+
+    @staticmethod
+    def _not_found_errors(
+        indexes: Dict[UUID, int], found: Set[UUID]
+    ) -> List[BatchItemError]:
+        return [
+            BatchItemError(index=index, id=task_id, detail="Task not found.")
+            for task_id, index in indexes.items()
+            if task_id not in found
+        ]
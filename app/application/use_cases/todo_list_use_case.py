@@ -1,15 +1,33 @@
+from datetime import datetime
 from uuid import UUID
-from typing import List
-from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate, ToDoList
-from app.domain.exceptions.custom_exceptions import ToDoListNotFoundException
+from typing import List, Optional
+from app.domain.models.todo_list import (
+    ToDoListCreate,
+    ToDoListUpdate,
+    ToDoList,
+    ToDoListWithTasks,
+)
+from app.domain.models.task import TaskStatus
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.domain.exceptions.custom_exceptions import (
+    ToDoListNotFoundException,
+    PreconditionFailedException,
+)
+from app.domain.repositories.task_repository_interface import TaskRepositoryInterface
 from app.domain.repositories.todo_list_repository_interface import (
     ToDoListRepositoryInterface,
 )
 
 
+# task_repository solo hace falta para incluir las tareas en las listas.
 class ToDoListUseCase:
-    def __init__(self, repository: ToDoListRepositoryInterface):
+    def __init__(
+        self,
+        repository: ToDoListRepositoryInterface,
+        task_repository: Optional[TaskRepositoryInterface] = None,
+    ):
         self.repository = repository
+        self.task_repository = task_repository
 
     def create_list(self, data: ToDoListCreate) -> ToDoList:
         return self.repository.create(data)
@@ -20,9 +38,16 @@ class ToDoListUseCase:
             raise ToDoListNotFoundException(str(list_id))
         return todo_list
 
-    def update_list(self, list_id: UUID, data: ToDoListUpdate) -> ToDoList:
-        updated = self.repository.update(list_id, data)
+    def update_list(
+        self,
+        list_id: UUID,
+        data: ToDoListUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> ToDoList:
+        updated = self.repository.update(list_id, data, if_match)
         if not updated:
+            if if_match is not None and self.repository.get_by_id(list_id):
+                raise PreconditionFailedException(str(list_id))
             raise ToDoListNotFoundException(str(list_id))
         return updated
 
@@ -30,5 +55,38 @@ class ToDoListUseCase:
         if not self.repository.delete(list_id):
             raise ToDoListNotFoundException(str(list_id))
 
-    def list_all(self) -> List[ToDoList]:
-        return self.repository.list_all()
+    def list_all(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> Page[ToDoList]:
+        return self.repository.list_page(limit, after)
+
+    # Dos consultas (listas y tareas) sea cual sea el número de listas.
+    def list_all_with_tasks(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[ToDoListWithTasks]:
+        page = self.repository.list_page(limit, after)
+        items = self._with_tasks(page.items, status, per_list)
+        return Page(items=items, next_cursor=page.next_cursor)
+
+    def get_list_with_tasks(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> ToDoListWithTasks:
+        todo_list = self.get_list(list_id)
+        return self._with_tasks([todo_list], status, per_list)[0]
+
+    def _with_tasks(
+        self,
+        todo_lists: List[ToDoList],
+        status: Optional[TaskStatus],
+        per_list: int,
+    ) -> List[ToDoListWithTasks]:
+        ids = [todo_list.id for todo_list in todo_lists]
+        tasks = self.task_repository.list_by_lists(ids, status, per_list) if ids else []
+        return ToDoListWithTasks.group(todo_lists, tasks)
@@ -17,9 +17,90 @@ class TaskNotFoundException(HTTPException):
         )
 
 
+class JobNotFoundException(HTTPException):
+    def __init__(self, job_id: str):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID '{job_id}' not found.",
+        )
+
+
+class JobNotFinishedException(HTTPException):
+    def __init__(self, job_id: str):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job with ID '{job_id}' has not finished successfully.",
+        )
+
+
 class InvalidTaskStatusException(HTTPException):
     def __init__(self, status_value: str):
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid task status: '{status_value}'.",
         )
+
+
+class InvalidCursorException(HTTPException):
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid pagination cursor: '{cursor}'.",
+        )
+
+
+class InvalidSyncTokenException(HTTPException):
+    def __init__(self, token: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sync token: '{token}'.",
+        )
+
+
+class InvalidSortException(HTTPException):
+    def __init__(self, sort: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sort: '{sort}'.",
+        )
+
+
+class InvalidFieldsException(HTTPException):
+    def __init__(self, fields: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid fields: '{fields}'.",
+        )
+
+
+class BatchTooLargeException(HTTPException):
+    def __init__(self, size: int, max_size: int):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch of {size} items exceeds the maximum of {max_size}.",
+        )
+
+
+class InternalEndpointsDisabledException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not Found",
+        )
+
+
+class InvalidInternalTokenException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing internal API token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+class PreconditionFailedException(HTTPException):
+    def __init__(self, resource_id: str):
+        super().__init__(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Resource '{resource_id}' was modified since the given ETag.",
+        )
@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import Any, Generic, List, Optional, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+MAX_BATCH_SIZE = 10_000
+# La importación carga las filas válidas en bloques de este tamaño y solo
+# detalla los primeros MAX_REPORTED_ERRORS rechazos para acotar la memoria.
+IMPORT_CHUNK_SIZE = 10_000
+MAX_REPORTED_ERRORS = 1_000
+
+
+class BatchItemError(BaseModel):
+    index: int
+    id: Optional[UUID] = None
+    detail: Any
+
+
+class BatchResult(BaseModel, Generic[T]):
+    items: List[T]
+    errors: List[BatchItemError] = []
+
+
+class ImportReport(BaseModel):
+    imported: int = 0
+    rejected: int = 0
+    errors: List[BatchItemError] = []
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+from app.domain.models.task import Task
+from app.domain.models.todo_list import ToDoList
+
+
+# Cambios de una lista posteriores a un token de sincronización: la lista si ha
+# cambiado, las tareas creadas o modificadas (en su estado actual) y los ids de
+# las borradas. next_token se envía como since en la siguiente llamada.
+class TaskChanges(BaseModel):
+    todo_list: Optional[ToDoList] = None
+    upserted: List[Task]
+    deleted: List[UUID]
+    next_token: str
+    has_more: bool = False
@@ -0,0 +1,59 @@
+from pydantic import BaseModel, Field
+from enum import Enum
+from typing import Annotated, Any, Dict, Literal, Optional, Union
+from uuid import UUID
+from datetime import datetime
+from app.domain.models.task import TaskStatus
+
+
+class JobKind(str, Enum):
+    STATUS_CHANGE = "status_change"
+    DUPLICATE_LIST = "duplicate_list"
+    EXPORT = "export"
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+# Trabajos que se pueden encolar sobre una lista; kind decide el resto de campos.
+class StatusChangeJob(BaseModel):
+    kind: Literal[JobKind.STATUS_CHANGE]
+    status: TaskStatus
+    from_status: Optional[TaskStatus] = None
+
+
+class DuplicateListJob(BaseModel):
+    kind: Literal[JobKind.DUPLICATE_LIST]
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+
+
+class ExportJob(BaseModel):
+    kind: Literal[JobKind.EXPORT]
+    format: Literal["ndjson", "csv"] = "ndjson"
+
+
+JobRequest = Annotated[
+    Union[StatusChangeJob, DuplicateListJob, ExportJob], Field(discriminator="kind")
+]
+
+
+# processed/total permiten mostrar el progreso; total es una estimación tomada
+# al empezar (la lista puede cambiar mientras el trabajo avanza).
+class Job(BaseModel):
+    id: UUID
+    kind: JobKind
+    status: JobStatus
+    todo_list_id: UUID
+    params: Dict[str, Any]
+    processed: int = 0
+    total: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
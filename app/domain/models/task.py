@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from enum import Enum
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -17,6 +17,22 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
+# Ordinal de cada prioridad para ordenar: la columna guarda el nombre del enum
+# y su orden alfabético (HIGH < LOW < MEDIUM) no sirve.
+PRIORITY_RANK = {TaskPriority.LOW: 0, TaskPriority.MEDIUM: 1, TaskPriority.HIGH: 2}
+
+
+class TaskSortField(str, Enum):
+    PRIORITY = "priority"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    TITLE = "title"
+
+
+# Claves de ordenación en orden de prioridad: (campo, descendente).
+TaskSort = List[Tuple[TaskSortField, bool]]
+
+
 class TaskBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
@@ -31,8 +47,32 @@ class TaskCreate(TaskBase):
 class TaskUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
-    status: Optional[TaskStatus]
-    priority: Optional[TaskPriority]
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+
+
+class TaskBatchUpdateItem(TaskUpdate):
+    id: UUID
+
+
+class TaskBatchDelete(BaseModel):
+    ids: List[UUID]
+
+
+# Filtro de origen de un cambio de estado masivo; sin filtros, toda la lista.
+class TaskTransitionSource(BaseModel):
+    status: Optional[List[TaskStatus]] = None
+    priority: Optional[List[TaskPriority]] = None
+    ids: Optional[List[UUID]] = None
+
+
+class TaskStatusTransition(BaseModel):
+    source: TaskTransitionSource = Field(default_factory=TaskTransitionSource)
+    target: TaskStatus
+
+
+class TaskStatusTransitionResult(BaseModel):
+    updated: int
 
 
 class Task(TaskBase):
@@ -40,3 +80,49 @@ class Task(TaskBase):
     todo_list_id: UUID
     created_at: datetime
     updated_at: datetime
+
+
+# Campos que admite el parámetro fields de los listados.
+TASK_FIELDS = tuple(Task.model_fields)
+
+
+# Tarea con solo parte de sus campos: el listado con fields= lee únicamente
+# esas columnas (más las que necesita el cursor) y no valida las demás.
+class TaskProjection(BaseModel):
+    id: Optional[UUID] = None
+    todo_list_id: Optional[UUID] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class TaskSearchHit(Task):
+    rank: float
+
+
+class TaskStats(BaseModel):
+    total: int
+    by_status: Dict[TaskStatus, int]
+    by_priority: Dict[TaskPriority, int]
+    completion_percentage: float
+
+    @classmethod
+    def from_counts(
+        cls, counts: Iterable[Tuple[TaskStatus, TaskPriority, int]]
+    ) -> "TaskStats":
+        by_status = {task_status: 0 for task_status in TaskStatus}
+        by_priority = {task_priority: 0 for task_priority in TaskPriority}
+        for task_status, task_priority, count in counts:
+            by_status[task_status] += count
+            by_priority[task_priority] += count
+        total = sum(by_status.values())
+        completed = by_status[TaskStatus.COMPLETED]
+        return cls(
+            total=total,
+            by_status=by_status,
+            by_priority=by_priority,
+            completion_percentage=round(completed / total * 100, 2) if total else 0.0,
+        )
@@ -1,7 +1,13 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, computed_field
+from enum import Enum
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
+from app.domain.models.task import Task
+
+
+class ListInclude(str, Enum):
+    TASKS = "tasks"
 
 
 class ToDoListBase(BaseModel):
@@ -22,3 +28,32 @@ class ToDoList(ToDoListBase):
     id: UUID
     created_at: datetime
     updated_at: datetime
+    total_tasks: int = 0
+    pending_tasks: int = 0
+    in_progress_tasks: int = 0
+    completed_tasks: int = 0
+
+    @computed_field
+    @property
+    def completion_percentage(self) -> float:
+        if not self.total_tasks:
+            return 0.0
+        return round(self.completed_tasks / self.total_tasks * 100, 2)
+
+
+class ToDoListWithTasks(ToDoList):
+    tasks: List[Task]
+
+    # Reparte las tareas (de una única consulta para todas las listas) entre
+    # sus listas, conservando el orden en que llegan.
+    @classmethod
+    def group(
+        cls, todo_lists: List[ToDoList], tasks: List[Task]
+    ) -> List["ToDoListWithTasks"]:
+        by_list = {todo_list.id: [] for todo_list in todo_lists}
+        for task in tasks:
+            by_list[task.todo_list_id].append(task)
+        return [
+            cls(**dict(todo_list), tasks=by_list[todo_list.id])
+            for todo_list in todo_lists
+        ]
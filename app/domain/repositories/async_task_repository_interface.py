@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Union
+from uuid import UUID
+from app.domain.models.task import (
+    TaskCreate,
+    TaskUpdate,
+    Task,
+    TaskStatus,
+    TaskPriority,
+    TaskProjection,
+    TaskSort,
+    TaskStats,
+)
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+
+
+class AsyncTaskRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, list_id: UUID, data: TaskCreate) -> Optional[Task]: ...
+
+    @abstractmethod
+    async def get_by_id(self, list_id: UUID, task_id: UUID) -> Task: ...
+
+    @abstractmethod
+    async def update(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        data: TaskUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task: ...
+
+    @abstractmethod
+    async def delete(self, list_id: UUID, task_id: UUID) -> bool: ...
+
+    @abstractmethod
+    async def list_page_by_filters(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: Optional[TaskSort] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Page[Task], Page[TaskProjection]]: ...
+
+    @abstractmethod
+    async def list_by_lists(
+        self,
+        list_ids: List[UUID],
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> List[Task]: ...
+
+    @abstractmethod
+    async def get_stats(self, list_id: UUID) -> TaskStats: ...
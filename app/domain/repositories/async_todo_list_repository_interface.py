@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate, ToDoList
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+
+
+class AsyncToDoListRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, data: ToDoListCreate) -> ToDoList: ...
+
+    @abstractmethod
+    async def get_by_id(self, list_id: UUID) -> ToDoList: ...
+
+    @abstractmethod
+    async def update(
+        self,
+        list_id: UUID,
+        data: ToDoListUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> ToDoList: ...
+
+    @abstractmethod
+    async def get_tasks_version(self, list_id: UUID) -> Optional[int]: ...
+
+    @abstractmethod
+    async def delete(self, list_id: UUID) -> bool: ...
+
+    @abstractmethod
+    async def list_page(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> Page[ToDoList]: ...
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+from uuid import UUID
+from app.domain.models.job import Job, JobKind
+
+
+class JobRepositoryInterface(ABC):
+    @abstractmethod
+    def create(self, list_id: UUID, kind: JobKind, params: Dict[str, Any]) -> Job: ...
+
+    @abstractmethod
+    def get_by_id(self, job_id: UUID) -> Optional[Job]: ...
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterator, List, Optional, Union
 from uuid import UUID
 from app.domain.models.task import (
     TaskCreate,
@@ -7,18 +8,31 @@ from app.domain.models.task import (
     Task,
     TaskStatus,
     TaskPriority,
+    TaskProjection,
+    TaskSort,
+    TaskStats,
+    TaskBatchUpdateItem,
+    TaskStatusTransition,
 )
+from app.domain.models.changes import TaskChanges
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
 
 
 class TaskRepositoryInterface(ABC):
     @abstractmethod
-    def create(self, list_id: UUID, data: TaskCreate) -> Task: ...
+    def create(self, list_id: UUID, data: TaskCreate) -> Optional[Task]: ...
 
     @abstractmethod
     def get_by_id(self, list_id: UUID, task_id: UUID) -> Task: ...
 
     @abstractmethod
-    def update(self, list_id: UUID, task_id: UUID, data: TaskUpdate) -> Task: ...
+    def update(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        data: TaskUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task: ...
 
     @abstractmethod
     def delete(self, list_id: UUID, task_id: UUID) -> bool: ...
@@ -30,3 +44,58 @@ class TaskRepositoryInterface(ABC):
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
     ) -> List[Task]: ...
+
+    @abstractmethod
+    def list_page_by_filters(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: Optional[TaskSort] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Page[Task], Page[TaskProjection]]: ...
+
+    # Las primeras per_list tareas de cada lista, en orden de creación.
+    @abstractmethod
+    def list_by_lists(
+        self,
+        list_ids: List[UUID],
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> List[Task]: ...
+
+    # None si la lista no existe.
+    @abstractmethod
+    def list_changes(
+        self, list_id: UUID, since: Optional[str], limit: int = DEFAULT_PAGE_SIZE
+    ) -> Optional[TaskChanges]: ...
+
+    @abstractmethod
+    def get_stats(self, list_id: UUID) -> TaskStats: ...
+
+    @abstractmethod
+    def create_many(
+        self, list_id: UUID, data: List[TaskCreate]
+    ) -> Optional[List[Task]]: ...
+
+    @abstractmethod
+    def update_many(
+        self, list_id: UUID, items: List[TaskBatchUpdateItem]
+    ) -> List[Task]: ...
+
+    @abstractmethod
+    def delete_many(self, list_id: UUID, task_ids: List[UUID]) -> List[UUID]: ...
+
+    # Ids de las tareas que han cambiado de estado.
+    @abstractmethod
+    def transition_status(
+        self, list_id: UUID, data: TaskStatusTransition
+    ) -> List[UUID]: ...
+
+    @abstractmethod
+    def stream_by_list(self, list_id: UUID, batch_size: int) -> Iterator[Task]: ...
+
+    @abstractmethod
+    def copy_many(self, list_id: UUID, data: List[TaskCreate]) -> Optional[int]: ...
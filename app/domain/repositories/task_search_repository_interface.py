@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+from app.domain.models.task import TaskSearchHit
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+
+
+class TaskSearchRepositoryInterface(ABC):
+    # Sin list_id la búsqueda abarca todas las listas.
+    @abstractmethod
+    def search(
+        self,
+        text: str,
+        list_id: Optional[UUID] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Page[TaskSearchHit]: ...
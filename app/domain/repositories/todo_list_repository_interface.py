@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate, ToDoList
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
 
 
 class ToDoListRepositoryInterface(ABC):
@@ -12,10 +14,23 @@ class ToDoListRepositoryInterface(ABC):
     def get_by_id(self, list_id: UUID) -> ToDoList: ...
 
     @abstractmethod
-    def update(self, list_id: UUID, data: ToDoListUpdate) -> ToDoList: ...
+    def update(
+        self,
+        list_id: UUID,
+        data: ToDoListUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> ToDoList: ...
+
+    @abstractmethod
+    def get_tasks_version(self, list_id: UUID) -> Optional[int]: ...
 
     @abstractmethod
     def delete(self, list_id: UUID) -> bool: ...
 
     @abstractmethod
     def list_all(self) -> List[ToDoList]: ...
+
+    @abstractmethod
+    def list_page(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> Page[ToDoList]: ...
@@ -0,0 +1,132 @@
+import os
+import zlib
+from typing import Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Por debajo de este tamaño (bytes) la cabecera y el tiempo de CPU no compensan.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+# Las calidades altas de brotli son para contenido estático; con 4 comprime
+# más que gzip -6 en un tiempo parecido.
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/csv")
+
+# Codificaciones que ofrece el servidor, en orden de preferencia. brotli es
+# opcional (pip install brotli); sin él solo se usa gzip.
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+# La codificación de ENCODINGS con mayor q en Accept-Encoding; a igual q
+# gana el orden de ENCODINGS. q=0 la excluye y "*" vale para las no citadas.
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip():
+            accepted[coding.strip().lower()] = _quality(params)
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class Compressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+            self._compress, self._finish = compressor.process, compressor.finish
+        else:
+            # wbits=31: formato gzip (cabecera y CRC) en lugar de zlib.
+            compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._compress, self._finish = compressor.compress, compressor.flush
+
+    def compress(self, data: bytes, last: bool) -> bytes:
+        data = self._compress(data)
+        return data + self._finish() if last else data
+
+
+def _compressible(message: Message, headers: Headers) -> bool:
+    if message["status"] in (204, 206, 304) or "content-encoding" in headers:
+        return False
+    media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    return media_type in COMPRESSIBLE_TYPES
+
+
+# Comprime con gzip o brotli según Accept-Encoding. La respuesta de un solo
+# bloque se comprime si supera minimum_size y lleva su nuevo Content-Length;
+# las respuestas en streaming (exportaciones) se comprimen bloque a bloque y
+# sin Content-Length. Los ETag no cambian: identifican la versión del recurso
+# y If-Match debe reconocerlos tanto si la respuesta iba comprimida como si no.
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        start: Optional[Message] = None
+        compressor: Optional[Compressor] = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                # Se retiene hasta ver el primer bloque del cuerpo.
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                headers = MutableHeaders(scope=start)
+                if _compressible(start, headers) and (
+                    more_body or len(body) >= self.minimum_size
+                ):
+                    compressor = Compressor(encoding)
+                    body = compressor.compress(body, last=not more_body)
+                    headers["Content-Encoding"] = encoding
+                    headers.add_vary_header("Accept-Encoding")
+                    del headers["Content-Length"]
+                    if not more_body:
+                        headers["Content-Length"] = str(len(body))
+                await send(start)
+                start = None
+            elif compressor is not None:
+                body = compressor.compress(body, last=not more_body)
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_compressed)
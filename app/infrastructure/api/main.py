@@ -1,8 +1,92 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.infrastructure.api.routers.todo_list_router import router as todo_list_router
 from app.infrastructure.api.routers.task_router import router as task_router
+from app.infrastructure.api.routers.internal_router import router as internal_router
+from app.infrastructure.api.routers.health_router import router as health_router
+from app.infrastructure.api.routers.search_router import router as search_router
+from app.infrastructure.api.routers.metrics_router import router as metrics_router
+from app.infrastructure.api.routers.changes_router import router as changes_router
+from app.infrastructure.api.routers.jobs_router import router as jobs_router
+from app.infrastructure.api.compression import (
+    COMPRESSION_ENABLED,
+    CompressionMiddleware,
+)
+from app.infrastructure.db.lifecycle import start_database
+from app.infrastructure.db.postgres import SessionLocal, engine, replica_engines
+from app.infrastructure.db.purge import PURGE_ENABLED, run_purger
+from app.infrastructure.jobs.worker import JOBS_ENABLED, run_job_workers
+from app.infrastructure.metrics.request_timing import TimingMiddleware
 
-app = FastAPI(title="To Do List API")
+# "sync" (psycopg2 + threadpool) o "async" (asyncpg + AsyncSession).
+DB_MODE = os.getenv("DB_MODE", "sync")
 
+
+# El arranque no espera a la base de datos: la conexión con reintentos, el
+# esquema opcional y el calentamiento del pool corren en segundo plano y
+# /readyz informa de cuándo han terminado. El purgador de listas borradas y
+# los workers de trabajos esperan a que la base esté lista.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async_engine = None
+    if DB_MODE == "async":
+        from app.infrastructure.db.postgres_async import async_engine
+    startup = asyncio.create_task(start_database(engine, async_engine))
+    background = []
+    if PURGE_ENABLED:
+        background.append(asyncio.create_task(run_purger(SessionLocal)))
+    if JOBS_ENABLED:
+        background.append(asyncio.create_task(run_job_workers(SessionLocal)))
+    yield
+    startup.cancel()
+    for task in background:
+        task.cancel()
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
+    for replica_engine in replica_engines:
+        replica_engine.dispose()
+
+
+# orjson codifica UUID, datetime y Enum de forma nativa y bastante más rápido
+# que json.dumps en el último paso de cada respuesta.
+app = FastAPI(
+    title="To Do List API", default_response_class=ORJSONResponse, lifespan=lifespan
+)
+
+# gzip/brotli según Accept-Encoding (ver compression.py). Se registra antes
+# que TimingMiddleware para quedar por dentro: la compresión cuenta en "total".
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# Server-Timing por petición y métricas para /metrics (ver metrics/).
+app.add_middleware(TimingMiddleware)
+
+# La búsqueda va antes que cualquier router de tareas: "/{task_id}" capturaría
+# "/search" y respondería 422 en lugar de dejarlo pasar.
+app.include_router(search_router)
+
+if DB_MODE == "async":
+    from app.infrastructure.api.routers.async_todo_list_router import (
+        router as async_todo_list_router,
+    )
+    from app.infrastructure.api.routers.async_task_router import (
+        router as async_task_router,
+    )
+
+    # Las rutas asíncronas se registran primero y tienen prioridad; las que solo
+    # existen en los routers síncronos siguen atendiéndose por ellos. Se ocultan
+    # del esquema porque su contrato es idéntico al de las síncronas.
+    app.include_router(async_todo_list_router, include_in_schema=False)
+    app.include_router(async_task_router, include_in_schema=False)
+
+app.include_router(health_router)
+app.include_router(metrics_router, include_in_schema=False)
 app.include_router(todo_list_router)
 app.include_router(task_router)
+app.include_router(changes_router)
+app.include_router(jobs_router)
+app.include_router(internal_router)
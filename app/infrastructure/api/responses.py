@@ -0,0 +1,20 @@
+import time
+from typing import Any, Dict, Optional
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from app.infrastructure.metrics.request_timing import record_serialization
+
+
+# Con response_model, FastAPI vuelca el modelo a dict, lo valida otra vez y lo
+# serializa en un segundo paso. En las respuestas grandes (páginas y lotes) el
+# modelo ya viene validado: se vuelca una sola vez a tipos de Python y orjson
+# codifica directamente UUID, datetime y Enum. response_model se mantiene en
+# los decoradores para documentar el esquema en OpenAPI. include limita los
+# campos volcados (ver projection.py).
+def model_response(
+    model: BaseModel, include: Optional[Dict[str, Any]] = None, **kwargs
+) -> ORJSONResponse:
+    start = time.perf_counter()
+    response = ORJSONResponse(model.model_dump(include=include), **kwargs)
+    record_serialization(time.perf_counter() - start)
+    return response
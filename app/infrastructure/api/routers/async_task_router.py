@@ -0,0 +1,151 @@
+from fastapi import APIRouter, status, Depends, Header, Query, Response
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.models.task import (
+    Task,
+    TaskCreate,
+    TaskUpdate,
+    TaskStatus,
+    TaskPriority,
+    TaskStats,
+)
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.responses import model_response
+from app.shared.utils.etag import (
+    etag_matches,
+    not_modified,
+    parse_if_match,
+    timestamp_etag,
+    version_etag,
+)
+from app.infrastructure.db.postgres_async import get_async_db
+from app.infrastructure.repositories.async_task_repository import AsyncTaskRepository
+from app.application.use_cases.async_task_use_case import AsyncTaskUseCase
+from app.infrastructure.repositories.async_todo_list_repository import (
+    AsyncToDoListRepository,
+)
+from app.infrastructure.metrics.request_timing import TimedRoute
+from app.shared.utils.projection import page_include, parse_task_fields
+from app.shared.utils.sorting import parse_task_sort
+
+router = APIRouter(
+    prefix="/todo-lists/{list_id}/tasks", tags=["Tasks"], route_class=TimedRoute
+)
+
+
+def get_async_task_use_case(db: AsyncSession = Depends(get_async_db)):
+    return AsyncTaskUseCase(AsyncTaskRepository(db), AsyncToDoListRepository(db))
+
+
+@router.post("/", response_model=Task, status_code=status.HTTP_201_CREATED)
+async def create_task(
+    list_id: UUID,
+    data: TaskCreate,
+    use_case: AsyncTaskUseCase = Depends(get_async_task_use_case),
+):
+    return await use_case.create_task(list_id, data)
+
+
+# Un sondeo sin cambios cuesta una lectura de todo_lists.tasks_version.
+# sort admite priority, created_at, updated_at y title separados por comas, con
+# "-" para orden descendente (p. ej. "-priority,created_at").
+@router.get("/", response_model=Page[Task])
+async def list_tasks(
+    list_id: UUID,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    sort: Optional[str] = None,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    use_case: AsyncTaskUseCase = Depends(get_async_task_use_case),
+):
+    sort_keys = parse_task_sort(sort)
+    field_names = parse_task_fields(fields)
+    version = await use_case.get_tasks_version(list_id)
+    etag = version_etag(version, status, priority, limit, after, sort_keys, field_names)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await use_case.list_tasks(
+        list_id, status, priority, limit, after, sort_keys, field_names
+    )
+    return model_response(
+        page, include=page_include(field_names), headers={"ETag": etag}
+    )
+
+
+@router.get("/stats", response_model=TaskStats)
+async def get_stats(
+    list_id: UUID, use_case: AsyncTaskUseCase = Depends(get_async_task_use_case)
+):
+    return await use_case.get_stats(list_id)
+
+
+@router.get("/completion-percentage", response_model=float)
+async def get_completion_percentage(
+    list_id: UUID, use_case: AsyncTaskUseCase = Depends(get_async_task_use_case)
+):
+    return await use_case.get_completion_percentage(list_id)
+
+
+# Este router se registra antes que el síncrono: con el convertidor uuid,
+# "/export", "/import" y demás rutas solo síncronas no encajan aquí y pasan
+# al router síncrono en lugar de responder 422.
+@router.get("/{task_id:uuid}", response_model=Task)
+async def get_task(
+    list_id: UUID,
+    task_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    use_case: AsyncTaskUseCase = Depends(get_async_task_use_case),
+):
+    task = await use_case.get_task(list_id, task_id)
+    etag = timestamp_etag(task.updated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return task
+
+
+@router.put("/{task_id:uuid}", response_model=Task)
+async def update_task(
+    list_id: UUID,
+    task_id: UUID,
+    data: TaskUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    use_case: AsyncTaskUseCase = Depends(get_async_task_use_case),
+):
+    updated = await use_case.update_task(
+        list_id, task_id, data, parse_if_match(if_match)
+    )
+    response.headers["ETag"] = timestamp_etag(updated.updated_at)
+    return updated
+
+
+@router.delete("/{task_id:uuid}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(
+    list_id: UUID,
+    task_id: UUID,
+    use_case: AsyncTaskUseCase = Depends(get_async_task_use_case),
+):
+    await use_case.delete_task(list_id, task_id)
+    return None
+
+
+@router.patch("/{task_id:uuid}/status", response_model=Task)
+async def change_status(
+    list_id: UUID,
+    task_id: UUID,
+    status: TaskStatus,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    use_case: AsyncTaskUseCase = Depends(get_async_task_use_case),
+):
+    updated = await use_case.change_status(
+        list_id, task_id, status, parse_if_match(if_match)
+    )
+    response.headers["ETag"] = timestamp_etag(updated.updated_at)
+    return updated
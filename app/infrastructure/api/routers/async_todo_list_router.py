@@ -0,0 +1,116 @@
+from fastapi import APIRouter, Depends, Header, Query, Response
+from uuid import UUID
+from typing import Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.db.postgres_async import get_async_db
+from app.domain.models.todo_list import (
+    ListInclude,
+    ToDoListCreate,
+    ToDoListUpdate,
+    ToDoList,
+    ToDoListWithTasks,
+)
+from app.domain.models.task import TaskStatus
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.responses import model_response
+from app.shared.utils.etag import (
+    etag_matches,
+    not_modified,
+    parse_if_match,
+    timestamp_etag,
+)
+from app.application.use_cases.async_todo_list_use_case import AsyncToDoListUseCase
+from app.infrastructure.repositories.async_todo_list_repository import (
+    AsyncToDoListRepository,
+)
+from app.infrastructure.repositories.async_task_repository import (
+    AsyncTaskRepository,
+)
+from app.infrastructure.metrics.request_timing import TimedRoute
+
+router = APIRouter(prefix="/lists", tags=["ToDo Lists"], route_class=TimedRoute)
+
+
+# Los contadores cambian sin tocar updated_at y forman parte de la representación.
+def _list_etag(todo_list: ToDoList) -> str:
+    return timestamp_etag(
+        todo_list.updated_at,
+        todo_list.total_tasks,
+        todo_list.pending_tasks,
+        todo_list.in_progress_tasks,
+        todo_list.completed_tasks,
+    )
+
+
+def get_async_use_case(db: AsyncSession = Depends(get_async_db)):
+    return AsyncToDoListUseCase(AsyncToDoListRepository(db), AsyncTaskRepository(db))
+
+
+@router.post("/", response_model=ToDoList)
+async def create_list(
+    data: ToDoListCreate, use_case: AsyncToDoListUseCase = Depends(get_async_use_case)
+):
+    return await use_case.create_list(data)
+
+
+# Con include=tasks no hay ETag: el de la lista no cambia al editar sus tareas.
+@router.get("/{list_id}", response_model=Union[ToDoListWithTasks, ToDoList])
+async def get_list(
+    list_id: UUID,
+    response: Response,
+    include: Optional[ListInclude] = None,
+    tasks_status: Optional[TaskStatus] = None,
+    tasks_limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    if_none_match: Optional[str] = Header(None),
+    use_case: AsyncToDoListUseCase = Depends(get_async_use_case),
+):
+    if include == ListInclude.TASKS:
+        return model_response(
+            await use_case.get_list_with_tasks(list_id, tasks_status, tasks_limit)
+        )
+    todo_list = await use_case.get_list(list_id)
+    etag = _list_etag(todo_list)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return todo_list
+
+
+@router.put("/{list_id}", response_model=ToDoList)
+async def update_list(
+    list_id: UUID,
+    data: ToDoListUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    use_case: AsyncToDoListUseCase = Depends(get_async_use_case),
+):
+    updated = await use_case.update_list(list_id, data, parse_if_match(if_match))
+    response.headers["ETag"] = _list_etag(updated)
+    return updated
+
+
+@router.delete("/{list_id}")
+async def delete_list(
+    list_id: UUID, use_case: AsyncToDoListUseCase = Depends(get_async_use_case)
+):
+    await use_case.delete_list(list_id)
+    return {"message": "List deleted successfully"}
+
+
+# include=tasks añade las primeras tasks_limit tareas de cada lista (opcionalmente
+# filtradas por estado) con una única consulta adicional para toda la página.
+@router.get("/", response_model=Union[Page[ToDoListWithTasks], Page[ToDoList]])
+async def list_all(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    include: Optional[ListInclude] = None,
+    tasks_status: Optional[TaskStatus] = None,
+    tasks_limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    use_case: AsyncToDoListUseCase = Depends(get_async_use_case),
+):
+    if include == ListInclude.TASKS:
+        page = await use_case.list_all_with_tasks(
+            limit, after, tasks_status, tasks_limit
+        )
+        return model_response(page)
+    return model_response(await use_case.list_all(limit, after))
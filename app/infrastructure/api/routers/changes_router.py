@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+from uuid import UUID
+from app.application.use_cases.task_use_case import TaskUseCase
+from app.domain.models.changes import TaskChanges
+from app.domain.models.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.responses import model_response
+from app.infrastructure.api.routers.task_router import get_task_use_case
+from app.infrastructure.metrics.request_timing import TimedRoute
+
+router = APIRouter(
+    prefix="/todo-lists/{list_id}", tags=["Sync"], route_class=TimedRoute
+)
+
+
+# Sin since devuelve todo desde el principio, paginado. El cliente repite la
+# llamada con next_token mientras has_more sea true y guarda el último token.
+@router.get("/changes", response_model=TaskChanges)
+def list_changes(
+    list_id: UUID,
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    use_case: TaskUseCase = Depends(get_task_use_case),
+):
+    return model_response(use_case.list_changes(list_id, since, limit))
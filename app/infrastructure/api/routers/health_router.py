@@ -0,0 +1,35 @@
+from fastapi import APIRouter, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from app.infrastructure.db.lifecycle import ping, state
+from app.infrastructure.db.pool import get_pool_stats
+from app.infrastructure.db.postgres import engine
+from app.infrastructure.metrics.request_timing import TimedRoute
+
+router = APIRouter(tags=["Health"], include_in_schema=False, route_class=TimedRoute)
+
+
+# Liveness: el proceso responde. No toca la base de datos, para que una caída de
+# esta no provoque reinicios en cadena de los workers.
+@router.get("/healthz")
+def healthz():
+    return {"status": "ok"}
+
+
+# Readiness: el arranque terminó (conexión, esquema opcional y pool caliente) y
+# la base de datos responde ahora mismo.
+@router.get("/readyz")
+async def readyz():
+    if not state.ready:
+        return ORJSONResponse(
+            {"status": "starting", **state.snapshot()},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    try:
+        await run_in_threadpool(ping, engine)
+    except Exception as exc:
+        return ORJSONResponse(
+            {"status": "unavailable", "error": f"{type(exc).__name__}: {exc}"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    return {"status": "ready", **state.snapshot(), "pools": get_pool_stats()}
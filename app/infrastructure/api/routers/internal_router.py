@@ -0,0 +1,60 @@
+import os
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query
+from sqlalchemy.orm import Session
+from app.domain.exceptions.custom_exceptions import (
+    InternalEndpointsDisabledException,
+    InvalidInternalTokenException,
+)
+from app.infrastructure.cache.backends import get_cache_stats
+from app.infrastructure.db.pool import get_pool_stats
+from app.infrastructure.db.postgres import get_db
+from app.infrastructure.db.purge import state as purge_state
+from app.infrastructure.repositories import queries
+from app.infrastructure.metrics.request_timing import TimedRoute
+
+# Secreto compartido de /internal. Sin él las rutas responden 404 como si no
+# existieran; con él exigen "Authorization: Bearer <token>".
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "")
+
+
+def require_internal_token(authorization: Optional[str] = Header(None)) -> None:
+    if not INTERNAL_API_TOKEN:
+        raise InternalEndpointsDisabledException()
+    expected = f"Bearer {INTERNAL_API_TOKEN}"
+    if not secrets.compare_digest((authorization or "").encode(), expected.encode()):
+        raise InvalidInternalTokenException()
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    include_in_schema=False,
+    route_class=TimedRoute,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+# Las estadísticas son por proceso: con varios workers de uvicorn cada uno
+# responde con su propio pool, identificado por el pid.
+@router.get("/pool")
+def pool_stats():
+    return {"pid": os.getpid(), "pools": get_pool_stats()}
+
+
+@router.get("/cache")
+def cache_stats():
+    return {"pid": os.getpid(), "cache": get_cache_stats()}
+
+
+# Progreso de la purga: las listas borradas que quedan (con las tareas que les
+# faltan por borrar) y los lotes que ha hecho el purgador de este proceso.
+@router.get("/purge")
+def purge_progress(limit: int = Query(50, ge=1, le=500), db: Session = Depends(get_db)):
+    pending = db.execute(queries.pending_purges(limit)).mappings()
+    return {
+        "pid": os.getpid(),
+        "purger": purge_state.snapshot(),
+        "pending": [dict(row) for row in pending],
+    }
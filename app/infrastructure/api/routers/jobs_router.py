@@ -0,0 +1,63 @@
+import os
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import FileResponse
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.application.use_cases.job_use_case import JobUseCase
+from app.domain.exceptions.custom_exceptions import JobNotFoundException
+from app.domain.models.job import Job, JobRequest
+from app.infrastructure.db.postgres import get_db
+from app.infrastructure.db.routing import READ_ONLY
+from app.infrastructure.jobs.handlers import export_path
+from app.infrastructure.metrics.request_timing import TimedRoute
+from app.infrastructure.repositories.cached_todo_list_repository import (
+    with_todo_list_cache,
+)
+from app.infrastructure.repositories.job_repository import JobRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.shared.utils.task_io import MEDIA_TYPES, FileFormat
+
+router = APIRouter(tags=["Jobs"], route_class=TimedRoute)
+
+
+# El estado de un trabajo cambia con cada lote y se consulta justo después de
+# encolarlo: se lee siempre del primario, no de una réplica que vaya detrás.
+def get_job_use_case(db: Session = Depends(get_db)):
+    db.info.pop(READ_ONLY, None)
+    return JobUseCase(JobRepository(db), with_todo_list_cache(ToDoListRepository(db)))
+
+
+# Responde 202 en cuanto el trabajo está en cola; Location apunta a su estado.
+@router.post(
+    "/todo-lists/{list_id}/jobs",
+    response_model=Job,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def create_job(
+    list_id: UUID,
+    data: JobRequest,
+    response: Response,
+    use_case: JobUseCase = Depends(get_job_use_case),
+):
+    job = use_case.enqueue(list_id, data)
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=Job)
+def get_job(job_id: UUID, use_case: JobUseCase = Depends(get_job_use_case)):
+    return use_case.get_job(job_id)
+
+
+@router.get("/jobs/{job_id}/download", response_class=FileResponse)
+def download_export(job_id: UUID, use_case: JobUseCase = Depends(get_job_use_case)):
+    job = use_case.get_finished_export(job_id)
+    path = export_path(job)
+    if not os.path.exists(path):
+        raise JobNotFoundException(str(job_id))
+    file_format = FileFormat(job.params["format"])
+    return FileResponse(
+        path,
+        media_type=MEDIA_TYPES[file_format],
+        filename=f"tasks-{job.todo_list_id}.{file_format.value}",
+    )
@@ -0,0 +1,42 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.infrastructure.db.pool import get_pool_stats
+from app.infrastructure.metrics.registry import registry
+from app.infrastructure.metrics.request_timing import TimedRoute
+
+# Versión del formato de texto de exposición de Prometheus.
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Estado de cada pool expuesto como gauges (métrica, clave en get_pool_stats).
+POOL_GAUGES = (
+    ("db_pool_size", "size", "Tamaño configurado del pool."),
+    ("db_pool_checked_out", "checked_out", "Conexiones prestadas."),
+    ("db_pool_checked_in", "checked_in", "Conexiones libres en el pool."),
+    ("db_pool_overflow", "overflow", "Conexiones abiertas por encima de size."),
+    (
+        "db_pool_timeouts_total",
+        "timeouts",
+        "Esperas por conexión que agotaron el tiempo.",
+    ),
+)
+
+router = APIRouter(tags=["Internal"], route_class=TimedRoute)
+
+
+def render_pool_gauges() -> str:
+    stats = get_pool_stats()
+    lines = []
+    for metric, key, help_text in POOL_GAUGES:
+        kind = "counter" if metric.endswith("_total") else "gauge"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, pool in stats.items():
+            lines.append(f'{metric}{{engine="{name}"}} {pool[key]}')
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    return PlainTextResponse(
+        registry.render() + render_pool_gauges(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
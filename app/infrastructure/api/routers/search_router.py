@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.domain.models.task import TaskSearchHit
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.domain.repositories.task_search_repository_interface import (
+    TaskSearchRepositoryInterface,
+)
+from app.application.use_cases.task_search_use_case import TaskSearchUseCase
+from app.infrastructure.api.responses import model_response
+from app.infrastructure.db.postgres import get_db
+from app.infrastructure.repositories.task_search_repository import (
+    TaskSearchRepository,
+)
+from app.infrastructure.repositories.memory_task_search_repository import (
+    InMemoryTaskSearchRepository,
+)
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.infrastructure.repositories.cached_todo_list_repository import (
+    with_todo_list_cache,
+)
+from app.infrastructure.metrics.request_timing import TimedRoute
+
+MAX_QUERY_LENGTH = 200
+
+router = APIRouter(tags=["Search"], route_class=TimedRoute)
+
+
+# Fuera de PostgreSQL (SQLite en pruebas y desarrollo) no hay tsvector ni
+# pg_trgm: se usa el índice invertido en memoria.
+def get_task_search_repository(
+    db: Session = Depends(get_db),
+) -> TaskSearchRepositoryInterface:
+    if db.bind.dialect.name == "postgresql":
+        return TaskSearchRepository(db)
+    return InMemoryTaskSearchRepository(db)
+
+
+def get_search_use_case(
+    search_repository: TaskSearchRepositoryInterface = Depends(
+        get_task_search_repository
+    ),
+    db: Session = Depends(get_db),
+):
+    return TaskSearchUseCase(
+        search_repository, with_todo_list_cache(ToDoListRepository(db))
+    )
+
+
+@router.get("/todo-lists/{list_id}/tasks/search", response_model=Page[TaskSearchHit])
+def search_list_tasks(
+    list_id: UUID,
+    q: str = Query(..., min_length=1, max_length=MAX_QUERY_LENGTH),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    use_case: TaskSearchUseCase = Depends(get_search_use_case),
+):
+    return model_response(use_case.search_tasks(q, list_id, limit, after))
+
+
+@router.get("/tasks/search", response_model=Page[TaskSearchHit])
+def search_tasks(
+    q: str = Query(..., min_length=1, max_length=MAX_QUERY_LENGTH),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    use_case: TaskSearchUseCase = Depends(get_search_use_case),
+):
+    return model_response(use_case.search_tasks(q, None, limit, after))
@@ -1,5 +1,9 @@
-from fastapi import APIRouter, status, Depends
-from typing import List, Optional
+from fastapi import APIRouter, status, Depends, Query, Body, Header, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from tempfile import SpooledTemporaryFile
+import io
+from typing import Any, Dict, Iterator, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from app.domain.models.task import (
@@ -8,21 +12,53 @@ from app.domain.models.task import (
     TaskUpdate,
     TaskStatus,
     TaskPriority,
+    TaskStats,
+    TaskBatchDelete,
+    TaskStatusTransition,
+    TaskStatusTransitionResult,
 )
-from app.infrastructure.db.postgres import get_db
+from app.domain.models.batch import BatchResult, ImportReport
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.responses import model_response
+from app.shared.utils.etag import (
+    etag_matches,
+    not_modified,
+    parse_if_match,
+    timestamp_etag,
+    version_etag,
+)
+from app.infrastructure.db.postgres import SessionLocal, get_db
+from app.infrastructure.db.routing import READ_ONLY
 from app.infrastructure.repositories.task_repository import TaskRepository
 from app.application.use_cases.task_use_case import TaskUseCase
 from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.infrastructure.repositories.cached_task_repository import with_task_cache
+from app.infrastructure.repositories.cached_todo_list_repository import (
+    with_todo_list_cache,
+)
+from app.shared.utils.task_io import (
+    EXPORT_BATCH_SIZE,
+    IMPORT_SPOOL_SIZE,
+    MEDIA_TYPES,
+    FileFormat,
+    parse_tasks,
+    serialize_tasks,
+)
+from app.infrastructure.metrics.request_timing import TimedRoute
+from app.shared.utils.projection import page_include, parse_task_fields
+from app.shared.utils.sorting import parse_task_sort
 
-router = APIRouter(prefix="/todo-lists/{list_id}/tasks", tags=["Tasks"])
+router = APIRouter(
+    prefix="/todo-lists/{list_id}/tasks", tags=["Tasks"], route_class=TimedRoute
+)
 
 
 def get_task_repository(db: Session = Depends(get_db)):
-    return TaskRepository(db)
+    return with_task_cache(TaskRepository(db))
 
 
 def get_todo_list_repository(db: Session = Depends(get_db)):
-    return ToDoListRepository(db)
+    return with_todo_list_cache(ToDoListRepository(db))
 
 
 def get_task_use_case(
@@ -39,21 +75,148 @@ def create_task(
     return use_case.create_task(list_id, data)
 
 
-@router.get("/", response_model=List[Task])
+# Un sondeo sin cambios cuesta una lectura de todo_lists.tasks_version.
+# sort admite priority, created_at, updated_at y title separados por comas, con
+# "-" para orden descendente (p. ej. "-priority,created_at").
+@router.get("/", response_model=Page[Task])
 def list_tasks(
     list_id: UUID,
     status: Optional[TaskStatus] = None,
     priority: Optional[TaskPriority] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    sort: Optional[str] = None,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    use_case: TaskUseCase = Depends(get_task_use_case),
+):
+    sort_keys = parse_task_sort(sort)
+    field_names = parse_task_fields(fields)
+    version = use_case.get_tasks_version(list_id)
+    etag = version_etag(version, status, priority, limit, after, sort_keys, field_names)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = use_case.list_tasks(
+        list_id, status, priority, limit, after, sort_keys, field_names
+    )
+    return model_response(
+        page, include=page_include(field_names), headers={"ETag": etag}
+    )
+
+
+@router.post(":batch", response_model=BatchResult[Task])
+def create_tasks(
+    list_id: UUID,
+    items: List[Dict[str, Any]] = Body(...),
+    use_case: TaskUseCase = Depends(get_task_use_case),
+):
+    return model_response(use_case.create_tasks(list_id, items))
+
+
+@router.patch(":batch", response_model=BatchResult[Task])
+def update_tasks(
+    list_id: UUID,
+    items: List[Dict[str, Any]] = Body(...),
     use_case: TaskUseCase = Depends(get_task_use_case),
 ):
-    return use_case.list_tasks(list_id, status, priority)
+    return model_response(use_case.update_tasks(list_id, items))
+
+
+@router.delete(":batch", response_model=BatchResult[UUID])
+def delete_tasks(
+    list_id: UUID,
+    data: TaskBatchDelete,
+    use_case: TaskUseCase = Depends(get_task_use_case),
+):
+    return model_response(use_case.delete_tasks(list_id, data.ids))
+
+
+# Cambia el estado de todas las tareas que cumplen source (estados,
+# prioridades, ids) con un único UPDATE, en lugar de una petición por tarea.
+@router.post("/status:transition", response_model=TaskStatusTransitionResult)
+def transition_status(
+    list_id: UUID,
+    data: TaskStatusTransition,
+    use_case: TaskUseCase = Depends(get_task_use_case),
+):
+    return model_response(use_case.transition_status(list_id, data))
+
+
+# Las rutas estáticas se declaran antes de "/{task_id}" para que no se
+# interpreten como un identificador de tarea.
+@router.get("/stats", response_model=TaskStats)
+def get_stats(list_id: UUID, use_case: TaskUseCase = Depends(get_task_use_case)):
+    return use_case.get_stats(list_id)
+
+
+@router.get("/completion-percentage", response_model=float)
+def get_completion_percentage(
+    list_id: UUID, use_case: TaskUseCase = Depends(get_task_use_case)
+):
+    return use_case.get_completion_percentage(list_id)
+
+
+# FastAPI cierra las dependencias con yield antes de enviar el cuerpo de un
+# StreamingResponse, así que la exportación abre su propia sesión y la cierra
+# al terminar (o al cortarse) la iteración.
+def _stream_and_close(db: Session, chunks: Iterator[str]) -> Iterator[str]:
+    try:
+        yield from chunks
+    finally:
+        db.close()
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_tasks(list_id: UUID, format: FileFormat = FileFormat.NDJSON):
+    db = SessionLocal(info={READ_ONLY: True})
+    try:
+        use_case = TaskUseCase(TaskRepository(db), ToDoListRepository(db))
+        tasks = use_case.export_tasks(list_id, EXPORT_BATCH_SIZE)
+    except Exception:
+        db.close()
+        raise
+    return StreamingResponse(
+        _stream_and_close(db, serialize_tasks(tasks, format)),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks-{list_id}.{format.value}"'
+        },
+    )
+
+
+# El cuerpo se vuelca a un fichero temporal (en memoria hasta IMPORT_SPOOL_SIZE)
+# y la carga, síncrona, se ejecuta en el pool de hilos leyéndolo línea a línea.
+@router.post("/import", response_model=ImportReport)
+async def import_tasks(
+    list_id: UUID,
+    request: Request,
+    format: FileFormat = FileFormat.NDJSON,
+    use_case: TaskUseCase = Depends(get_task_use_case),
+):
+    with SpooledTemporaryFile(max_size=IMPORT_SPOOL_SIZE) as body:
+        async for chunk in request.stream():
+            body.write(chunk)
+        body.seek(0)
+        lines = io.TextIOWrapper(body, encoding="utf-8", newline="")
+        return await run_in_threadpool(
+            use_case.import_tasks, list_id, parse_tasks(lines, format)
+        )
 
 
 @router.get("/{task_id}", response_model=Task)
 def get_task(
-    list_id: UUID, task_id: UUID, use_case: TaskUseCase = Depends(get_task_use_case)
+    list_id: UUID,
+    task_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    use_case: TaskUseCase = Depends(get_task_use_case),
 ):
-    return use_case.get_task(list_id, task_id)
+    task = use_case.get_task(list_id, task_id)
+    etag = timestamp_etag(task.updated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return task
 
 
 @router.put("/{task_id}", response_model=Task)
@@ -61,9 +224,13 @@ def update_task(
     list_id: UUID,
     task_id: UUID,
     data: TaskUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     use_case: TaskUseCase = Depends(get_task_use_case),
 ):
-    return use_case.update_task(list_id, task_id, data)
+    updated = use_case.update_task(list_id, task_id, data, parse_if_match(if_match))
+    response.headers["ETag"] = timestamp_etag(updated.updated_at)
+    return updated
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -79,13 +246,10 @@ def change_status(
     list_id: UUID,
     task_id: UUID,
     status: TaskStatus,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     use_case: TaskUseCase = Depends(get_task_use_case),
 ):
-    return use_case.change_status(list_id, task_id, status)
-
-
-@router.get("/completion-percentage", response_model=float)
-def get_completion_percentage(
-    list_id: UUID, use_case: TaskUseCase = Depends(get_task_use_case)
-):
-    return use_case.get_completion_percentage(list_id)
+    updated = use_case.change_status(list_id, task_id, status, parse_if_match(if_match))
+    response.headers["ETag"] = timestamp_etag(updated.updated_at)
+    return updated
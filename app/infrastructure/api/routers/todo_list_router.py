@@ -1,17 +1,50 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
 from uuid import UUID
-from typing import List
+from typing import Optional, Union
 from sqlalchemy.orm import Session
 from app.infrastructure.db.postgres import get_db
-from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate, ToDoList
+from app.domain.models.todo_list import (
+    ListInclude,
+    ToDoListCreate,
+    ToDoListUpdate,
+    ToDoList,
+    ToDoListWithTasks,
+)
+from app.domain.models.task import TaskStatus
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.responses import model_response
+from app.shared.utils.etag import (
+    etag_matches,
+    not_modified,
+    parse_if_match,
+    timestamp_etag,
+)
 from app.application.use_cases.todo_list_use_case import ToDoListUseCase
 from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.cached_todo_list_repository import (
+    with_todo_list_cache,
+)
+from app.infrastructure.metrics.request_timing import TimedRoute
 
-router = APIRouter(prefix="/lists", tags=["ToDo Lists"])
+router = APIRouter(prefix="/lists", tags=["ToDo Lists"], route_class=TimedRoute)
+
+
+# Los contadores cambian sin tocar updated_at y forman parte de la representación.
+def _list_etag(todo_list: ToDoList) -> str:
+    return timestamp_etag(
+        todo_list.updated_at,
+        todo_list.total_tasks,
+        todo_list.pending_tasks,
+        todo_list.in_progress_tasks,
+        todo_list.completed_tasks,
+    )
 
 
 def get_use_case(db: Session = Depends(get_db)):
-    return ToDoListUseCase(ToDoListRepository(db))
+    return ToDoListUseCase(
+        with_todo_list_cache(ToDoListRepository(db)), TaskRepository(db)
+    )
 
 
 @router.post("/", response_model=ToDoList)
@@ -21,18 +54,40 @@ def create_list(
     return use_case.create_list(data)
 
 
-@router.get("/{list_id}", response_model=ToDoList)
-def get_list(list_id: UUID, use_case: ToDoListUseCase = Depends(get_use_case)):
-    return use_case.get_list(list_id)
+# Con include=tasks no hay ETag: el de la lista no cambia al editar sus tareas.
+@router.get("/{list_id}", response_model=Union[ToDoListWithTasks, ToDoList])
+def get_list(
+    list_id: UUID,
+    response: Response,
+    include: Optional[ListInclude] = None,
+    tasks_status: Optional[TaskStatus] = None,
+    tasks_limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    if_none_match: Optional[str] = Header(None),
+    use_case: ToDoListUseCase = Depends(get_use_case),
+):
+    if include == ListInclude.TASKS:
+        return model_response(
+            use_case.get_list_with_tasks(list_id, tasks_status, tasks_limit)
+        )
+    todo_list = use_case.get_list(list_id)
+    etag = _list_etag(todo_list)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return todo_list
 
 
 @router.put("/{list_id}", response_model=ToDoList)
 def update_list(
     list_id: UUID,
     data: ToDoListUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     use_case: ToDoListUseCase = Depends(get_use_case),
 ):
-    return use_case.update_list(list_id, data)
+    updated = use_case.update_list(list_id, data, parse_if_match(if_match))
+    response.headers["ETag"] = _list_etag(updated)
+    return updated
 
 
 @router.delete("/{list_id}")
@@ -41,6 +96,18 @@ def delete_list(list_id: UUID, use_case: ToDoListUseCase = Depends(get_use_case)
     return {"message": "List deleted successfully"}
 
 
-@router.get("/", response_model=List[ToDoList])
-def list_all(use_case: ToDoListUseCase = Depends(get_use_case)):
-    return use_case.list_all()
+# include=tasks añade las primeras tasks_limit tareas de cada lista (opcionalmente
+# filtradas por estado) con una única consulta adicional para toda la página.
+@router.get("/", response_model=Union[Page[ToDoListWithTasks], Page[ToDoList]])
+def list_all(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    include: Optional[ListInclude] = None,
+    tasks_status: Optional[TaskStatus] = None,
+    tasks_limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    use_case: ToDoListUseCase = Depends(get_use_case),
+):
+    if include == ListInclude.TASKS:
+        page = use_case.list_all_with_tasks(limit, after, tasks_status, tasks_limit)
+        return model_response(page)
+    return model_response(use_case.list_all(limit, after))
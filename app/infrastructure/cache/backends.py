@@ -0,0 +1,175 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+# Configuración de la caché de lecturas de los repositorios; desactivada por
+# defecto. "memory" es por proceso: con varios workers, las invalidaciones de
+# uno no llegan al resto hasta que vence el TTL, así que solo sirve con un
+# único worker; con varios hay que usar "redis". Con DB_MODE=async la caché se
+# desactiva: las escrituras pasan por los repositorios asíncronos, que no la
+# invalidan.
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "none").lower()
+CACHE_ENABLED = CACHE_BACKEND != "none" and os.getenv("DB_MODE", "sync") != "async"
+CACHE_TTL = float(os.getenv("CACHE_TTL", "30"))
+CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "10000"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_PREFIX = "todo:"
+
+
+class CacheBackend(ABC):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def stats(self) -> Dict:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "backend": type(self).__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]: ...
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None: ...
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None: ...
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None: ...
+
+
+# LRU acotado a max_size entradas, cada una con su instante de expiración.
+class MemoryCache(CacheBackend):
+    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: float = CACHE_TTL):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        with self._lock:
+            stats.update(size=len(self._entries), evictions=self.evictions)
+        return stats
+
+
+# Acepta cualquier cliente compatible con redis-py (get, set con ex, delete,
+# scan_iter); el TTL lo aplica el propio servidor.
+class RedisCache(CacheBackend):
+    def __init__(self, client, ttl: float = CACHE_TTL, prefix: str = REDIS_PREFIX):
+        super().__init__()
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str = REDIS_URL, **kwargs) -> "RedisCache":
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requiere el paquete redis (pip install redis)"
+            ) from exc
+        return cls(redis.Redis.from_url(url, decode_responses=True), **kwargs)
+
+    def _get(self, key: str) -> Optional[str]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: str) -> None:
+        self.client.set(self.prefix + key, value, ex=max(int(self.ttl), 1))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.prefix}{prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+_cache: Optional[CacheBackend] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[CacheBackend]:
+    global _cache
+    if not CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = (
+                    RedisCache.from_url() if CACHE_BACKEND == "redis" else MemoryCache()
+                )
+    return _cache
+
+
+def get_cache_stats() -> Optional[Dict]:
+    return _cache.stats() if _cache else None
+
+
+# Claves compartidas por los repositorios con caché. Las de las tareas llevan el
+# id de la lista delante para poder invalidarlas todas al borrarla.
+def todo_list_key(list_id) -> str:
+    return f"todo_list:{list_id}"
+
+
+def tasks_prefix(list_id) -> str:
+    return f"task:{list_id}:"
+
+
+def task_key(list_id, task_id) -> str:
+    return f"{tasks_prefix(list_id)}{task_id}"
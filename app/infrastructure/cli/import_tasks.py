@@ -0,0 +1,57 @@
+import argparse
+import sys
+import time
+from uuid import UUID
+from app.application.use_cases.task_use_case import TaskUseCase
+from app.infrastructure.db.postgres import SessionLocal
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.shared.utils.task_io import FileFormat, parse_tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Importa tareas a una lista desde un fichero NDJSON o CSV usando COPY. "
+            "Las filas inválidas se omiten y se informan al final."
+        )
+    )
+    parser.add_argument("list_id", type=UUID)
+    parser.add_argument("path", help="Fichero a importar, o - para leer de stdin")
+    parser.add_argument(
+        "--format",
+        type=FileFormat,
+        choices=list(FileFormat),
+        help="Por defecto se deduce de la extensión del fichero",
+    )
+    args = parser.parse_args()
+    file_format = args.format
+    if file_format is None:
+        file_format = (
+            FileFormat.CSV if args.path.endswith(".csv") else FileFormat.NDJSON
+        )
+
+    source = (
+        sys.stdin if args.path == "-" else open(args.path, encoding="utf-8", newline="")
+    )
+    db = SessionLocal()
+    try:
+        use_case = TaskUseCase(TaskRepository(db), ToDoListRepository(db))
+        started = time.perf_counter()
+        report = use_case.import_tasks(args.list_id, parse_tasks(source, file_format))
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+        source.close()
+
+    print(report.model_dump_json(indent=2))
+    print(
+        f"{report.imported} importadas, {report.rejected} rechazadas "
+        f"en {elapsed:.1f} s ({report.imported / max(elapsed, 1e-9):.0f} filas/s)",
+        file=sys.stderr,
+    )
+    return 1 if report.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
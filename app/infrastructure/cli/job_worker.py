@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+import sys
+from app.infrastructure.db.lifecycle import start_database, state
+from app.infrastructure.db.postgres import SessionLocal, engine
+from app.infrastructure.jobs.worker import (
+    JOB_BATCH_SIZE,
+    JOB_POLL_INTERVAL,
+    JOB_WORKERS,
+    run_job_workers,
+    work_once,
+)
+
+
+async def serve(args) -> int:
+    await start_database(engine, warm_connections=args.workers)
+    if not state.ready:
+        return 1
+    await run_job_workers(
+        SessionLocal, args.workers, args.poll_interval, args.batch_size
+    )
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Ejecuta los trabajos en segundo plano fuera de la API (arrancar la "
+            "API con JOBS_ENABLED=false para que solo trabajen estos procesos)."
+        )
+    )
+    parser.add_argument("--workers", type=int, default=JOB_WORKERS)
+    parser.add_argument("--batch-size", type=int, default=JOB_BATCH_SIZE)
+    parser.add_argument("--poll-interval", type=float, default=JOB_POLL_INTERVAL)
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Procesa los trabajos en cola y termina en lugar de seguir esperando",
+    )
+    args = parser.parse_args()
+
+    if args.drain:
+        processed = 0
+        while work_once(SessionLocal, args.batch_size):
+            processed += 1
+        print(f"{processed} trabajos procesados", file=sys.stderr)
+        return 0
+    try:
+        return asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
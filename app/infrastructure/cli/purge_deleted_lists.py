@@ -0,0 +1,41 @@
+import argparse
+import sys
+import time
+from app.infrastructure.db.postgres import SessionLocal
+from app.infrastructure.db.purge import PURGE_BATCH_SIZE, PurgeState, purge_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Borra por lotes las tareas de las listas eliminadas y después las "
+            "propias listas (lo mismo que el purgador en segundo plano de la API)."
+        )
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=PURGE_BATCH_SIZE,
+        help="Filas por transacción",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    progress = PurgeState()
+    started = time.perf_counter()
+    try:
+        while purge_batch(db, args.batch_size, progress):
+            pass
+    finally:
+        db.close()
+
+    print(
+        f"{progress.lists_purged} listas y {progress.tasks_purged} tareas purgadas "
+        f"en {progress.batches} lotes, {time.perf_counter() - started:.1f} s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import argparse
+import sys
+import time
+from app.infrastructure.db.postgres import SessionLocal
+from app.infrastructure.repositories import queries
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Recalcula los contadores de tareas de todo_lists a partir de la tabla "
+            "tasks y corrige los que no cuadran."
+        )
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Listas por transacción (cada lote bloquea solo sus listas)",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    checked, repaired, after = 0, 0, None
+    started = time.perf_counter()
+    try:
+        while True:
+            ids = db.execute(queries.todo_list_ids(after, args.batch_size))
+            ids = list(ids.scalars())
+            if not ids:
+                break
+            db.execute(queries.lock_todo_lists(ids))
+            repaired += len(db.execute(queries.repair_task_counts(ids)).all())
+            db.commit()
+            checked, after = checked + len(ids), ids[-1]
+    finally:
+        db.close()
+
+    print(
+        f"{checked} listas revisadas, {repaired} corregidas "
+        f"en {time.perf_counter() - started:.1f} s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from app.infrastructure.db.base import Base
+from app.infrastructure.db import models  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+# Reintentos de la conexión inicial con espera exponencial (0.5, 1, 2, 4, 8, 8...
+# segundos). Con 0 se reintenta indefinidamente: el proceso sigue vivo para
+# /healthz y pasa a estar listo en cuanto la base de datos responde.
+DB_CONNECT_ATTEMPTS = int(os.getenv("DB_CONNECT_ATTEMPTS", "0"))
+DB_CONNECT_BASE_DELAY = float(os.getenv("DB_CONNECT_BASE_DELAY", "0.5"))
+DB_CONNECT_MAX_DELAY = float(os.getenv("DB_CONNECT_MAX_DELAY", "8"))
+# Conexiones que se abren al arrancar para no pagar el handshake en las
+# primeras peticiones; por defecto, el tamaño del pool.
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", os.getenv("DB_POOL_SIZE", "5")))
+# El esquema lo gestionan las migraciones de Alembic; create_all queda como
+# opción para desarrollo.
+DB_CREATE_SCHEMA = os.getenv("DB_CREATE_SCHEMA", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+
+class DatabaseState:
+    def __init__(self):
+        self.ready = False
+        self.attempts = 0
+        self.error: Optional[str] = None
+        self.started_at = time.perf_counter()
+        self.ready_after_ms: Optional[float] = None
+
+    def snapshot(self) -> Dict:
+        return {
+            "ready": self.ready,
+            "attempts": self.attempts,
+            "error": self.error,
+            "ready_after_ms": self.ready_after_ms,
+        }
+
+
+state = DatabaseState()
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float = DB_CONNECT_BASE_DELAY,
+    max_delay: float = DB_CONNECT_MAX_DELAY,
+) -> float:
+    return min(base_delay * 2 ** (attempt - 1), max_delay)
+
+
+def ping(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def warm_pool(engine: Engine, connections: int = DB_POOL_WARM) -> None:
+    opened = [engine.connect() for _ in range(connections)]
+    for connection in opened:
+        connection.close()
+
+
+# Los intentos se ejecutan en un hilo para no bloquear el event loop: mientras
+# tanto la aplicación ya atiende /healthz y /readyz responde 503.
+async def connect_with_backoff(
+    check: Callable[[], None],
+    attempts: int = DB_CONNECT_ATTEMPTS,
+    base_delay: float = DB_CONNECT_BASE_DELAY,
+    db_state: DatabaseState = state,
+) -> None:
+    while True:
+        db_state.attempts += 1
+        try:
+            await asyncio.to_thread(check)
+            db_state.error = None
+            return
+        except Exception as exc:
+            db_state.error = f"{type(exc).__name__}: {exc}"
+            if attempts and db_state.attempts >= attempts:
+                raise
+            delay = backoff_delay(db_state.attempts, base_delay)
+            logger.warning(
+                "Database not ready (attempt %s), retrying in %.1f s: %s",
+                db_state.attempts,
+                delay,
+                db_state.error,
+            )
+            await asyncio.sleep(delay)
+
+
+async def warm_async_pool(async_engine, connections: int = DB_POOL_WARM) -> None:
+    async def open_connection():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(open_connection() for _ in range(connections)))
+
+
+async def start_database(
+    engine: Engine,
+    async_engine=None,
+    create_schema: bool = DB_CREATE_SCHEMA,
+    warm_connections: int = DB_POOL_WARM,
+    base_delay: float = DB_CONNECT_BASE_DELAY,
+    db_state: DatabaseState = state,
+) -> None:
+    try:
+        await connect_with_backoff(
+            lambda: ping(engine), base_delay=base_delay, db_state=db_state
+        )
+        if create_schema:
+            await asyncio.to_thread(Base.metadata.create_all, engine)
+        await asyncio.to_thread(warm_pool, engine, warm_connections)
+        if async_engine is not None:
+            await warm_async_pool(async_engine, warm_connections)
+    except Exception:
+        logger.exception("Database startup failed")
+        return
+    db_state.ready = True
+    db_state.ready_after_ms = round((time.perf_counter() - db_state.started_at) * 1000)
+    logger.info("Database ready after %s ms", db_state.ready_after_ms)
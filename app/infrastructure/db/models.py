@@ -1,38 +1,151 @@
-from sqlalchemy import Column, String, Text, Enum, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Enum, DateTime, ForeignKey, Index
+from sqlalchemy import BigInteger, Computed, Integer, JSON, SmallInteger, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 from app.infrastructure.db.base import Base
-from app.domain.models.task import TaskStatus, TaskPriority
+from app.infrastructure.db.triggers import (
+    register_task_triggers,
+    register_todo_list_triggers,
+)
+from app.infrastructure.db.search_index import register_search_index
+from app.domain.models.job import JobKind, JobStatus
+from app.domain.models.task import PRIORITY_RANK, TaskStatus, TaskPriority
 from app.shared.utils.time import get_utc_now
 
+# La columna Enum guarda el nombre de cada prioridad.
+PRIORITY_RANK_SQL = (
+    "CASE priority "
+    + " ".join(f"WHEN '{p.name}' THEN {rank}" for p, rank in PRIORITY_RANK.items())
+    + " END"
+)
+
 
 class ToDoListORM(Base):
     __tablename__ = "todo_lists"
+    __table_args__ = (
+        Index("ix_todo_lists_created_at_id", "created_at", "id"),
+        # Solo las listas pendientes de purgar (ver db/purge.py).
+        Index(
+            "ix_todo_lists_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=get_utc_now)
     updated_at = Column(DateTime, default=get_utc_now, onupdate=get_utc_now)
+    # Versión de la colección de tareas, mantenida por triggers (ver triggers.py).
+    tasks_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    # Contadores desnormalizados de tareas, mantenidos por triggers.
+    total_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    pending_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    in_progress_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_tasks = Column(Integer, nullable=False, default=0, server_default="0")
+    # Posición en el feed de cambios (secuencia global), sellada por triggers.
+    change_version = Column(BigInteger, nullable=False, server_default="0")
+    # Borrado lógico: la lista deja de verse al instante y el purgador borra
+    # después sus tareas por lotes y la propia fila.
+    deleted_at = Column(DateTime, nullable=True)
 
     tasks = relationship(
-        "TaskORM", back_populates="todo_list", cascade="all, delete-orphan"
+        "TaskORM",
+        back_populates="todo_list",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 class TaskORM(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_list_status_priority", "todo_list_id", "status", "priority"),
+        Index("ix_tasks_list_created_at_id", "todo_list_id", "created_at", "id"),
+        # Uno por cada orden admitido en el listado (ver queries.sorted_task_page);
+        # PostgreSQL los recorre hacia atrás para los órdenes descendentes.
+        Index("ix_tasks_list_priority_rank_id", "todo_list_id", "priority_rank", "id"),
+        Index(
+            "ix_tasks_list_status_priority_rank_id",
+            "todo_list_id",
+            "status",
+            "priority_rank",
+            "id",
+        ),
+        Index("ix_tasks_list_updated_at_id", "todo_list_id", "updated_at", "id"),
+        Index("ix_tasks_list_title_id", "todo_list_id", "title", "id"),
+        Index(
+            "ix_tasks_list_change_version_id", "todo_list_id", "change_version", "id"
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(Enum(TaskStatus), default=TaskStatus.PENDING)
     priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM)
+    # Ordinal de la prioridad (LOW < MEDIUM < HIGH), generado por la base.
+    priority_rank = Column(SmallInteger, Computed(PRIORITY_RANK_SQL, persisted=True))
     created_at = Column(DateTime, default=get_utc_now)
     updated_at = Column(DateTime, default=get_utc_now, onupdate=get_utc_now)
+    change_version = Column(BigInteger, nullable=False, server_default="0")
 
     todo_list_id = Column(
-        UUID(as_uuid=True), ForeignKey("todo_lists.id"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("todo_lists.id", ondelete="CASCADE"),
+        nullable=False,
     )
     todo_list = relationship("ToDoListORM", back_populates="tasks")
+
+
+# Tareas borradas, para que el feed de cambios pueda anunciar los borrados.
+# Sin clave foránea: las lápidas se consultan por lista y la propia lista puede
+# haber desaparecido.
+class TaskTombstoneORM(Base):
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index(
+            "ix_task_tombstones_list_change_version",
+            "todo_list_id",
+            "change_version",
+            "task_id",
+        ),
+    )
+
+    task_id = Column(UUID(as_uuid=True), primary_key=True)
+    todo_list_id = Column(UUID(as_uuid=True), nullable=False)
+    change_version = Column(BigInteger, nullable=False)
+    deleted_at = Column(DateTime, nullable=False)
+
+
+# Cola de trabajos en segundo plano (ver infrastructure/jobs). Sin clave
+# foránea: el trabajo y su resultado sobreviven a la lista.
+class JobORM(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_status_created_at", "status", "created_at"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(Enum(JobKind), nullable=False)
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.QUEUED)
+    todo_list_id = Column(UUID(as_uuid=True), nullable=False)
+    params = Column(JSON, nullable=False)
+    processed = Column(Integer, nullable=False, default=0, server_default="0")
+    total = Column(Integer, nullable=True)
+    # Estado interno del trabajo (cursor, desplazamiento en el fichero...),
+    # guardado en la misma transacción que cada lote.
+    checkpoint = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime, default=get_utc_now)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+
+register_todo_list_triggers(ToDoListORM.__table__)
+register_task_triggers(TaskORM.__table__)
+register_search_index(TaskORM.__table__)
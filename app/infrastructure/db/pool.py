@@ -0,0 +1,122 @@
+import os
+import threading
+import time
+from typing import Dict
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+# Configuración del pool de conexiones, común a los motores síncrono y asíncrono.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+# Límites superiores (en milisegundos) del histograma de espera por conexión.
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def get_pool_options() -> Dict:
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_ms_sum = 0.0
+
+    def observe_wait(self, wait_ms: float, timed_out: bool = False) -> None:
+        index = len(WAIT_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.buckets[index] += 1
+            self.wait_ms_sum += wait_ms
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            buckets = list(self.buckets)
+            snapshot = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_sum": round(self.wait_ms_sum, 3),
+            }
+        cumulative, histogram = 0, {}
+        for bound, count in zip(list(WAIT_BUCKETS_MS) + ["+Inf"], buckets):
+            cumulative += count
+            histogram[str(bound)] = cumulative
+        snapshot["wait_ms_histogram"] = histogram
+        return snapshot
+
+
+class _TimedPoolMixin:
+    # Mide el tiempo que tarda cada checkout en obtener una conexión, incluida
+    # la espera cuando el pool está agotado.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe_wait(
+                (time.perf_counter() - start) * 1000, timed_out=True
+            )
+            raise
+        self.metrics.observe_wait((time.perf_counter() - start) * 1000)
+        return connection
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+_engines: Dict[str, Engine] = {}
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    _engines[name] = engine
+
+
+def get_pool_stats() -> Dict:
+    stats = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        stats[name] = {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            # El del propio pool: réplicas y motor asíncrono pueden diferir.
+            "max_overflow": pool._max_overflow,
+            **pool.metrics.snapshot(),
+        }
+    return stats
@@ -1,57 +1,75 @@
-import time
 import os
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import OperationalError
-from app.infrastructure.db.base import Base
-from app.infrastructure.db import models
+from app.infrastructure.db.pool import TimedQueuePool, get_pool_options, register_engine
+from app.infrastructure.db.routing import (
+    READ_ONLY,
+    SAFE_METHODS,
+    ReplicaSelector,
+    RoutingSession,
+)
+from app.infrastructure.metrics.sql import instrument_engine
 
 
 # Lee la URL de la base de datos desde una variable de entorno.
 # Si no está definida, usa la URL de desarrollo por defecto.
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://user:password@db:5432/todo_db")
+# Réplicas de solo lectura opcionales, separadas por comas.
+DATABASE_REPLICA_URLS = [
+    url.strip()
+    for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+    if url.strip()
+]
 
-# Variables para la lógica de reintento
-MAX_RETRIES = 5
-RETRY_DELAY = 5  # Segundos
+# Segundos máximos de cada intento de conexión, para que un servidor que no
+# responde no bloquee indefinidamente la comprobación de arranque o /readyz.
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
 
 
-# Función para intentar crear el motor de la base de datos con reintentos
-def create_database_engine():
-    retries = 0
-    while retries < MAX_RETRIES:
-        try:
-            print(
-                f"Attempting to connect to database... (Attempt {retries + 1}/{MAX_RETRIES})"
-            )
-            engine = create_engine(DATABASE_URL)
+def get_connect_args(url: str) -> dict:
+    if make_url(url).get_backend_name() == "postgresql":
+        return {"connect_timeout": DB_CONNECT_TIMEOUT}
+    return {}
 
-            # Intenta una conexión de prueba para verificar si la base de datos está lista
-            with engine.connect():
-                print("Database connection successful!")
-                return engine
-        except OperationalError:
-            print(
-                f"Database is not ready. Waiting {RETRY_DELAY} seconds before retrying..."
-            )
-            retries += 1
-            time.sleep(RETRY_DELAY)
 
-    # Si todos los reintentos fallan, lanza una excepción
-    raise ConnectionError("Failed to connect to the database after multiple retries.")
+# create_engine no abre ninguna conexión: importar este módulo no depende de que
+# la base de datos esté disponible. La espera, el calentamiento del pool y la
+# creación opcional del esquema se hacen en el lifespan de la aplicación
+# (ver lifecycle.py).
+def create_sync_engine(url: str):
+    return create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        connect_args=get_connect_args(url),
+        **get_pool_options(),
+    )
 
 
-# Crea el motor de la base de datos usando la función con reintentos
-engine = create_database_engine()
+engine = create_sync_engine(DATABASE_URL)
+register_engine("sync", engine)
+instrument_engine(engine)
 
-Base.metadata.create_all(bind=engine)
+# Cada réplica tiene su propio pool (y sus métricas en /internal/pool).
+replica_engines = [create_sync_engine(url) for url in DATABASE_REPLICA_URLS]
+for i, replica_engine in enumerate(replica_engines):
+    register_engine(f"replica{i}", replica_engine)
+    instrument_engine(replica_engine)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replicas=ReplicaSelector(replica_engines),
+)
 
 
-# Función para obtener una sesión de la base de datos
-def get_db():
-    db = SessionLocal()
+# Función para obtener una sesión de la base de datos. Las peticiones GET y
+# HEAD pueden leer de una réplica (ver routing.py); el resto usan el primario.
+def get_db(request: Request):
+    db = SessionLocal(info={READ_ONLY: request.method in SAFE_METHODS})
     try:
         yield db
     finally:
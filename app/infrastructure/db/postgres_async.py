@@ -0,0 +1,37 @@
+import os
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.infrastructure.db.pool import (
+    TimedAsyncAdaptedQueuePool,
+    get_pool_options,
+    register_engine,
+)
+from app.infrastructure.metrics.sql import instrument_engine
+
+
+# Por defecto reutiliza DATABASE_URL cambiando el driver a asyncpg.
+DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://user:password@db:5432/todo_db")
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    make_url(DATABASE_URL)
+    .set(drivername="postgresql+asyncpg")
+    .render_as_string(hide_password=False),
+)
+
+# create_async_engine no abre conexiones: la primera se establece en la primera
+# petición que use la sesión.
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool, **get_pool_options()
+)
+register_engine("async", async_engine.sync_engine)
+instrument_engine(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+# Función para obtener una sesión asíncrona de la base de datos
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
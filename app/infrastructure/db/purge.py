@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import os
+from typing import Callable, Dict, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.infrastructure.db.lifecycle import DatabaseState
+from app.infrastructure.db.lifecycle import state as database_state
+from app.infrastructure.repositories import queries
+
+logger = logging.getLogger(__name__)
+
+# Filas borradas por transacción: acota la duración de cada lote, los bloqueos
+# que retiene y el WAL que genera, a cambio de más round trips.
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "5000"))
+# Espera entre comprobaciones cuando no queda nada que purgar.
+PURGE_INTERVAL = float(os.getenv("PURGE_INTERVAL", "5"))
+# Con varias réplicas de la API basta con que purgue una parte de ellas; el
+# CLI purge_deleted_lists hace lo mismo fuera del proceso.
+PURGE_ENABLED = os.getenv("PURGE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+class PurgeState:
+    def __init__(self):
+        self.running = False
+        self.batches = 0
+        self.tasks_purged = 0
+        self.lists_purged = 0
+        self.current_list: Optional[UUID] = None
+        self.error: Optional[str] = None
+
+    def snapshot(self) -> Dict:
+        return {
+            "running": self.running,
+            "batches": self.batches,
+            "tasks_purged": self.tasks_purged,
+            "lists_purged": self.lists_purged,
+            "current_list": self.current_list,
+            "error": self.error,
+        }
+
+
+state = PurgeState()
+
+
+# Un lote por transacción: bloquea la lista pendiente más antigua y borra hasta
+# batch_size de sus tareas (y después de sus lápidas). Cuando ya no queda
+# nada, borra la fila de la lista, cuyo ON DELETE CASCADE no encuentra hijos.
+# Devuelve False si no había nada que purgar.
+def purge_batch(
+    db: Session, batch_size: int = PURGE_BATCH_SIZE, purge_state: PurgeState = state
+) -> bool:
+    list_id = db.execute(queries.next_purge()).scalar()
+    if list_id is None:
+        db.rollback()
+        purge_state.current_list = None
+        return False
+    purged = db.execute(queries.purge_tasks(list_id, batch_size)).rowcount
+    removed = purged
+    if removed < batch_size:
+        removed += db.execute(
+            queries.purge_tombstones(list_id, batch_size - removed)
+        ).rowcount
+    finished = removed < batch_size
+    if finished:
+        db.execute(queries.purge_todo_list(list_id))
+    db.commit()
+    purge_state.batches += 1
+    purge_state.tasks_purged += purged
+    purge_state.lists_purged += finished
+    purge_state.current_list = None if finished else list_id
+    return True
+
+
+def _purge_once(
+    session_factory: Callable[[], Session], batch_size: int, purge_state: PurgeState
+) -> bool:
+    with session_factory() as db:
+        return purge_batch(db, batch_size, purge_state)
+
+
+# Corre dentro del proceso de la API: cada lote se ejecuta en un hilo para no
+# bloquear el event loop y entre lotes se cede el turno a las peticiones. Un
+# error se registra y se reintenta pasado el intervalo.
+async def run_purger(
+    session_factory: Callable[[], Session],
+    interval: float = PURGE_INTERVAL,
+    batch_size: int = PURGE_BATCH_SIZE,
+    purge_state: PurgeState = state,
+    db_state: DatabaseState = database_state,
+) -> None:
+    purge_state.running = True
+    try:
+        while True:
+            pending = False
+            if db_state.ready:
+                try:
+                    pending = await asyncio.to_thread(
+                        _purge_once, session_factory, batch_size, purge_state
+                    )
+                    purge_state.error = None
+                except Exception as exc:
+                    purge_state.error = f"{type(exc).__name__}: {exc}"
+                    logger.exception("Purge batch failed")
+            await asyncio.sleep(0 if pending else interval)
+    finally:
+        purge_state.running = False
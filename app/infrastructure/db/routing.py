@@ -0,0 +1,62 @@
+import itertools
+import threading
+from typing import Optional, Sequence
+from sqlalchemy import Select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Claves de Session.info. READ_ONLY lo fija get_db en las peticiones GET/HEAD.
+READ_ONLY = "read_only"
+_PINNED = "pinned_to_primary"
+_REPLICA = "replica"
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+# Reparte las sesiones entre las réplicas por turnos.
+class ReplicaSelector:
+    def __init__(self, engines: Sequence[Engine]):
+        self.engines = list(engines)
+        self._cycle = itertools.cycle(self.engines)
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def next(self) -> Engine:
+        with self._lock:
+            return next(self._cycle)
+
+
+# Sesión que envía a una réplica los SELECT de las peticiones de solo lectura.
+# Cada sesión (una por petición) usa siempre la misma réplica, de modo que sus
+# lecturas no retroceden en el tiempo. Cualquier otra sentencia, un SELECT ...
+# FOR UPDATE o una conexión pedida sin sentencia (COPY) fijan la sesión al
+# primario: desde ese momento también sus lecturas van al primario y ven sus
+# propias escrituras.
+class RoutingSession(Session):
+    def __init__(self, *args, replicas: Optional[ReplicaSelector] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if (
+            self.replicas
+            and self.info.get(READ_ONLY)
+            and not self.info.get(_PINNED)
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            if _REPLICA not in self.info:
+                self.info[_REPLICA] = self.replicas.next()
+            return self.info[_REPLICA]
+        self.info[_PINNED] = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+# Las lecturas de réplica pueden ir por detrás de una invalidación reciente:
+# la caché se consulta, pero no se rellena con ellas.
+def reads_from_replica(db) -> bool:
+    return bool(
+        isinstance(db, RoutingSession) and db.replicas and db.info.get(READ_ONLY)
+    )
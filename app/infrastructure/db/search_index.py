@@ -0,0 +1,28 @@
+from sqlalchemy import DDL, Table, event
+
+# Configuración de texto de PostgreSQL: "simple" no aplica raíces ni palabras
+# vacías de ningún idioma, porque las tareas pueden estar escritas en cualquiera.
+SEARCH_CONFIG = "simple"
+
+# search_vector es una columna generada (el título pesa más que la descripción)
+# con un índice GIN; el índice de trigramas sobre el título atiende las
+# búsquedas con erratas. La columna no forma parte del modelo: así las lecturas
+# con select(tasks) no la transfieren y SQLite puede crear el mismo esquema.
+POSTGRES_SEARCH_INDEX = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"""
+    ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)",
+    "CREATE INDEX ix_tasks_title_trgm ON tasks USING gin (title gin_trgm_ops)",
+]
+
+
+def register_search_index(table: Table) -> None:
+    for statement in POSTGRES_SEARCH_INDEX:
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
@@ -0,0 +1,314 @@
+from sqlalchemy import DDL, Table, event
+
+
+# todo_lists.tasks_version se incrementa con cada escritura sobre las tareas de
+# la lista, venga de la API síncrona, la asíncrona, los lotes o un COPY. En
+# PostgreSQL los triggers son por sentencia con tablas de transición: un lote
+# de N filas cuesta un único UPDATE por lista afectada, no N.
+POSTGRES_TASKS_VERSION = [
+    """
+    CREATE OR REPLACE FUNCTION bump_tasks_version() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            UPDATE todo_lists SET tasks_version = tasks_version + 1
+            WHERE id IN (SELECT DISTINCT todo_list_id FROM old_rows);
+        ELSE
+            UPDATE todo_lists SET tasks_version = tasks_version + 1
+            WHERE id IN (SELECT DISTINCT todo_list_id FROM new_rows);
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER tasks_version_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_tasks_version()
+    """,
+    """
+    CREATE TRIGGER tasks_version_update AFTER UPDATE ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_tasks_version()
+    """,
+    """
+    CREATE TRIGGER tasks_version_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_tasks_version()
+    """,
+]
+
+# Columnas de tasks que escribe la aplicación. En SQLite los triggers de
+# UPDATE se limitan a ellas para no dispararse con el sellado de
+# change_version, que es a su vez un UPDATE (ver SQLITE_TASK_CHANGES).
+TASK_DATA_COLUMNS = (
+    "title, description, status, priority, created_at, updated_at, todo_list_id"
+)
+
+# SQLite (pruebas y benchmarks locales) solo tiene triggers por fila.
+SQLITE_TASKS_VERSION = [
+    f"""
+    CREATE TRIGGER tasks_version_{event_name.split()[0].lower()}
+    AFTER {event_name} ON tasks
+    BEGIN
+        UPDATE todo_lists SET tasks_version = tasks_version + 1
+        WHERE id = {row}.todo_list_id;
+    END
+    """
+    for event_name, row in (
+        ("INSERT", "NEW"),
+        (f"UPDATE OF {TASK_DATA_COLUMNS}", "NEW"),
+        ("DELETE", "OLD"),
+    )
+]
+
+
+# Contadores de tareas por estado en todo_lists. Cada sentencia agrega sus
+# filas (+1 las nuevas, -1 las antiguas) y aplica un único UPDATE por lista;
+# las actualizaciones que no cambian el estado suman cero y no escriben nada.
+COUNTER_COLUMNS = {
+    "total_tasks": None,
+    "pending_tasks": "PENDING",
+    "in_progress_tasks": "IN_PROGRESS",
+    "completed_tasks": "COMPLETED",
+}
+
+_DELTAS = {
+    "INSERT": "SELECT todo_list_id, status, 1 AS delta FROM new_rows",
+    "DELETE": "SELECT todo_list_id, status, -1 AS delta FROM old_rows",
+    "UPDATE": (
+        "SELECT todo_list_id, status, 1 AS delta FROM new_rows UNION ALL "
+        "SELECT todo_list_id, status, -1 AS delta FROM old_rows"
+    ),
+}
+
+
+def _apply_counts(deltas: str) -> str:
+    sums = ", ".join(
+        (
+            f"coalesce(sum(delta) FILTER (WHERE status = '{status}'), 0) AS {column}"
+            if status
+            else f"sum(delta) AS {column}"
+        )
+        for column, status in COUNTER_COLUMNS.items()
+    )
+    assignments = ", ".join(f"{c} = l.{c} + d.{c}" for c in COUNTER_COLUMNS)
+    changed = " OR ".join(f"d.{c} <> 0" for c in COUNTER_COLUMNS)
+    return f"""
+            UPDATE todo_lists l SET {assignments}
+            FROM (
+                SELECT todo_list_id, {sums}
+                FROM ({deltas}) AS changes GROUP BY todo_list_id
+            ) AS d
+            WHERE l.id = d.todo_list_id AND ({changed});"""
+
+
+POSTGRES_TASK_COUNTS = [
+    f"""
+    CREATE OR REPLACE FUNCTION apply_task_counts() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN{_apply_counts(_DELTAS["INSERT"])}
+        ELSIF TG_OP = 'DELETE' THEN{_apply_counts(_DELTAS["DELETE"])}
+        ELSE{_apply_counts(_DELTAS["UPDATE"])}
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER task_counts_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_task_counts()
+    """,
+    """
+    CREATE TRIGGER task_counts_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_task_counts()
+    """,
+    """
+    CREATE TRIGGER task_counts_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_task_counts()
+    """,
+]
+
+
+def _sqlite_counts(row: str, sign: str) -> str:
+    assignments = ", ".join(
+        (
+            f"{column} = {column} {sign} ({row}.status = '{status}')"
+            if status
+            else f"{column} = {column} {sign} 1"
+        )
+        for column, status in COUNTER_COLUMNS.items()
+    )
+    return f"UPDATE todo_lists SET {assignments} WHERE id = {row}.todo_list_id;"
+
+
+SQLITE_TASK_COUNTS = [
+    f"""
+    CREATE TRIGGER task_counts_insert AFTER INSERT ON tasks
+    BEGIN {_sqlite_counts("NEW", "+")} END
+    """,
+    f"""
+    CREATE TRIGGER task_counts_update AFTER UPDATE ON tasks
+    WHEN OLD.status IS NOT NEW.status OR OLD.todo_list_id IS NOT NEW.todo_list_id
+    BEGIN {_sqlite_counts("OLD", "-")} {_sqlite_counts("NEW", "+")} END
+    """,
+    f"""
+    CREATE TRIGGER task_counts_delete AFTER DELETE ON tasks
+    BEGIN {_sqlite_counts("OLD", "-")} END
+    """,
+]
+
+
+# Feed de cambios: cada escritura sella la fila con un valor de una secuencia
+# global (change_version) y cada borrado deja una lápida en task_tombstones.
+# Para que un cliente nunca se salte un cambio, dentro de una lista los valores
+# deben hacerse visibles en orden: toda escritura de la lista o de sus tareas
+# bloquea antes la fila de la lista (el UPDATE de la lista ya la tiene al
+# disparar el trigger) y la retiene hasta el commit. Volver a bloquear una fila
+# que la transacción ya tiene no escribe nada, así que en un lote solo espera
+# la primera fila.
+POSTGRES_CHANGE_SEQUENCE = ["CREATE SEQUENCE IF NOT EXISTS change_versions"]
+
+POSTGRES_TODO_LIST_CHANGES = [
+    """
+    CREATE OR REPLACE FUNCTION stamp_todo_list_change() RETURNS trigger AS $$
+    BEGIN
+        NEW.change_version := nextval('change_versions');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER todo_lists_change_version BEFORE INSERT OR UPDATE ON todo_lists
+    FOR EACH ROW EXECUTE FUNCTION stamp_todo_list_change()
+    """,
+]
+
+# En el borrado en cascada de una lista esta ya no es visible, y en la purga
+# de una lista borrada (deleted_at) tampoco: no se dejan lápidas que nadie va
+# a leer.
+POSTGRES_TASK_CHANGES = [
+    """
+    CREATE OR REPLACE FUNCTION stamp_task_change() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            PERFORM 1 FROM todo_lists WHERE id = OLD.todo_list_id
+            FOR NO KEY UPDATE;
+            RETURN OLD;
+        END IF;
+        PERFORM 1 FROM todo_lists WHERE id = NEW.todo_list_id FOR NO KEY UPDATE;
+        NEW.change_version := nextval('change_versions');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER tasks_change_version BEFORE INSERT OR UPDATE OR DELETE ON tasks
+    FOR EACH ROW EXECUTE FUNCTION stamp_task_change()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION record_task_tombstones() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO task_tombstones (task_id, todo_list_id, change_version, deleted_at)
+        SELECT o.id, o.todo_list_id, nextval('change_versions'),
+               now() AT TIME ZONE 'utc'
+        FROM old_rows o
+        WHERE EXISTS (
+            SELECT 1 FROM todo_lists l
+            WHERE l.id = o.todo_list_id AND l.deleted_at IS NULL
+        );
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER task_tombstones AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_task_tombstones()
+    """,
+]
+
+# SQLite no tiene secuencias: un contador en una tabla de una fila (los "%%"
+# escapan el formato de DDL). Los
+# escritores ya están serializados, así que basta con sellar tras escribir
+# (los triggers no son recursivos: el UPDATE del sellado no vuelve a dispararlos).
+SQLITE_CHANGE_SEQUENCE = [
+    "CREATE TABLE IF NOT EXISTS change_sequence (value INTEGER NOT NULL)",
+    """
+    INSERT INTO change_sequence (value)
+    SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM change_sequence)
+    """,
+]
+
+_SQLITE_NEXT = "UPDATE change_sequence SET value = value + 1;"
+_SQLITE_CURRENT = "(SELECT value FROM change_sequence)"
+
+SQLITE_TODO_LIST_CHANGES = [
+    f"""
+    CREATE TRIGGER todo_lists_change_version_{event_name.lower()}
+    AFTER {event_name} ON todo_lists
+    BEGIN
+        {_SQLITE_NEXT}
+        UPDATE todo_lists SET change_version = {_SQLITE_CURRENT} WHERE id = NEW.id;
+    END
+    """
+    for event_name in ("INSERT", "UPDATE")
+]
+
+SQLITE_TASK_CHANGES = (
+    [
+        f"""
+    CREATE TRIGGER tasks_change_version_{event_name.split()[0].lower()}
+    AFTER {event_name} ON tasks
+    BEGIN
+        {_SQLITE_NEXT}
+        UPDATE tasks SET change_version = {_SQLITE_CURRENT} WHERE id = NEW.id;
+    END
+    """
+        for event_name in ("INSERT", f"UPDATE OF {TASK_DATA_COLUMNS}")
+    ]
+    + [
+        f"""
+    CREATE TRIGGER task_tombstones AFTER DELETE ON tasks
+    WHEN EXISTS (
+        SELECT 1 FROM todo_lists WHERE id = OLD.todo_list_id AND deleted_at IS NULL
+    )
+    BEGIN
+        {_SQLITE_NEXT}
+        INSERT INTO task_tombstones (task_id, todo_list_id, change_version, deleted_at)
+        VALUES (
+            OLD.id, OLD.todo_list_id, {_SQLITE_CURRENT},
+            strftime('%%Y-%%m-%%d %%H:%%M:%%f000', 'now')
+        );
+    END
+    """
+    ]
+)
+
+
+def _register(table: Table, postgres: list, sqlite: list) -> None:
+    for statement in postgres:
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for statement in sqlite:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+
+# todo_lists se crea antes que tasks: la secuencia se crea con ella.
+def register_todo_list_triggers(table: Table) -> None:
+    _register(
+        table,
+        POSTGRES_CHANGE_SEQUENCE + POSTGRES_TODO_LIST_CHANGES,
+        SQLITE_CHANGE_SEQUENCE + SQLITE_TODO_LIST_CHANGES,
+    )
+
+
+def register_task_triggers(table: Table) -> None:
+    _register(
+        table,
+        POSTGRES_TASKS_VERSION + POSTGRES_TASK_COUNTS + POSTGRES_TASK_CHANGES,
+        SQLITE_TASKS_VERSION + SQLITE_TASK_COUNTS + SQLITE_TASK_CHANGES,
+    )
@@ -0,0 +1,138 @@
+import os
+import tempfile
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID, uuid4
+from sqlalchemy.orm import Session
+from app.domain.exceptions.custom_exceptions import ToDoListNotFoundException
+from app.domain.models.job import Job, JobKind
+from app.domain.models.task import Task, TaskStatus
+from app.domain.models.todo_list import ToDoList
+from app.infrastructure.repositories import queries
+from app.shared.utils.cursor import encode_cursor
+from app.shared.utils.task_io import FileFormat, serialize_tasks
+from app.shared.utils.time import get_utc_now
+
+# Ficheros de las exportaciones. Con workers en otras máquinas debe ser un
+# volumen compartido con la API, que es quien los sirve.
+JOBS_EXPORT_DIR = os.getenv(
+    "JOBS_EXPORT_DIR", os.path.join(tempfile.gettempdir(), "todo-exports")
+)
+
+# Cada llamada procesa un lote y devuelve el resultado final, o None si queda
+# trabajo. Avanza job.processed/total y el checkpoint, que el worker guarda en
+# la misma transacción que las escrituras del lote.
+Handler = Callable[[Session, Job, Dict[str, Any], int], Optional[Dict[str, Any]]]
+
+
+def _live_list(db: Session, list_id: UUID) -> ToDoList:
+    row = db.execute(queries.todo_list_by_id(list_id)).mappings().first()
+    if not row:
+        raise ToDoListNotFoundException(str(list_id))
+    return ToDoList(**row)
+
+
+def change_status(
+    db: Session, job: Job, checkpoint: Dict[str, Any], batch_size: int
+) -> Optional[Dict[str, Any]]:
+    _live_list(db, job.todo_list_id)
+    status = TaskStatus(job.params["status"])
+    from_status = job.params.get("from_status")
+    from_status = TaskStatus(from_status) if from_status else None
+    if job.total is None:
+        query = queries.count_status_change(job.todo_list_id, status, from_status)
+        job.total = db.execute(query).scalar()
+    query = queries.change_status_batch(
+        job.todo_list_id, status, from_status, batch_size
+    )
+    changed = len(db.execute(query).all())
+    job.processed += changed
+    return {"updated": job.processed} if changed < batch_size else None
+
+
+# Primero crea la copia (su id queda en el checkpoint) y después copia las
+# tareas en orden (created_at, id) a partir del cursor del último lote.
+def duplicate_list(
+    db: Session, job: Job, checkpoint: Dict[str, Any], batch_size: int
+) -> Optional[Dict[str, Any]]:
+    source = _live_list(db, job.todo_list_id)
+    if "todo_list_id" not in checkpoint:
+        name = job.params.get("name") or f"Copy of {source.name}"[:100]
+        values = {"name": name, "description": source.description}
+        copy = db.execute(queries.insert_todo_list(values)).mappings().one()
+        checkpoint["todo_list_id"] = str(copy["id"])
+        job.total = source.total_tasks
+        return None
+    query = queries.task_page(
+        job.todo_list_id, None, None, batch_size, checkpoint.get("after")
+    )
+    rows = db.execute(query).mappings().all()
+    batch = rows[:batch_size]
+    if batch:
+        now = get_utc_now()
+        copies = [
+            {
+                "id": uuid4(),
+                "todo_list_id": UUID(checkpoint["todo_list_id"]),
+                "title": row["title"],
+                "description": row["description"],
+                "status": row["status"],
+                "priority": row["priority"],
+                "created_at": row["created_at"],
+                "updated_at": now,
+            }
+            for row in batch
+        ]
+        db.execute(queries.load_tasks(), copies)
+        checkpoint["after"] = encode_cursor(batch[-1]["created_at"], batch[-1]["id"])
+        job.processed += len(batch)
+    if len(rows) > batch_size:
+        return None
+    return {"todo_list_id": checkpoint["todo_list_id"]}
+
+
+def export_path(job: Job) -> str:
+    return os.path.join(JOBS_EXPORT_DIR, f"{job.id}.{job.params['format']}")
+
+
+# El checkpoint guarda el cursor y los bytes ya confirmados: cada lote trunca
+# el fichero a ese punto antes de escribir, de modo que un lote repetido tras
+# una caída no deja filas duplicadas.
+def export_tasks(
+    db: Session, job: Job, checkpoint: Dict[str, Any], batch_size: int
+) -> Optional[Dict[str, Any]]:
+    todo_list = _live_list(db, job.todo_list_id)
+    file_format = FileFormat(job.params["format"])
+    if job.total is None:
+        job.total = todo_list.total_tasks
+    query = queries.task_page(
+        job.todo_list_id, None, None, batch_size, checkpoint.get("after")
+    )
+    rows = db.execute(query).mappings().all()
+    batch = [Task(**row) for row in rows[:batch_size]]
+    offset = checkpoint.get("offset", 0)
+    os.makedirs(JOBS_EXPORT_DIR, exist_ok=True)
+    with open(export_path(job), "r+b" if offset else "wb") as fh:
+        fh.seek(offset)
+        fh.truncate()
+        for chunk in serialize_tasks(batch, file_format, header=not offset):
+            fh.write(chunk.encode())
+        fh.flush()
+        os.fsync(fh.fileno())
+        checkpoint["offset"] = fh.tell()
+    if batch:
+        checkpoint["after"] = encode_cursor(batch[-1].created_at, batch[-1].id)
+        job.processed += len(batch)
+    if len(rows) > batch_size:
+        return None
+    return {"rows": job.processed, "bytes": checkpoint["offset"]}
+
+
+HANDLERS: Dict[JobKind, Handler] = {
+    JobKind.STATUS_CHANGE: change_status,
+    JobKind.DUPLICATE_LIST: duplicate_list,
+    JobKind.EXPORT: export_tasks,
+}
+
+# Trabajos que modifican las tareas de su lista: el worker invalida la caché
+# de la lista después de confirmar cada lote.
+WRITES_TASKS = {JobKind.STATUS_CHANGE}
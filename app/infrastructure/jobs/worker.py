@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import os
+import threading
+from datetime import timedelta
+from typing import Callable, Optional
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from app.domain.models.job import Job, JobStatus
+from app.infrastructure.cache.backends import get_cache, tasks_prefix, todo_list_key
+from app.infrastructure.db.lifecycle import DatabaseState
+from app.infrastructure.db.lifecycle import state as database_state
+from app.infrastructure.jobs.handlers import HANDLERS, WRITES_TASKS
+from app.infrastructure.repositories import queries
+from app.shared.utils.time import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+# Workers por proceso de la API (cada uno, un hilo mientras ejecuta un lote).
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOBS_ENABLED = os.getenv("JOBS_ENABLED", "true").lower() in ("1", "true", "yes")
+# Espera entre consultas a la cola cuando está vacía.
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+# Filas por lote (y por transacción) de cada trabajo.
+JOB_BATCH_SIZE = int(os.getenv("JOB_BATCH_SIZE", "1000"))
+# Un trabajo en curso sin latido (uno por lote) durante este tiempo se da por
+# abandonado y otro worker lo retoma desde su último checkpoint.
+JOB_STALE_AFTER = float(os.getenv("JOB_STALE_AFTER", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+
+
+def _describe(exc: Exception) -> str:
+    if isinstance(exc, HTTPException):
+        return str(exc.detail)
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _invalidate(job: Job) -> None:
+    cache = get_cache()
+    if cache and job.kind in WRITES_TASKS:
+        cache.delete(todo_list_key(job.todo_list_id))
+        cache.delete_prefix(tasks_prefix(job.todo_list_id))
+
+
+# Ejecuta lotes hasta terminar: cada uno confirma sus escrituras junto con el
+# progreso y el checkpoint. Con stop activado vuelve a dejar el trabajo en cola
+# entre dos lotes. Devuelve False si la cola estaba vacía.
+def work_once(
+    session_factory: Callable[[], Session],
+    batch_size: int = JOB_BATCH_SIZE,
+    stale_after: float = JOB_STALE_AFTER,
+    max_attempts: int = JOB_MAX_ATTEMPTS,
+    stop: Optional[threading.Event] = None,
+) -> bool:
+    with session_factory() as db:
+        stale_before = get_utc_now() - timedelta(seconds=stale_after)
+        row = db.execute(queries.claim_job(stale_before)).mappings().first()
+        db.commit()
+        if row is None:
+            return False
+        job, checkpoint = Job(**row), dict(row["checkpoint"] or {})
+
+        def save(values) -> int:
+            return db.execute(queries.save_job(job.id, job.attempts, values)).rowcount
+
+        if job.attempts > max_attempts:
+            save(
+                {
+                    "status": JobStatus.FAILED,
+                    "error": f"Gave up after {max_attempts} attempts.",
+                    "finished_at": get_utc_now(),
+                }
+            )
+            db.commit()
+            return True
+        try:
+            while True:
+                if stop is not None and stop.is_set():
+                    save({"status": JobStatus.QUEUED})
+                    db.commit()
+                    return True
+                result = HANDLERS[job.kind](db, job, checkpoint, batch_size)
+                values = {
+                    "processed": job.processed,
+                    "total": job.total,
+                    "checkpoint": checkpoint,
+                }
+                if result is not None:
+                    values.update(
+                        status=JobStatus.SUCCEEDED,
+                        result=result,
+                        finished_at=get_utc_now(),
+                    )
+                if not save(values):
+                    db.rollback()
+                    logger.warning("Job %s was taken over by another worker", job.id)
+                    return True
+                db.commit()
+                _invalidate(job)
+                if result is not None:
+                    return True
+        except Exception as exc:
+            db.rollback()
+            logger.exception("Job %s failed", job.id)
+            save(
+                {
+                    "status": JobStatus.FAILED,
+                    "error": _describe(exc),
+                    "finished_at": get_utc_now(),
+                }
+            )
+            db.commit()
+            return True
+
+
+# Pool de workers dentro del proceso (lifespan de la API o CLI job_worker).
+# Cada trabajo corre en un hilo para no bloquear el event loop; al cancelar el
+# pool, los trabajos en curso vuelven a la cola al terminar su lote.
+async def run_job_workers(
+    session_factory: Callable[[], Session],
+    workers: int = JOB_WORKERS,
+    interval: float = JOB_POLL_INTERVAL,
+    batch_size: int = JOB_BATCH_SIZE,
+    db_state: DatabaseState = database_state,
+) -> None:
+    stop = threading.Event()
+
+    async def work():
+        while True:
+            pending = False
+            if db_state.ready:
+                try:
+                    pending = await asyncio.to_thread(
+                        work_once, session_factory, batch_size, stop=stop
+                    )
+                except Exception:
+                    logger.exception("Job worker failed")
+            await asyncio.sleep(0 if pending else interval)
+
+    try:
+        await asyncio.gather(*(work() for _ in range(workers)))
+    finally:
+        stop.set()
@@ -0,0 +1,141 @@
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+# Límites superiores (en segundos) de los histogramas de latencia.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+# Límites del histograma de consultas por petición.
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(name: str, labels: Labels, value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels)
+        name = f"{name}{{{rendered}}}"
+    return f"{name} {value}"
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_labels(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = list(self._values.items())
+        lines.extend(_format(self.name, key, value) for key, value in items)
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self._values: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    # Por cada combinación de etiquetas: un contador por cubo, la suma y el total.
+    def observe(self, value: float, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            counts = self._values.setdefault(key, [0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[len(self.buckets)] += 1
+            counts[-1] += value
+
+    def count(self, **labels: str) -> int:
+        counts = self._values.get(_labels(labels))
+        return sum(counts[:-1]) if counts else 0
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            items = [(key, list(counts)) for key, counts in self._values.items()]
+        for key, counts in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts[:-1]):
+                cumulative += count
+                le = bound if bound == "+Inf" else f"{bound:g}"
+                lines.append(
+                    _format(f"{self.name}_bucket", key + (("le", le),), cumulative)
+                )
+            lines.append(_format(f"{self.name}_sum", key, float(counts[-1])))
+            lines.append(_format(f"{self.name}_count", key, cumulative))
+        return lines
+
+
+# Métricas del proceso en formato de texto de Prometheus. Con varios workers
+# de uvicorn cada proceso expone las suyas (Prometheus las suma por instancia).
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        metric = Counter(name, help_text)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self, name: str, help_text: str, buckets: Iterable[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, help_text, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "http_requests_total", "Peticiones HTTP atendidas por ruta y código de estado."
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "Duración total de las peticiones HTTP."
+)
+http_request_db_queries = registry.histogram(
+    "http_request_db_queries",
+    "Consultas SQL (round trips) por petición.",
+    QUERY_COUNT_BUCKETS,
+)
+http_request_db_duration = registry.histogram(
+    "http_request_db_duration_seconds", "Tiempo en SQL por petición."
+)
+db_query_duration = registry.histogram(
+    "db_query_duration_seconds", "Duración de cada consulta SQL."
+)
+db_slow_queries = registry.counter(
+    "db_slow_queries_total", "Consultas que superan SLOW_QUERY_MS."
+)
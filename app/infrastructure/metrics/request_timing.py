@@ -0,0 +1,166 @@
+import asyncio
+import os
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Dict, Optional
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.metrics.registry import (
+    http_request_db_duration,
+    http_request_db_queries,
+    http_request_duration,
+    http_requests,
+)
+
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+
+# Marcas de tiempo de una petición. La variable de contexto se copia a los
+# hilos del threadpool, así que los handlers síncronos y los eventos de
+# SQLAlchemy modifican este mismo objeto.
+class RequestTimings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.route: Optional[str] = None
+        self.routed: Optional[float] = None
+        self.handler_started: Optional[float] = None
+        self.handler_finished: Optional[float] = None
+        self.responded: Optional[float] = None
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+
+    def add_query(self, elapsed: float) -> None:
+        self.queries += 1
+        self.db_time += elapsed
+
+    # Fases en milisegundos: routing (hasta elegir ruta), di (resolución de
+    # dependencias), db (SQL), app (handler sin SQL ni serialización, es decir,
+    # lógica e hidratación de filas en modelos) y serialize.
+    def phases(self) -> Dict[str, float]:
+        end = self.responded or time.perf_counter()
+        phases = {"total": end - self.started, "db": self.db_time}
+        if self.routed is not None:
+            phases["routing"] = self.routed - self.started
+        if self.handler_started is not None:
+            phases["di"] = self.handler_started - (self.routed or self.started)
+        if self.handler_finished is not None:
+            handler = self.handler_finished - self.handler_started
+            phases["app"] = max(handler - self.db_time - self.serialize_time, 0.0)
+            phases["serialize"] = self.serialize_time + (end - self.handler_finished)
+        return {name: value * 1000 for name, value in phases.items()}
+
+    def server_timing(self) -> str:
+        entries = []
+        for name, value in self.phases().items():
+            entry = f"{name};dur={value:.2f}"
+            if name == "db":
+                entry += f';desc="{self.queries} queries"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def record_serialization(elapsed: float) -> None:
+    timings = current_timings.get()
+    if timings is not None:
+        timings.serialize_time += elapsed
+
+
+def _timed(endpoint: Callable) -> Callable:
+    if asyncio.iscoroutinefunction(endpoint):
+
+        @wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            timings = current_timings.get()
+            if timings is None:
+                return await endpoint(*args, **kwargs)
+            timings.handler_started = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                timings.handler_finished = time.perf_counter()
+
+        return async_wrapper
+
+    @wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        timings = current_timings.get()
+        if timings is None:
+            return endpoint(*args, **kwargs)
+        timings.handler_started = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            timings.handler_finished = time.perf_counter()
+
+    return wrapper
+
+
+# Ruta que marca cuándo se ha elegido (fin del routing) y cuándo empieza y
+# acaba el handler; lo que queda entre medias es la resolución de dependencias
+# (get_task_use_case -> get_task_repository -> get_db, etc.).
+class TimedRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _timed(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        route = self.path_format
+
+        async def timed_handler(request: Request) -> Response:
+            timings = current_timings.get()
+            if timings is not None:
+                timings.route = route
+                timings.routed = time.perf_counter()
+            return await handler(request)
+
+        return timed_handler
+
+
+# Middleware ASGI puro (sin BaseHTTPMiddleware, que añade una tarea y una copia
+# del cuerpo por petición): añade Server-Timing y alimenta /metrics.
+class TimingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timings.responded = time.perf_counter()
+                if SERVER_TIMING_ENABLED:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timings.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_timings.reset(token)
+            total = time.perf_counter() - timings.started
+            route = timings.route or "unmatched"
+            labels = {"method": scope["method"], "route": route}
+            http_requests.inc(status=str(status), **labels)
+            http_request_duration.observe(total, **labels)
+            http_request_db_queries.observe(timings.queries, **labels)
+            http_request_db_duration.observe(timings.db_time, **labels)
@@ -0,0 +1,58 @@
+import logging
+import os
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.infrastructure.metrics.registry import db_query_duration, db_slow_queries
+from app.infrastructure.metrics.request_timing import current_timings
+
+# Umbral del log de consultas lentas en milisegundos (0 lo desactiva).
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+# Los parámetros pueden contener datos de usuario: se pueden omitir del log.
+SLOW_QUERY_LOG_PARAMS = os.getenv("SLOW_QUERY_LOG_PARAMS", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Longitud máxima de la sentencia y de los parámetros en cada línea del log.
+SLOW_QUERY_MAX_CHARS = int(os.getenv("SLOW_QUERY_MAX_CHARS", "2000"))
+
+logger = logging.getLogger("app.sql.slow")
+
+
+def _truncate(text: str) -> str:
+    if len(text) <= SLOW_QUERY_MAX_CHARS:
+        return text
+    return text[:SLOW_QUERY_MAX_CHARS] + "..."
+
+
+# El inicio se guarda en el contexto de la ejecución y no en la conexión: si la
+# sentencia falla no llega after_cursor_execute, y lo guardado en conn.info
+# seguiría en la conexión al volver al pool.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+# Cada ejecución en el cursor es un round trip: un executemany o cada página de
+# un INSERT multi-fila cuentan una vez.
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start
+    db_query_duration.observe(elapsed)
+    timings = current_timings.get()
+    if timings is not None:
+        timings.add_query(elapsed)
+    if SLOW_QUERY_MS and elapsed * 1000 >= SLOW_QUERY_MS:
+        db_slow_queries.inc()
+        logger.warning(
+            "slow query (%.1f ms) route=%s statement=%s parameters=%s",
+            elapsed * 1000,
+            timings.route if timings else None,
+            _truncate(" ".join(statement.split())),
+            _truncate(repr(parameters)) if SLOW_QUERY_LOG_PARAMS else "<omitted>",
+        )
+
+
+# Los eventos del motor asíncrono se registran en su sync_engine.
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
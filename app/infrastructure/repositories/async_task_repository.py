@@ -0,0 +1,97 @@
+from app.domain.repositories.async_task_repository_interface import (
+    AsyncTaskRepositoryInterface,
+)
+from app.domain.models.task import (
+    TaskCreate,
+    TaskUpdate,
+    Task,
+    TaskStatus,
+    TaskPriority,
+    TaskProjection,
+    TaskSort,
+    TaskStats,
+)
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.infrastructure.repositories import queries
+from app.shared.utils.cursor import build_page
+from app.shared.utils.projection import projection_columns
+from app.shared.utils.sorting import build_sorted_page
+from app.shared.utils.time import get_utc_now
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AsyncTaskRepository(AsyncTaskRepositoryInterface):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, list_id: UUID, data: TaskCreate) -> Optional[Task]:
+        now = get_utc_now()
+        values = {**data.model_dump(), "created_at": now, "updated_at": now}
+        result = await self.db.execute(queries.insert_task(list_id, values))
+        row = result.mappings().first()
+        await self.db.commit()
+        return Task(**row) if row else None
+
+    async def get_by_id(self, list_id: UUID, task_id: UUID) -> Task:
+        result = await self.db.execute(queries.task_by_id(list_id, task_id))
+        row = result.mappings().first()
+        return Task(**row) if row else None
+
+    async def update(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        data: TaskUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task:
+        values = {**data.model_dump(exclude_unset=True), "updated_at": get_utc_now()}
+        query = queries.update_task(list_id, task_id, values, if_match)
+        result = await self.db.execute(query)
+        row = result.mappings().first()
+        await self.db.commit()
+        return Task(**row) if row else None
+
+    async def delete(self, list_id: UUID, task_id: UUID) -> bool:
+        result = await self.db.execute(queries.delete_task(list_id, task_id))
+        deleted = result.first()
+        await self.db.commit()
+        return deleted is not None
+
+    async def list_page_by_filters(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: Optional[TaskSort] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Page[Task], Page[TaskProjection]]:
+        columns = projection_columns(fields, sort) if fields else None
+        model = TaskProjection if fields else Task
+        if sort is None:
+            query = queries.task_page(list_id, status, priority, limit, after, columns)
+            rows = (await self.db.execute(query)).mappings()
+            return build_page([model(**row) for row in rows], limit)
+        query = queries.sorted_task_page(
+            list_id, status, priority, sort, limit, after, columns
+        )
+        rows = (await self.db.execute(query)).mappings()
+        return build_sorted_page([model(**row) for row in rows], limit, sort)
+
+    async def list_by_lists(
+        self,
+        list_ids: List[UUID],
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> List[Task]:
+        lateral = self.db.bind.dialect.name == "postgresql"
+        query = queries.tasks_for_lists(list_ids, status, per_list, lateral)
+        return [Task(**row) for row in (await self.db.execute(query)).mappings()]
+
+    async def get_stats(self, list_id: UUID) -> TaskStats:
+        counts = (await self.db.execute(queries.task_stats(list_id))).all()
+        return TaskStats.from_counts(counts)
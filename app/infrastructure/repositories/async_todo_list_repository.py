@@ -0,0 +1,58 @@
+from app.domain.repositories.async_todo_list_repository_interface import (
+    AsyncToDoListRepositoryInterface,
+)
+from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate, ToDoList
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.infrastructure.repositories import queries
+from app.shared.utils.cursor import build_page
+from app.shared.utils.time import get_utc_now
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AsyncToDoListRepository(AsyncToDoListRepositoryInterface):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, data: ToDoListCreate) -> ToDoList:
+        result = await self.db.execute(queries.insert_todo_list(data.model_dump()))
+        row = result.mappings().one()
+        await self.db.commit()
+        return ToDoList(**row)
+
+    async def get_by_id(self, list_id: UUID) -> ToDoList:
+        result = await self.db.execute(queries.todo_list_by_id(list_id))
+        row = result.mappings().first()
+        return ToDoList(**row) if row else None
+
+    async def update(
+        self,
+        list_id: UUID,
+        data: ToDoListUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> ToDoList:
+        values = {**data.model_dump(exclude_unset=True), "updated_at": get_utc_now()}
+        query = queries.update_todo_list(list_id, values, if_match)
+        result = await self.db.execute(query)
+        row = result.mappings().first()
+        await self.db.commit()
+        return ToDoList(**row) if row else None
+
+    # Borrado lógico: el purgador (db/purge.py) borra después las tareas.
+    async def delete(self, list_id: UUID) -> bool:
+        result = await self.db.execute(queries.delete_todo_list(list_id))
+        deleted = result.first()
+        await self.db.commit()
+        return deleted is not None
+
+    async def get_tasks_version(self, list_id: UUID) -> Optional[int]:
+        result = await self.db.execute(queries.todo_list_tasks_version(list_id))
+        return result.scalar()
+
+    async def list_page(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> Page[ToDoList]:
+        result = await self.db.execute(queries.todo_list_page(limit, after))
+        return build_page([ToDoList(**row) for row in result.mappings()], limit)
@@ -0,0 +1,154 @@
+from app.domain.repositories.task_repository_interface import TaskRepositoryInterface
+from app.domain.models.task import (
+    TaskCreate,
+    TaskUpdate,
+    Task,
+    TaskStatus,
+    TaskPriority,
+    TaskProjection,
+    TaskSort,
+    TaskStats,
+    TaskBatchUpdateItem,
+    TaskStatusTransition,
+)
+from app.domain.models.changes import TaskChanges
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.infrastructure.cache.backends import (
+    CacheBackend,
+    get_cache,
+    task_key,
+    todo_list_key,
+)
+from app.infrastructure.db.routing import reads_from_replica
+from datetime import datetime
+from uuid import UUID
+from typing import Iterator, List, Optional, Union
+
+
+# Caché de lectura para get_by_id. Los listados y estadísticas cambian con
+# cualquier escritura de la lista y se leen siempre de la base de datos. Toda
+# escritura invalida además la lista cacheada, que incluye los contadores.
+class CachedTaskRepository(TaskRepositoryInterface):
+    def __init__(
+        self,
+        repository: TaskRepositoryInterface,
+        cache: CacheBackend,
+        fill: bool = True,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.fill = fill
+
+    def create(self, list_id: UUID, data: TaskCreate) -> Optional[Task]:
+        created = self.repository.create(list_id, data)
+        self.cache.delete(todo_list_key(list_id))
+        return created
+
+    def get_by_id(self, list_id: UUID, task_id: UUID) -> Task:
+        key = task_key(list_id, task_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return Task.model_validate_json(cached)
+        task = self.repository.get_by_id(list_id, task_id)
+        if task and self.fill:
+            self.cache.set(key, task.model_dump_json())
+        return task
+
+    def update(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        data: TaskUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task:
+        updated = self.repository.update(list_id, task_id, data, if_match)
+        self.cache.delete(task_key(list_id, task_id), todo_list_key(list_id))
+        return updated
+
+    def delete(self, list_id: UUID, task_id: UUID) -> bool:
+        deleted = self.repository.delete(list_id, task_id)
+        self.cache.delete(task_key(list_id, task_id), todo_list_key(list_id))
+        return deleted
+
+    def list_by_filters(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+    ) -> List[Task]:
+        return self.repository.list_by_filters(list_id, status, priority)
+
+    def list_page_by_filters(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: Optional[TaskSort] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Page[Task], Page[TaskProjection]]:
+        return self.repository.list_page_by_filters(
+            list_id, status, priority, limit, after, sort, fields
+        )
+
+    def list_by_lists(
+        self,
+        list_ids: List[UUID],
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> List[Task]:
+        return self.repository.list_by_lists(list_ids, status, per_list)
+
+    def list_changes(
+        self, list_id: UUID, since: Optional[str], limit: int = DEFAULT_PAGE_SIZE
+    ) -> Optional[TaskChanges]:
+        return self.repository.list_changes(list_id, since, limit)
+
+    def get_stats(self, list_id: UUID) -> TaskStats:
+        return self.repository.get_stats(list_id)
+
+    def create_many(
+        self, list_id: UUID, data: List[TaskCreate]
+    ) -> Optional[List[Task]]:
+        created = self.repository.create_many(list_id, data)
+        self.cache.delete(todo_list_key(list_id))
+        return created
+
+    def update_many(
+        self, list_id: UUID, items: List[TaskBatchUpdateItem]
+    ) -> List[Task]:
+        updated = self.repository.update_many(list_id, items)
+        keys = [task_key(list_id, item.id) for item in items]
+        self.cache.delete(*keys, todo_list_key(list_id))
+        return updated
+
+    def delete_many(self, list_id: UUID, task_ids: List[UUID]) -> List[UUID]:
+        deleted = self.repository.delete_many(list_id, task_ids)
+        keys = [task_key(list_id, task_id) for task_id in deleted]
+        self.cache.delete(*keys, todo_list_key(list_id))
+        return deleted
+
+    def transition_status(
+        self, list_id: UUID, data: TaskStatusTransition
+    ) -> List[UUID]:
+        changed = self.repository.transition_status(list_id, data)
+        keys = [task_key(list_id, task_id) for task_id in changed]
+        self.cache.delete(*keys, todo_list_key(list_id))
+        return changed
+
+    def stream_by_list(self, list_id: UUID, batch_size: int) -> Iterator[Task]:
+        return self.repository.stream_by_list(list_id, batch_size)
+
+    def copy_many(self, list_id: UUID, data: List[TaskCreate]) -> Optional[int]:
+        copied = self.repository.copy_many(list_id, data)
+        self.cache.delete(todo_list_key(list_id))
+        return copied
+
+
+def with_task_cache(repository: TaskRepositoryInterface) -> TaskRepositoryInterface:
+    cache = get_cache()
+    if not cache:
+        return repository
+    fill = not reads_from_replica(getattr(repository, "db", None))
+    return CachedTaskRepository(repository, cache, fill)
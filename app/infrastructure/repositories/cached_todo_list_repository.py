@@ -0,0 +1,81 @@
+from app.domain.repositories.todo_list_repository_interface import (
+    ToDoListRepositoryInterface,
+)
+from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate, ToDoList
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.infrastructure.cache.backends import (
+    CacheBackend,
+    get_cache,
+    tasks_prefix,
+    todo_list_key,
+)
+from app.infrastructure.db.routing import reads_from_replica
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional
+
+
+# Caché de lectura (read-through) para get_by_id, que los casos de uso de
+# tareas llaman en cada petición para comprobar que la lista existe. Las
+# escrituras invalidan la entrada después de confirmarse en la base de datos.
+class CachedToDoListRepository(ToDoListRepositoryInterface):
+    def __init__(
+        self,
+        repository: ToDoListRepositoryInterface,
+        cache: CacheBackend,
+        fill: bool = True,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.fill = fill
+
+    def create(self, data: ToDoListCreate) -> ToDoList:
+        return self.repository.create(data)
+
+    def get_by_id(self, list_id: UUID) -> ToDoList:
+        cached = self.cache.get(todo_list_key(list_id))
+        if cached is not None:
+            return ToDoList.model_validate_json(cached)
+        todo_list = self.repository.get_by_id(list_id)
+        if todo_list and self.fill:
+            self.cache.set(todo_list_key(list_id), todo_list.model_dump_json())
+        return todo_list
+
+    def update(
+        self,
+        list_id: UUID,
+        data: ToDoListUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> ToDoList:
+        updated = self.repository.update(list_id, data, if_match)
+        self.cache.delete(todo_list_key(list_id))
+        return updated
+
+    # Las tareas de una lista borrada dejan de verse: también se invalidan.
+    def delete(self, list_id: UUID) -> bool:
+        deleted = self.repository.delete(list_id)
+        self.cache.delete(todo_list_key(list_id))
+        self.cache.delete_prefix(tasks_prefix(list_id))
+        return deleted
+
+    # Cambia con cada escritura sobre las tareas, así que no se cachea.
+    def get_tasks_version(self, list_id: UUID) -> Optional[int]:
+        return self.repository.get_tasks_version(list_id)
+
+    def list_all(self) -> List[ToDoList]:
+        return self.repository.list_all()
+
+    def list_page(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> Page[ToDoList]:
+        return self.repository.list_page(limit, after)
+
+
+def with_todo_list_cache(
+    repository: ToDoListRepositoryInterface,
+) -> ToDoListRepositoryInterface:
+    cache = get_cache()
+    if not cache:
+        return repository
+    fill = not reads_from_replica(getattr(repository, "db", None))
+    return CachedToDoListRepository(repository, cache, fill)
@@ -0,0 +1,23 @@
+from app.domain.repositories.job_repository_interface import JobRepositoryInterface
+from app.domain.models.job import Job, JobKind
+from app.infrastructure.repositories import queries
+from typing import Any, Dict, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+
+class JobRepository(JobRepositoryInterface):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, list_id: UUID, kind: JobKind, params: Dict[str, Any]) -> Job:
+        query = queries.insert_job(
+            {"todo_list_id": list_id, "kind": kind, "params": params}
+        )
+        row = self.db.execute(query).mappings().one()
+        self.db.commit()
+        return Job(**row)
+
+    def get_by_id(self, job_id: UUID) -> Optional[Job]:
+        row = self.db.execute(queries.job_by_id(job_id)).mappings().first()
+        return Job(**row) if row else None
@@ -0,0 +1,81 @@
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.domain.repositories.task_search_repository_interface import (
+    TaskSearchRepositoryInterface,
+)
+from app.domain.models.task import Task, TaskSearchHit
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.infrastructure.repositories import queries
+from app.infrastructure.search.inverted_index import InvertedIndex
+from app.shared.utils.cursor import build_ranked_page, decode_rank_cursor
+
+
+# Un índice por lista, etiquetado con el tasks_version con el que se construyó:
+# cualquier escritura sobre las tareas incrementa la versión (triggers) y el
+# índice se reconstruye en la siguiente búsqueda.
+class TaskIndexStore:
+    def __init__(self):
+        self._indexes: Dict[UUID, Tuple[int, InvertedIndex]] = {}
+        self._lock = Lock()
+
+    def get(self, list_id: UUID, version: int) -> Optional[InvertedIndex]:
+        entry = self._indexes.get(list_id)
+        return entry[1] if entry and entry[0] == version else None
+
+    def put(self, list_id: UUID, version: int, index: InvertedIndex) -> None:
+        with self._lock:
+            self._indexes[list_id] = (version, index)
+
+    def retain(self, list_ids: Iterable[UUID]) -> None:
+        keep = set(list_ids)
+        with self._lock:
+            for list_id in [key for key in self._indexes if key not in keep]:
+                del self._indexes[list_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+index_store = TaskIndexStore()
+
+
+# Alternativa a la búsqueda de PostgreSQL para pruebas y desarrollo local
+# (SQLite): mismo contrato, resuelto con índices invertidos en memoria.
+class InMemoryTaskSearchRepository(TaskSearchRepositoryInterface):
+    def __init__(self, db: Session, store: TaskIndexStore = index_store):
+        self.db = db
+        self.store = store
+
+    def _index(self, list_id: UUID, version: int) -> InvertedIndex:
+        index = self.store.get(list_id, version)
+        if index is None:
+            rows = self.db.execute(queries.tasks_in_list(list_id)).mappings()
+            index = InvertedIndex([Task(**row) for row in rows])
+            self.store.put(list_id, version, index)
+        return index
+
+    def search(
+        self,
+        text: str,
+        list_id: Optional[UUID] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Page[TaskSearchHit]:
+        versions = self.db.execute(queries.todo_list_versions(list_id)).all()
+        if list_id is None:
+            self.store.retain(key for key, _ in versions)
+        hits = []
+        for key, version in versions:
+            hits.extend(self._index(key, version).search(text))
+        hits.sort(key=lambda hit: (-hit.rank, hit.id))
+        if after:
+            last_rank, last_id = decode_rank_cursor(after)
+            hits = [
+                hit
+                for hit in hits
+                if hit.rank < last_rank or (hit.rank == last_rank and hit.id > last_id)
+            ]
+        return build_ranked_page(hits[: limit + 1], limit)
@@ -0,0 +1,643 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import Delete, Insert, Select, Update, delete, func, insert, select
+from sqlalchemy import Float, and_, bindparam, cast, exists, literal, literal_column
+from sqlalchemy import false, null, or_, true, tuple_, union_all, update
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from app.domain.models.job import JobStatus
+from app.domain.models.task import TaskStatus, TaskPriority, TaskSort, TaskSortField
+from app.domain.models.task import TaskStatusTransition
+from app.infrastructure.db.models import JobORM, TaskORM, TaskTombstoneORM, ToDoListORM
+from app.infrastructure.db.search_index import SEARCH_CONFIG
+from app.shared.utils.cursor import decode_cursor, decode_rank_cursor
+from app.shared.utils.search import prefix_tsquery
+from app.shared.utils.sorting import decode_sort_cursor
+from app.shared.utils.time import get_utc_now
+
+
+# Sentencias compartidas por los repositorios síncronos y asíncronos: solo
+# cambia cómo se ejecutan (Session.execute frente a AsyncSession.execute).
+# Las escrituras operan sobre la tabla (Core) con RETURNING, de modo que cada
+# una cuesta un único round trip y el "no encontrado" sale del número de filas.
+tasks = TaskORM.__table__
+todo_lists = ToDoListORM.__table__
+task_tombstones = TaskTombstoneORM.__table__
+jobs = JobORM.__table__
+# Columna generada que solo existe en PostgreSQL (ver search_index.py).
+search_vector = literal_column("tasks.search_vector", TSVECTOR)
+# Las listas borradas (deleted_at) y sus tareas dejan de verse antes de purgarse.
+live_todo_lists = todo_lists.c.deleted_at.is_(None)
+
+
+# list_id es un UUID (subconsulta sin correlación, que PostgreSQL evalúa una
+# sola vez por sentencia con la clave primaria) o tasks.c.todo_list_id.
+def _in_live_list(list_id: Any) -> Any:
+    return exists().where(todo_lists.c.id == list_id, live_todo_lists)
+
+
+# Las inserciones comprueban en la propia sentencia que la lista sigue viva:
+# la comprobación previa del caso de uso puede venir de la caché. Sin lista no
+# se inserta ninguna fila.
+def insert_task(list_id: UUID, values: Dict[str, Any]) -> Insert:
+    values = {**values, "todo_list_id": list_id}
+    row = select(
+        *(literal(value, tasks.c[name].type) for name, value in values.items())
+    ).where(_in_live_list(list_id))
+    return insert(tasks).from_select(list(values), row).returning(*tasks.c)
+
+
+# if_match (de la cabecera If-Match) limita la escritura a las versiones
+# esperadas: si otra petición la modificó antes, no se actualiza ninguna fila.
+def update_task(
+    list_id: UUID,
+    task_id: UUID,
+    values: Dict[str, Any],
+    if_match: Optional[List[datetime]] = None,
+) -> Update:
+    query = update(tasks).where(
+        tasks.c.todo_list_id == list_id, tasks.c.id == task_id, _in_live_list(list_id)
+    )
+    if if_match is not None:
+        query = query.where(tasks.c.updated_at.in_(if_match))
+    return query.values(**values).returning(*tasks.c)
+
+
+def delete_task(list_id: UUID, task_id: UUID) -> Delete:
+    return (
+        delete(tasks)
+        .where(
+            tasks.c.todo_list_id == list_id,
+            tasks.c.id == task_id,
+            _in_live_list(list_id),
+        )
+        .returning(tasks.c.id)
+    )
+
+
+# Se ejecuta con una lista de parámetros: SQLAlchemy la envía como INSERT
+# multi-fila (insertmanyvalues) en páginas de 1000 filas, compilando la
+# sentencia una sola vez en lugar de una vez por lote como con values([...]).
+def insert_tasks() -> Insert:
+    return insert(tasks).returning(*tasks.c)
+
+
+# Bloquea la fila de la lista si sigue viva (None si no). Va antes de las
+# inserciones por lotes y de COPY, que no admiten una condición propia: el
+# borrado lógico espera a que la carga termine. FOR NO KEY UPDATE y no FOR
+# SHARE: los triggers de tareas toman ese mismo bloqueo sobre la lista, y dos
+# cargas que compartieran FOR SHARE se esperarían mutuamente (deadlock); así la
+# segunda espera a que termine la primera.
+def lock_live_todo_list(list_id: UUID) -> Select:
+    return (
+        select(todo_lists.c.id)
+        .where(todo_lists.c.id == list_id, live_todo_lists)
+        .with_for_update(key_share=True)
+    )
+
+
+LOAD_COLUMNS = (
+    "id",
+    "todo_list_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+)
+
+
+# Variante sin RETURNING para la importación en motores sin COPY y para la
+# duplicación de listas. Se ejecuta con una lista de parámetros (LOAD_COLUMNS);
+# las filas de una lista borrada no se insertan.
+def load_tasks() -> Insert:
+    params = {name: bindparam(name, type_=tasks.c[name].type) for name in LOAD_COLUMNS}
+    row = select(*params.values()).where(_in_live_list(params["todo_list_id"]))
+    return insert(tasks).from_select(list(LOAD_COLUMNS), row)
+
+
+# Se ejecuta en modo executemany: cada conjunto de parámetros trae "_id" y las
+# columnas a modificar, que deben ser las mismas en todo el lote.
+def update_tasks_by_id(list_id: UUID) -> Update:
+    return update(tasks).where(
+        tasks.c.todo_list_id == list_id,
+        tasks.c.id == bindparam("_id"),
+        _in_live_list(list_id),
+    )
+
+
+def delete_tasks(list_id: UUID, task_ids: Iterable[UUID]) -> Delete:
+    return (
+        delete(tasks)
+        .where(
+            tasks.c.todo_list_id == list_id,
+            tasks.c.id.in_(task_ids),
+            _in_live_list(list_id),
+        )
+        .returning(tasks.c.id)
+    )
+
+
+# Cambio de estado masivo en una sola sentencia, sin leer antes las tareas.
+# Las que ya tienen el estado de destino se excluyen: no se reescriben ni
+# cuentan como cambiadas. El filtro por estado y prioridad usa el índice
+# (todo_list_id, status, priority).
+def transition_task_status(list_id: UUID, data: TaskStatusTransition) -> Update:
+    source = data.source
+    query = update(tasks).where(
+        tasks.c.todo_list_id == list_id,
+        tasks.c.status != data.target,
+        _in_live_list(list_id),
+    )
+    if source.status:
+        query = query.where(tasks.c.status.in_(source.status))
+    if source.priority:
+        query = query.where(tasks.c.priority.in_(source.priority))
+    if source.ids is not None:
+        query = query.where(tasks.c.id.in_(source.ids))
+    return query.values(status=data.target, updated_at=get_utc_now()).returning(
+        tasks.c.id
+    )
+
+
+def task_ids(list_id: UUID, task_ids: Iterable[UUID]) -> Select:
+    return select(tasks.c.id).where(
+        tasks.c.todo_list_id == list_id,
+        tasks.c.id.in_(task_ids),
+        _in_live_list(list_id),
+    )
+
+
+def tasks_by_ids(list_id: UUID, task_ids: Iterable[UUID]) -> Select:
+    return select(tasks).where(
+        tasks.c.todo_list_id == list_id,
+        tasks.c.id.in_(task_ids),
+        _in_live_list(list_id),
+    )
+
+
+def insert_todo_list(values: Dict[str, Any]) -> Insert:
+    return insert(todo_lists).values(**values).returning(*todo_lists.c)
+
+
+def update_todo_list(
+    list_id: UUID, values: Dict[str, Any], if_match: Optional[List[datetime]] = None
+) -> Update:
+    query = update(todo_lists).where(todo_lists.c.id == list_id, live_todo_lists)
+    if if_match is not None:
+        query = query.where(todo_lists.c.updated_at.in_(if_match))
+    return query.values(**values).returning(*todo_lists.c)
+
+
+# Borrado lógico: un UPDATE de una fila, sin tocar las tareas. La purga en
+# segundo plano (db/purge.py) las borra después por lotes.
+def delete_todo_list(list_id: UUID) -> Update:
+    return (
+        update(todo_lists)
+        .where(todo_lists.c.id == list_id, live_todo_lists)
+        .values(deleted_at=get_utc_now(), updated_at=todo_lists.c.updated_at)
+        .returning(todo_lists.c.id)
+    )
+
+
+# Las lecturas también seleccionan sobre la tabla: las filas se convierten en
+# modelos de dominio sin pasar por la hidratación de objetos del ORM.
+def task_by_id(list_id: UUID, task_id: UUID) -> Select:
+    return select(tasks).where(
+        tasks.c.todo_list_id == list_id, tasks.c.id == task_id, _in_live_list(list_id)
+    )
+
+
+# Con columns solo se leen esas columnas (parámetro fields de los listados):
+# la descripción, la más pesada, no sale de la base si no se pide.
+def tasks_by_filters(
+    list_id: UUID,
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+    columns: Optional[List[str]] = None,
+) -> Select:
+    selected = [tasks.c[name] for name in columns] if columns else [tasks]
+    query = select(*selected).where(
+        tasks.c.todo_list_id == list_id, _in_live_list(list_id)
+    )
+    if status:
+        query = query.where(tasks.c.status == status)
+    if priority:
+        query = query.where(tasks.c.priority == priority)
+    return query
+
+
+def task_page(
+    list_id: UUID,
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+    limit: int,
+    after: Optional[str],
+    columns: Optional[List[str]] = None,
+) -> Select:
+    query = tasks_by_filters(list_id, status, priority, columns)
+    if after:
+        created_at, task_id = decode_cursor(after)
+        query = query.where(
+            tuple_(tasks.c.created_at, tasks.c.id) > tuple_(created_at, task_id)
+        )
+    return query.order_by(tasks.c.created_at, tasks.c.id).limit(limit + 1)
+
+
+SORT_COLUMNS = {
+    TaskSortField.PRIORITY: tasks.c.priority_rank,
+    TaskSortField.CREATED_AT: tasks.c.created_at,
+    TaskSortField.UPDATED_AT: tasks.c.updated_at,
+    TaskSortField.TITLE: tasks.c.title,
+}
+
+
+# Elementos posteriores al cursor en un orden con sentidos mezclados:
+# (a > x) OR (a = x AND b < y) OR ... Si todas las claves van en el mismo
+# sentido basta con una comparación de filas, que PostgreSQL usa como límite
+# del recorrido del índice.
+def _after_keys(keys: List, values: List) -> Any:
+    if len({descending for _, descending in keys}) == 1:
+        columns = tuple_(*(column for column, _ in keys))
+        if keys[0][1]:
+            return columns < tuple_(*values)
+        return columns > tuple_(*values)
+    conditions = []
+    for i, ((column, descending), value) in enumerate(zip(keys, values)):
+        equal = [prev == prev_value for (prev, _), prev_value in zip(keys, values[:i])]
+        conditions.append(
+            and_(*equal, column < value if descending else column > value)
+        )
+    return or_(*conditions)
+
+
+# Orden explícito del listado. El id desempata en el sentido de la última
+# clave, de modo que los órdenes de una sola clave coinciden (directamente o
+# hacia atrás) con los índices (todo_list_id, <clave>, id).
+def sorted_task_page(
+    list_id: UUID,
+    status: Optional[TaskStatus],
+    priority: Optional[TaskPriority],
+    sort: TaskSort,
+    limit: int,
+    after: Optional[str],
+    columns: Optional[List[str]] = None,
+) -> Select:
+    keys = [(SORT_COLUMNS[field], descending) for field, descending in sort]
+    keys.append((tasks.c.id, sort[-1][1]))
+    query = tasks_by_filters(list_id, status, priority, columns)
+    if after:
+        values, task_id = decode_sort_cursor(after, sort)
+        query = query.where(_after_keys(keys, values + [task_id]))
+    order = [column.desc() if descending else column for column, descending in keys]
+    return query.order_by(*order).limit(limit + 1)
+
+
+def tasks_in_list(list_id: UUID) -> Select:
+    return (
+        select(tasks)
+        .where(tasks.c.todo_list_id == list_id, _in_live_list(list_id))
+        .order_by(tasks.c.created_at, tasks.c.id)
+    )
+
+
+# Las primeras per_list tareas de cada lista en una sola consulta. PostgreSQL
+# usa un LATERAL JOIN: un recorrido acotado del índice (todo_list_id,
+# created_at, id) por lista. Los demás motores numeran las filas con
+# ROW_NUMBER() y descartan las que sobran.
+def tasks_for_lists(
+    list_ids: Iterable[UUID],
+    status: Optional[TaskStatus],
+    per_list: int,
+    lateral: bool,
+) -> Select:
+    if lateral:
+        first = select(tasks).where(tasks.c.todo_list_id == todo_lists.c.id)
+        if status:
+            first = first.where(tasks.c.status == status)
+        first = first.order_by(tasks.c.created_at, tasks.c.id).limit(per_list)
+        first = first.lateral()
+        return (
+            select(first)
+            .select_from(todo_lists.join(first, true()))
+            .where(todo_lists.c.id.in_(list_ids))
+            .order_by(first.c.todo_list_id, first.c.created_at, first.c.id)
+        )
+    position = func.row_number().over(
+        partition_by=tasks.c.todo_list_id, order_by=(tasks.c.created_at, tasks.c.id)
+    )
+    numbered = select(tasks, position.label("position")).where(
+        tasks.c.todo_list_id.in_(list_ids)
+    )
+    if status:
+        numbered = numbered.where(tasks.c.status == status)
+    numbered = numbered.subquery()
+    return (
+        select(*(numbered.c[column.name] for column in tasks.c))
+        .where(numbered.c.position <= per_list)
+        .order_by(numbered.c.todo_list_id, numbered.c.created_at, numbered.c.id)
+    )
+
+
+# Feed de cambios: tareas vivas y lápidas posteriores a after = (change_version,
+# id), en una sola sentencia para que ambas salgan de la misma instantánea (con
+# dos consultas, un cambio confirmado entre ambas podría quedar detrás del
+# token devuelto). Cada rama recorre su índice (todo_list_id, change_version)
+# y se corta en limit + 1 antes de mezclarlas; las lápidas rellenan con NULL
+# las columnas que no tienen.
+def task_changes(
+    list_id: UUID, after: Optional[Tuple[int, UUID]], limit: int
+) -> Select:
+    live = select(*tasks.c, false().label("deleted")).where(
+        tasks.c.todo_list_id == list_id
+    )
+    gone_columns = {
+        "id": task_tombstones.c.task_id,
+        "todo_list_id": task_tombstones.c.todo_list_id,
+        "change_version": task_tombstones.c.change_version,
+    }
+    gone = select(
+        *(
+            gone_columns.get(column.name, cast(null(), column.type)).label(column.name)
+            for column in tasks.c
+        ),
+        true().label("deleted"),
+    ).where(task_tombstones.c.todo_list_id == list_id)
+    if after:
+        live = live.where(tuple_(tasks.c.change_version, tasks.c.id) > tuple_(*after))
+        gone = gone.where(
+            tuple_(task_tombstones.c.change_version, task_tombstones.c.task_id)
+            > tuple_(*after)
+        )
+    live = live.order_by(tasks.c.change_version, tasks.c.id).limit(limit + 1)
+    gone = gone.order_by(
+        task_tombstones.c.change_version, task_tombstones.c.task_id
+    ).limit(limit + 1)
+    changes = union_all(select(live.subquery()), select(gone.subquery())).subquery()
+    return (
+        select(changes)
+        .order_by(changes.c.change_version, changes.c.id)
+        .limit(limit + 1)
+    )
+
+
+def task_stats(list_id: UUID) -> Select:
+    return (
+        select(tasks.c.status, tasks.c.priority, func.count())
+        .where(tasks.c.todo_list_id == list_id, _in_live_list(list_id))
+        .group_by(tasks.c.status, tasks.c.priority)
+    )
+
+
+def todo_list_by_id(list_id: UUID) -> Select:
+    return select(todo_lists).where(todo_lists.c.id == list_id, live_todo_lists)
+
+
+def all_todo_lists() -> Select:
+    return select(todo_lists).where(live_todo_lists)
+
+
+def todo_list_tasks_version(list_id: UUID) -> Select:
+    return select(todo_lists.c.tasks_version).where(
+        todo_lists.c.id == list_id, live_todo_lists
+    )
+
+
+def todo_list_versions(list_id: Optional[UUID] = None) -> Select:
+    query = select(todo_lists.c.id, todo_lists.c.tasks_version).where(live_todo_lists)
+    if list_id:
+        query = query.where(todo_lists.c.id == list_id)
+    return query
+
+
+# Coincide una tarea si contiene todos los términos como prefijo (índice GIN
+# sobre search_vector) o si su título se parece al texto buscado (índice de
+# trigramas); PostgreSQL combina ambos índices con un BitmapOr. La relevancia
+# suma las dos puntuaciones y se convierte a double precision para que el
+# cursor la reproduzca exactamente.
+def search_tasks(
+    text: str, list_id: Optional[UUID], limit: int, after: Optional[str]
+) -> Select:
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    ts_query = func.to_tsquery(config, prefix_tsquery(text))
+    rank = func.ts_rank(search_vector, ts_query) + func.word_similarity(
+        text, tasks.c.title
+    )
+    matches = or_(
+        search_vector.op("@@")(ts_query), literal(text).op("<%")(tasks.c.title)
+    )
+    ranked = select(tasks, cast(rank, Float).label("rank")).where(
+        matches, _in_live_list(list_id or tasks.c.todo_list_id)
+    )
+    if list_id:
+        ranked = ranked.where(tasks.c.todo_list_id == list_id)
+    ranked = ranked.subquery()
+    query = select(ranked)
+    if after:
+        last_rank, last_id = decode_rank_cursor(after)
+        query = query.where(
+            or_(
+                ranked.c.rank < last_rank,
+                and_(ranked.c.rank == last_rank, ranked.c.id > last_id),
+            )
+        )
+    return query.order_by(ranked.c.rank.desc(), ranked.c.id).limit(limit + 1)
+
+
+def todo_list_ids(after: Optional[UUID], limit: int) -> Select:
+    query = select(todo_lists.c.id).order_by(todo_lists.c.id).limit(limit)
+    if after:
+        query = query.where(todo_lists.c.id > after)
+    return query
+
+
+# Bloquea las listas antes de recontar: una escritura concurrente sobre sus
+# tareas espera en su trigger y suma después sobre el valor corregido.
+def lock_todo_lists(list_ids: Iterable[UUID]) -> Select:
+    return (
+        select(todo_lists.c.id)
+        .where(todo_lists.c.id.in_(list_ids))
+        .order_by(todo_lists.c.id)
+        .with_for_update()
+    )
+
+
+def _count_tasks(status: Optional[TaskStatus] = None):
+    query = select(func.count()).where(tasks.c.todo_list_id == todo_lists.c.id)
+    if status:
+        query = query.where(tasks.c.status == status)
+    return query.scalar_subquery()
+
+
+# Recalcula los contadores desde tasks y solo reescribe las listas que no
+# cuadran; RETURNING devuelve las que se han corregido. updated_at se fija a
+# sí mismo para que el onupdate del modelo no cuente la reparación como edición.
+def repair_task_counts(list_ids: Iterable[UUID]) -> Update:
+    counts = {
+        todo_lists.c.total_tasks: _count_tasks(),
+        todo_lists.c.pending_tasks: _count_tasks(TaskStatus.PENDING),
+        todo_lists.c.in_progress_tasks: _count_tasks(TaskStatus.IN_PROGRESS),
+        todo_lists.c.completed_tasks: _count_tasks(TaskStatus.COMPLETED),
+    }
+    return (
+        update(todo_lists)
+        .where(
+            todo_lists.c.id.in_(list_ids),
+            or_(*(column != count for column, count in counts.items())),
+        )
+        .values(
+            {column.name: count for column, count in counts.items()}
+            | {"updated_at": todo_lists.c.updated_at}
+        )
+        .returning(todo_lists.c.id)
+    )
+
+
+def todo_list_page(limit: int, after: Optional[str]) -> Select:
+    query = select(todo_lists).where(live_todo_lists)
+    if after:
+        created_at, list_id = decode_cursor(after)
+        query = query.where(
+            tuple_(todo_lists.c.created_at, todo_lists.c.id)
+            > tuple_(created_at, list_id)
+        )
+    return query.order_by(todo_lists.c.created_at, todo_lists.c.id).limit(limit + 1)
+
+
+# Purga de listas borradas. Cada lote toma la lista pendiente más antigua con
+# SKIP LOCKED: varios purgadores (uno por proceso) se reparten las listas en
+# lugar de esperarse entre sí.
+def next_purge() -> Select:
+    return (
+        select(todo_lists.c.id)
+        .where(todo_lists.c.deleted_at.is_not(None))
+        .order_by(todo_lists.c.deleted_at, todo_lists.c.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+
+
+# Lotes acotados por el índice (todo_list_id, ...): cada sentencia borra como
+# mucho limit filas y los triggers por sentencia agregan el lote de una vez.
+def purge_tasks(list_id: UUID, limit: int) -> Delete:
+    batch = select(tasks.c.id).where(tasks.c.todo_list_id == list_id).limit(limit)
+    return delete(tasks).where(tasks.c.id.in_(batch))
+
+
+def purge_tombstones(list_id: UUID, limit: int) -> Delete:
+    batch = (
+        select(task_tombstones.c.task_id)
+        .where(task_tombstones.c.todo_list_id == list_id)
+        .limit(limit)
+    )
+    return delete(task_tombstones).where(task_tombstones.c.task_id.in_(batch))
+
+
+def purge_todo_list(list_id: UUID) -> Delete:
+    return delete(todo_lists).where(
+        todo_lists.c.id == list_id, todo_lists.c.deleted_at.is_not(None)
+    )
+
+
+# Los contadores de la lista siguen al día durante la purga: total_tasks es
+# lo que queda por borrar.
+def pending_purges(limit: int) -> Select:
+    return (
+        select(
+            todo_lists.c.id,
+            todo_lists.c.deleted_at,
+            todo_lists.c.total_tasks.label("remaining_tasks"),
+        )
+        .where(todo_lists.c.deleted_at.is_not(None))
+        .order_by(todo_lists.c.deleted_at, todo_lists.c.id)
+        .limit(limit)
+    )
+
+
+def _status_change_filter(
+    list_id: UUID, status: TaskStatus, from_status: Optional[TaskStatus]
+) -> List:
+    conditions = [tasks.c.todo_list_id == list_id, tasks.c.status != status]
+    if from_status:
+        conditions.append(tasks.c.status == from_status)
+    return conditions
+
+
+def count_status_change(
+    list_id: UUID, status: TaskStatus, from_status: Optional[TaskStatus]
+) -> Select:
+    return select(func.count()).where(
+        *_status_change_filter(list_id, status, from_status), _in_live_list(list_id)
+    )
+
+
+# Un lote del cambio de estado masivo: como mucho limit tareas que aún no
+# tienen el estado de destino, así que repetir un lote no vuelve a tocarlas.
+def change_status_batch(
+    list_id: UUID, status: TaskStatus, from_status: Optional[TaskStatus], limit: int
+) -> Update:
+    batch = (
+        select(tasks.c.id)
+        .where(*_status_change_filter(list_id, status, from_status))
+        .limit(limit)
+    )
+    return (
+        update(tasks)
+        .where(tasks.c.id.in_(batch), _in_live_list(list_id))
+        .values(status=status, updated_at=get_utc_now())
+        .returning(tasks.c.id)
+    )
+
+
+def insert_job(values: Dict[str, Any]) -> Insert:
+    return insert(jobs).values(**values).returning(*jobs.c)
+
+
+def job_by_id(job_id: UUID) -> Select:
+    return select(jobs).where(jobs.c.id == job_id)
+
+
+# Reclama en un solo UPDATE el trabajo en cola más antiguo, o uno en curso
+# cuyo worker ha dejado de dar señales (heartbeat_at anterior a stale_before).
+# SKIP LOCKED reparte los trabajos entre workers sin que se esperen entre sí;
+# attempts identifica al dueño actual en las escrituras siguientes.
+def claim_job(stale_before: datetime) -> Update:
+    claimable = or_(
+        jobs.c.status == JobStatus.QUEUED,
+        and_(jobs.c.status == JobStatus.RUNNING, jobs.c.heartbeat_at < stale_before),
+    )
+    candidate = (
+        select(jobs.c.id)
+        .where(claimable)
+        .order_by(jobs.c.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    now = get_utc_now()
+    return (
+        update(jobs)
+        .where(jobs.c.id == candidate)
+        .values(
+            status=JobStatus.RUNNING,
+            attempts=jobs.c.attempts + 1,
+            started_at=func.coalesce(jobs.c.started_at, now),
+            heartbeat_at=now,
+        )
+        .returning(*jobs.c)
+    )
+
+
+# Solo escribe si el trabajo sigue siendo de este intento: si otro worker lo
+# ha reclamado por inactivo, no se actualiza ninguna fila.
+def save_job(job_id: UUID, attempt: int, values: Dict[str, Any]) -> Update:
+    return (
+        update(jobs)
+        .where(
+            jobs.c.id == job_id,
+            jobs.c.attempts == attempt,
+            jobs.c.status == JobStatus.RUNNING,
+        )
+        .values(**values, heartbeat_at=get_utc_now())
+    )
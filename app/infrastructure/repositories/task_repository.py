@@ -1,3 +1,5 @@
+import csv
+import io
 from app.domain.repositories.task_repository_interface import TaskRepositoryInterface
 from app.domain.models.task import (
     TaskCreate,
@@ -5,61 +7,100 @@ from app.domain.models.task import (
     Task,
     TaskStatus,
     TaskPriority,
+    TaskProjection,
+    TaskSort,
+    TaskStats,
+    TaskBatchUpdateItem,
+    TaskStatusTransition,
 )
-from app.infrastructure.db.models import TaskORM
+from app.domain.models.changes import TaskChanges
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.domain.models.todo_list import ToDoList
+from app.infrastructure.repositories import queries
+from app.shared.utils.cursor import build_page, decode_sync_token, encode_sync_token
+from app.shared.utils.projection import projection_columns
+from app.shared.utils.sorting import build_sorted_page
 from app.shared.utils.time import get_utc_now
-from uuid import UUID
-from typing import List, Optional
+from datetime import datetime
+from itertools import groupby
+from uuid import UUID, uuid4
+from typing import Iterator, List, Optional, Union
 from sqlalchemy.orm import Session
 
 
+COPY_COLUMNS = (
+    "id",
+    "todo_list_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+)
+
+
+# COPY no pasa por los tipos de SQLAlchemy: los enums se escriben por nombre,
+# que es como los guarda la columna Enum, y None sale como campo vacío (NULL).
+def _copy_rows(connection, rows: List[dict]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(
+            [
+                row["id"],
+                row["todo_list_id"],
+                row["title"],
+                row["description"],
+                row["status"].name,
+                row["priority"].name,
+                row["created_at"].isoformat(),
+                row["updated_at"].isoformat(),
+            ]
+        )
+    buffer.seek(0)
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY tasks ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
 class TaskRepository(TaskRepositoryInterface):
     def __init__(self, db: Session):
         self.db = db
 
-    def create(self, list_id: UUID, data: TaskCreate) -> Task:
-        db_obj = TaskORM(**data.model_dump(), todo_list_id=list_id)
-        db_obj.created_at = get_utc_now()
-        db_obj.updated_at = get_utc_now()
-        self.db.add(db_obj)
+    def create(self, list_id: UUID, data: TaskCreate) -> Optional[Task]:
+        now = get_utc_now()
+        values = {**data.model_dump(), "created_at": now, "updated_at": now}
+        row = self.db.execute(queries.insert_task(list_id, values)).mappings().first()
         self.db.commit()
-        self.db.refresh(db_obj)
-        return Task(**db_obj.__dict__)
+        return Task(**row) if row else None
 
     def get_by_id(self, list_id: UUID, task_id: UUID) -> Task:
-        obj = (
-            self.db.query(TaskORM)
-            .filter(TaskORM.todo_list_id == list_id, TaskORM.id == task_id)
-            .first()
-        )
-        return Task(**obj.__dict__) if obj else None
+        row = self.db.execute(queries.task_by_id(list_id, task_id)).mappings().first()
+        return Task(**row) if row else None
 
-    def update(self, list_id: UUID, task_id: UUID, data: TaskUpdate) -> Task:
-        obj = (
-            self.db.query(TaskORM)
-            .filter(TaskORM.todo_list_id == list_id, TaskORM.id == task_id)
-            .first()
-        )
-        if not obj:
-            return None
-        for key, value in data.model_dump(exclude_unset=True).items():
-            setattr(obj, key, value)
-        obj.updated_at = get_utc_now()
+    def update(
+        self,
+        list_id: UUID,
+        task_id: UUID,
+        data: TaskUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> Task:
+        values = {**data.model_dump(exclude_unset=True), "updated_at": get_utc_now()}
+        query = queries.update_task(list_id, task_id, values, if_match)
+        row = self.db.execute(query).mappings().first()
         self.db.commit()
-        self.db.refresh(obj)
-        return Task(**obj.__dict__)
+        return Task(**row) if row else None
 
     def delete(self, list_id: UUID, task_id: UUID) -> bool:
-        obj = (
-            self.db.query(TaskORM)
-            .filter(TaskORM.todo_list_id == list_id, TaskORM.id == task_id)
-            .first()
-        )
-        if not obj:
-            return False
-        self.db.delete(obj)
+        deleted = self.db.execute(queries.delete_task(list_id, task_id)).first()
         self.db.commit()
-        return True
+        return deleted is not None
 
     def list_by_filters(
         self,
@@ -67,10 +108,163 @@ class TaskRepository(TaskRepositoryInterface):
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
     ) -> List[Task]:
-        query = self.db.query(TaskORM).filter(TaskORM.todo_list_id == list_id)
-        if status:
-            query = query.filter(TaskORM.status == status)
-        if priority:
-            query = query.filter(TaskORM.priority == priority)
-        objs = query.all()
-        return [Task(**obj.__dict__) for obj in objs]
+        query = queries.tasks_by_filters(list_id, status, priority)
+        return [Task(**row) for row in self.db.execute(query).mappings()]
+
+    def list_page_by_filters(
+        self,
+        list_id: UUID,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        sort: Optional[TaskSort] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Union[Page[Task], Page[TaskProjection]]:
+        columns = projection_columns(fields, sort) if fields else None
+        model = TaskProjection if fields else Task
+        if sort is None:
+            query = queries.task_page(list_id, status, priority, limit, after, columns)
+            rows = self.db.execute(query).mappings()
+            return build_page([model(**row) for row in rows], limit)
+        query = queries.sorted_task_page(
+            list_id, status, priority, sort, limit, after, columns
+        )
+        rows = self.db.execute(query).mappings()
+        return build_sorted_page([model(**row) for row in rows], limit, sort)
+
+    def list_by_lists(
+        self,
+        list_ids: List[UUID],
+        status: Optional[TaskStatus] = None,
+        per_list: int = DEFAULT_PAGE_SIZE,
+    ) -> List[Task]:
+        # db.bind y no get_bind(): sin sentencia, RoutingSession fijaría la
+        # sesión al primario y esta lectura dejaría de ir a la réplica.
+        lateral = self.db.bind.dialect.name == "postgresql"
+        query = queries.tasks_for_lists(list_ids, status, per_list, lateral)
+        return [Task(**row) for row in self.db.execute(query).mappings()]
+
+    # La lista se lee antes que los cambios. Como sus escrituras y las de sus
+    # tareas se serializan sobre su fila (ver triggers.py), todo cambio con una
+    # versión menor que la suya ya es visible: al llegar al final, el token
+    # avanza hasta la versión de la lista.
+    def list_changes(
+        self, list_id: UUID, since: Optional[str], limit: int = DEFAULT_PAGE_SIZE
+    ) -> Optional[TaskChanges]:
+        after = decode_sync_token(since) if since else None
+        todo_list = self.db.execute(queries.todo_list_by_id(list_id)).mappings().first()
+        if not todo_list:
+            return None
+        query = queries.task_changes(list_id, after, limit)
+        rows = self.db.execute(query).mappings().all()
+        page = rows[:limit]
+        last = after or (0, UUID(int=0))
+        if page:
+            last = (page[-1]["change_version"], page[-1]["id"])
+        if len(rows) <= limit and todo_list["change_version"] > last[0]:
+            last = (todo_list["change_version"], UUID(int=0))
+        changed = after is None or todo_list["change_version"] > after[0]
+        return TaskChanges(
+            todo_list=ToDoList(**todo_list) if changed else None,
+            upserted=[Task(**row) for row in page if not row["deleted"]],
+            deleted=[row["id"] for row in page if row["deleted"]],
+            next_token=encode_sync_token(*last),
+            has_more=len(rows) > limit,
+        )
+
+    def get_stats(self, list_id: UUID) -> TaskStats:
+        counts = self.db.execute(queries.task_stats(list_id)).all()
+        return TaskStats.from_counts(counts)
+
+    def create_many(
+        self, list_id: UUID, data: List[TaskCreate]
+    ) -> Optional[List[Task]]:
+        now = get_utc_now()
+        rows = [
+            {
+                **item.model_dump(),
+                "todo_list_id": list_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for item in data
+        ]
+        if self.db.execute(queries.lock_live_todo_list(list_id)).first() is None:
+            self.db.rollback()
+            return None
+        result = self.db.execute(queries.insert_tasks(), rows)
+        created = [Task(**row) for row in result.mappings()]
+        self.db.commit()
+        return created
+
+    def update_many(
+        self, list_id: UUID, items: List[TaskBatchUpdateItem]
+    ) -> List[Task]:
+        ids = [item.id for item in items]
+        existing = set(self.db.execute(queries.task_ids(list_id, ids)).scalars())
+        now = get_utc_now()
+        params = [
+            {
+                **item.model_dump(exclude_unset=True, exclude={"id"}),
+                "updated_at": now,
+                "_id": item.id,
+            }
+            for item in items
+            if item.id in existing
+        ]
+        # Un executemany por cada combinación de columnas modificadas.
+        params.sort(key=lambda row: sorted(row))
+        for _, group in groupby(params, key=lambda row: sorted(row)):
+            self.db.execute(queries.update_tasks_by_id(list_id), list(group))
+        result = self.db.execute(queries.tasks_by_ids(list_id, existing))
+        updated = [Task(**row) for row in result.mappings()]
+        self.db.commit()
+        return updated
+
+    def delete_many(self, list_id: UUID, task_ids: List[UUID]) -> List[UUID]:
+        deleted = self.db.execute(queries.delete_tasks(list_id, task_ids)).scalars()
+        deleted = list(deleted)
+        self.db.commit()
+        return deleted
+
+    def transition_status(
+        self, list_id: UUID, data: TaskStatusTransition
+    ) -> List[UUID]:
+        query = queries.transition_task_status(list_id, data)
+        changed = list(self.db.execute(query).scalars())
+        self.db.commit()
+        return changed
+
+    # yield_per activa un cursor de servidor (stream_results): se leen
+    # batch_size filas por viaje y nunca se materializa la lista completa.
+    def stream_by_list(self, list_id: UUID, batch_size: int) -> Iterator[Task]:
+        query = queries.tasks_in_list(list_id).execution_options(yield_per=batch_size)
+        for row in self.db.execute(query).mappings():
+            yield Task(**row)
+
+    # Carga un bloque de la importación con COPY FROM STDIN en PostgreSQL (un
+    # único viaje y sin construir objetos del ORM); otros motores usan un
+    # INSERT executemany. Cada bloque se confirma por separado.
+    def copy_many(self, list_id: UUID, data: List[TaskCreate]) -> Optional[int]:
+        now = get_utc_now()
+        rows = [
+            {
+                **item.model_dump(),
+                "id": uuid4(),
+                "todo_list_id": list_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for item in data
+        ]
+        connection = self.db.connection()
+        if connection.execute(queries.lock_live_todo_list(list_id)).first() is None:
+            self.db.rollback()
+            return None
+        if connection.dialect.name == "postgresql":
+            _copy_rows(connection, rows)
+        else:
+            connection.execute(queries.load_tasks(), rows)
+        self.db.commit()
+        return len(rows)
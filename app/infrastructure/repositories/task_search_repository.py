@@ -0,0 +1,27 @@
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.domain.repositories.task_search_repository_interface import (
+    TaskSearchRepositoryInterface,
+)
+from app.domain.models.task import TaskSearchHit
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.infrastructure.repositories import queries
+from app.shared.utils.cursor import build_ranked_page
+
+
+# Búsqueda en PostgreSQL sobre search_vector y el índice de trigramas.
+class TaskSearchRepository(TaskSearchRepositoryInterface):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        text: str,
+        list_id: Optional[UUID] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Page[TaskSearchHit]:
+        query = queries.search_tasks(text, list_id, limit, after)
+        rows = self.db.execute(query).mappings()
+        return build_ranked_page([TaskSearchHit(**row) for row in rows], limit)
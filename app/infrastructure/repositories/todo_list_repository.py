@@ -2,10 +2,13 @@ from app.domain.repositories.todo_list_repository_interface import (
     ToDoListRepositoryInterface,
 )
 from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate, ToDoList
+from app.domain.models.pagination import Page, DEFAULT_PAGE_SIZE
+from app.infrastructure.repositories import queries
+from app.shared.utils.cursor import build_page
 from app.shared.utils.time import get_utc_now
-from app.infrastructure.db.models import ToDoListORM
+from datetime import datetime
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
 
@@ -14,35 +17,42 @@ class ToDoListRepository(ToDoListRepositoryInterface):
         self.db = db
 
     def create(self, data: ToDoListCreate) -> ToDoList:
-        db_obj = ToDoListORM(**data.model_dump())
-        self.db.add(db_obj)
+        query = queries.insert_todo_list(data.model_dump())
+        row = self.db.execute(query).mappings().one()
         self.db.commit()
-        self.db.refresh(db_obj)
-        return ToDoList(**db_obj.__dict__)
+        return ToDoList(**row)
 
     def get_by_id(self, list_id: UUID) -> ToDoList:
-        obj = self.db.query(ToDoListORM).filter(ToDoListORM.id == list_id).first()
-        return ToDoList(**obj.__dict__) if obj else None
-
-    def update(self, list_id: UUID, data: ToDoListUpdate) -> ToDoList:
-        obj = self.db.query(ToDoListORM).filter(ToDoListORM.id == list_id).first()
-        if not obj:
-            return None
-        for key, value in data.model_dump(exclude_unset=True).items():
-            setattr(obj, key, value)
-        obj.updated_at = get_utc_now()
+        row = self.db.execute(queries.todo_list_by_id(list_id)).mappings().first()
+        return ToDoList(**row) if row else None
+
+    def update(
+        self,
+        list_id: UUID,
+        data: ToDoListUpdate,
+        if_match: Optional[List[datetime]] = None,
+    ) -> ToDoList:
+        values = {**data.model_dump(exclude_unset=True), "updated_at": get_utc_now()}
+        query = queries.update_todo_list(list_id, values, if_match)
+        row = self.db.execute(query).mappings().first()
         self.db.commit()
-        self.db.refresh(obj)
-        return ToDoList(**obj.__dict__)
+        return ToDoList(**row) if row else None
 
+    # Borrado lógico: el purgador (db/purge.py) borra después las tareas.
     def delete(self, list_id: UUID) -> bool:
-        obj = self.db.query(ToDoListORM).filter(ToDoListORM.id == list_id).first()
-        if not obj:
-            return False
-        self.db.delete(obj)
+        deleted = self.db.execute(queries.delete_todo_list(list_id)).first()
         self.db.commit()
-        return True
+        return deleted is not None
+
+    def get_tasks_version(self, list_id: UUID) -> Optional[int]:
+        return self.db.execute(queries.todo_list_tasks_version(list_id)).scalar()
 
     def list_all(self) -> List[ToDoList]:
-        objs = self.db.query(ToDoListORM).all()
-        return [ToDoList(**obj.__dict__) for obj in objs]
+        rows = self.db.execute(queries.all_todo_lists()).mappings()
+        return [ToDoList(**row) for row in rows]
+
+    def list_page(
+        self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> Page[ToDoList]:
+        rows = self.db.execute(queries.todo_list_page(limit, after)).mappings()
+        return build_page([ToDoList(**row) for row in rows], limit)
@@ -0,0 +1,86 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+from app.domain.models.task import Task, TaskSearchHit
+from app.shared.utils.search import (
+    SIMILARITY_THRESHOLD,
+    tokenize,
+    trigram_similarity,
+    trigrams,
+)
+
+# Pesos A y B por defecto de ts_rank: el título cuenta más que la descripción.
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+
+# Índice invertido en memoria con la misma semántica que la búsqueda en
+# PostgreSQL: cada término de la consulta debe aparecer como prefijo de alguna
+# palabra de la tarea y, si ninguna palabra empieza por él, se aceptan las que
+# se le parecen por trigramas (erratas).
+class InvertedIndex:
+    def __init__(self, tasks: Optional[List[Task]] = None):
+        self._tasks: Dict[UUID, Task] = {}
+        self._postings: Dict[str, Dict[UUID, float]] = {}
+        self._terms: List[str] = []
+        self._grams: Dict[str, Set[str]] = {}
+        for task in tasks or []:
+            self.add(task)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def add(self, task: Task) -> None:
+        self._tasks[task.id] = task
+        fields = ((TITLE_WEIGHT, task.title), (DESCRIPTION_WEIGHT, task.description))
+        for weight, text in fields:
+            for term in tokenize(text):
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    insort(self._terms, term)
+                    for gram in trigrams(term):
+                        self._grams.setdefault(gram, set()).add(term)
+                postings[task.id] = max(postings.get(task.id, 0.0), weight)
+
+    # Los términos están ordenados: los que empiezan por token son contiguos.
+    def _expand(self, token: str) -> Dict[str, float]:
+        matches = {}
+        for i in range(bisect_left(self._terms, token), len(self._terms)):
+            if not self._terms[i].startswith(token):
+                break
+            matches[self._terms[i]] = 1.0
+        if matches:
+            return matches
+        candidates = set()
+        for gram in trigrams(token):
+            candidates |= self._grams.get(gram, set())
+        for term in candidates:
+            similarity = trigram_similarity(token, term)
+            if similarity >= SIMILARITY_THRESHOLD:
+                matches[term] = similarity
+        return matches
+
+    def search(self, text: str) -> List[TaskSearchHit]:
+        scores: Optional[Dict[UUID, float]] = None
+        for token in tokenize(text):
+            token_scores: Dict[UUID, float] = {}
+            for term, factor in self._expand(token).items():
+                for task_id, weight in self._postings[term].items():
+                    score = weight * factor
+                    if score > token_scores.get(task_id, 0.0):
+                        token_scores[task_id] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    task_id: score + token_scores[task_id]
+                    for task_id, score in scores.items()
+                    if task_id in token_scores
+                }
+            if not scores:
+                return []
+        return [
+            TaskSearchHit(**self._tasks[task_id].model_dump(), rank=score)
+            for task_id, score in (scores or {}).items()
+        ]
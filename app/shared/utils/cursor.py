@@ -0,0 +1,95 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Tuple
+from uuid import UUID
+from app.domain.exceptions.custom_exceptions import (
+    InvalidCursorException,
+    InvalidSyncTokenException,
+)
+from app.domain.models.pagination import Page
+
+
+def _encode(key: Any, item_id: UUID) -> str:
+    raw = json.dumps([key, str(item_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Tuple[Any, UUID]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    key, item_id = json.loads(base64.urlsafe_b64decode(padded))
+    return key, UUID(item_id)
+
+
+# El cursor es opaco para el cliente: (created_at, id) del último elemento
+# devuelto, serializado en JSON y codificado en base64 url-safe.
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    return _encode(created_at.isoformat(), item_id)
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        created_at, item_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), item_id
+    except (ValueError, TypeError):
+        raise InvalidCursorException(cursor)
+
+
+# En las búsquedas el orden es (rank descendente, id): el cursor guarda la
+# relevancia del último resultado, que JSON conserva sin pérdida.
+def decode_rank_cursor(cursor: str) -> Tuple[float, UUID]:
+    try:
+        rank, item_id = _decode(cursor)
+        return float(rank), item_id
+    except (ValueError, TypeError):
+        raise InvalidCursorException(cursor)
+
+
+# Con un orden explícito (ver sorting.py) el cursor guarda los valores de
+# todas las claves de ordenación del último elemento.
+def encode_keyset_cursor(values: List[Any], item_id: UUID) -> str:
+    return _encode(values, item_id)
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[List[Any], UUID]:
+    try:
+        values, item_id = _decode(cursor)
+    except (ValueError, TypeError):
+        raise InvalidCursorException(cursor)
+    if not isinstance(values, list):
+        raise InvalidCursorException(cursor)
+    return values, item_id
+
+
+# El token de sincronización del feed de cambios es (change_version, id) del
+# último cambio entregado, con la misma codificación que los cursores.
+def encode_sync_token(change_version: int, item_id: UUID) -> str:
+    return _encode(change_version, item_id)
+
+
+def decode_sync_token(token: str) -> Tuple[int, UUID]:
+    try:
+        change_version, item_id = _decode(token)
+    except (ValueError, TypeError):
+        raise InvalidSyncTokenException(token)
+    if not isinstance(change_version, int):
+        raise InvalidSyncTokenException(token)
+    return change_version, item_id
+
+
+# Recibe hasta limit + 1 elementos ordenados por (created_at, id); el elemento
+# extra solo indica que existe una página siguiente.
+def build_page(items: List, limit: int) -> Page:
+    if len(items) <= limit:
+        return Page(items=items)
+    items = items[:limit]
+    last = items[-1]
+    return Page(items=items, next_cursor=encode_cursor(last.created_at, last.id))
+
+
+def build_ranked_page(items: List, limit: int) -> Page:
+    if len(items) <= limit:
+        return Page(items=items)
+    items = items[:limit]
+    last = items[-1]
+    return Page(items=items, next_cursor=_encode(last.rank, last.id))
@@ -0,0 +1,64 @@
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
+from fastapi import Response, status
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# El ETag de un recurso es su updated_at en microsegundos (hexadecimal): es
+# fuerte y reversible, de modo que If-Match se puede convertir en una condición
+# "updated_at IN (...)" del propio UPDATE. Los datos derivados que no cambian
+# updated_at (p. ej. los contadores de una lista) se añaden como sufijo.
+def timestamp_etag(updated_at: datetime, *derived: Any) -> str:
+    micros = (_naive_utc(updated_at) - EPOCH) // timedelta(microseconds=1)
+    if derived:
+        return f'"{micros:x}-{zlib.crc32(repr(derived).encode()):08x}"'
+    return f'"{micros:x}"'
+
+
+# El de una colección combina la versión de la lista con los parámetros de la
+# consulta, que también determinan la representación.
+def version_etag(version: int, *params: Any) -> str:
+    digest = zlib.crc32(repr(params).encode())
+    return f'"v{version:x}-{digest:08x}"'
+
+
+def _split(header: str) -> List[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+# If-None-Match usa comparación débil: se ignora el prefijo W/.
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = _split(if_none_match)
+    return "*" in tags or etag in [tag.removeprefix("W/") for tag in tags]
+
+
+# Devuelve None si no hay condición (cabecera ausente o "*"); las etiquetas
+# débiles o con otro formato no pueden coincidir y se descartan.
+def parse_if_match(if_match: Optional[str]) -> Optional[List[datetime]]:
+    if not if_match or if_match.strip() == "*":
+        return None
+    timestamps = []
+    for tag in _split(if_match):
+        try:
+            micros = (
+                int(tag.strip('"').split("-")[0], 16) if tag.startswith('"') else None
+            )
+        except ValueError:
+            micros = None
+        if micros is not None:
+            timestamps.append(EPOCH + timedelta(microseconds=micros))
+    return timestamps
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
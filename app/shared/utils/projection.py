@@ -0,0 +1,28 @@
+from typing import Any, Dict, List, Optional
+from app.domain.exceptions.custom_exceptions import InvalidFieldsException
+from app.domain.models.task import TASK_FIELDS, TaskSort
+
+
+# "id,title,status": campos separados por comas, en el orden de la respuesta.
+# None (sin parámetro) devuelve la tarea completa.
+def parse_task_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if fields is None:
+        return None
+    names = [name.strip() for name in fields.split(",")]
+    if not all(name in TASK_FIELDS for name in names):
+        raise InvalidFieldsException(fields)
+    return list(dict.fromkeys(names))
+
+
+# Columnas que se leen: las pedidas más las claves del cursor (las del orden
+# y el id), que se descartan al serializar.
+def projection_columns(fields: List[str], sort: Optional[TaskSort]) -> List[str]:
+    keys = [field.value for field, _ in sort] if sort else ["created_at"]
+    return list(dict.fromkeys([*fields, *keys, "id"]))
+
+
+# Argumento include de model_dump para una página proyectada.
+def page_include(fields: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+    if fields is None:
+        return None
+    return {"items": {"__all__": set(fields)}, "next_cursor": True}
@@ -0,0 +1,31 @@
+import re
+from typing import List, Set
+
+# Umbral de similitud de trigramas a partir del cual un término se considera
+# una errata del buscado (el mismo que pg_trgm.similarity_threshold).
+SIMILARITY_THRESHOLD = 0.3
+
+_WORD = re.compile(r"\w+")
+
+
+# Mismo criterio que la configuración "simple" de PostgreSQL: palabras en
+# minúsculas, sin raíces ni palabras vacías.
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(text.lower()) if text else []
+
+
+# Cada término se busca como prefijo y todos deben aparecer. Solo se admiten
+# caracteres de palabra, así que la entrada del usuario no puede inyectar
+# operadores de tsquery.
+def prefix_tsquery(text: str) -> str:
+    return " & ".join(f"{term}:*" for term in tokenize(text))
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f"  {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(left: str, right: str) -> float:
+    a, b = trigrams(left), trigrams(right)
+    return len(a & b) / len(a | b) if a and b else 0.0
@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+from app.domain.exceptions.custom_exceptions import (
+    InvalidCursorException,
+    InvalidSortException,
+)
+from app.domain.models.pagination import Page
+from app.domain.models.task import PRIORITY_RANK, Task, TaskSort, TaskSortField
+from app.shared.utils.cursor import decode_keyset_cursor, encode_keyset_cursor
+
+
+# "priority,-created_at": campos separados por comas; "-" invierte el sentido.
+# None (sin parámetro) conserva el orden por defecto, created_at ascendente.
+def parse_task_sort(sort: Optional[str]) -> Optional[TaskSort]:
+    if sort is None:
+        return None
+    keys, seen = [], set()
+    for term in sort.split(","):
+        term = term.strip()
+        descending = term.startswith("-")
+        try:
+            field = TaskSortField(term[1:] if descending else term)
+        except ValueError:
+            raise InvalidSortException(sort)
+        if field in seen:
+            raise InvalidSortException(sort)
+        seen.add(field)
+        keys.append((field, descending))
+    return keys
+
+
+def _sort_value(task: Task, field: TaskSortField) -> Any:
+    if field == TaskSortField.PRIORITY:
+        return PRIORITY_RANK[task.priority]
+    value = getattr(task, field.value)
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _parse_value(value: Any, field: TaskSortField) -> Any:
+    if field == TaskSortField.PRIORITY:
+        if not isinstance(value, int):
+            raise TypeError(value)
+        return value
+    if field == TaskSortField.TITLE:
+        return str(value)
+    return datetime.fromisoformat(value)
+
+
+def decode_sort_cursor(cursor: str, sort: TaskSort) -> Tuple[List[Any], UUID]:
+    values, item_id = decode_keyset_cursor(cursor)
+    if len(values) != len(sort):
+        raise InvalidCursorException(cursor)
+    try:
+        return [
+            _parse_value(value, field) for value, (field, _) in zip(values, sort)
+        ], item_id
+    except (ValueError, TypeError):
+        raise InvalidCursorException(cursor)
+
+
+# Como build_page, pero los elementos vienen en el orden pedido.
+def build_sorted_page(items: List[Task], limit: int, sort: TaskSort) -> Page:
+    if len(items) <= limit:
+        return Page(items=items)
+    items = items[:limit]
+    last = items[-1]
+    values = [_sort_value(last, field) for field, _ in sort]
+    return Page(items=items, next_cursor=encode_keyset_cursor(values, last.id))
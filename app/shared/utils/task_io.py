@@ -0,0 +1,81 @@
+import csv
+import io
+from enum import Enum
+from typing import Any, Iterable, Iterator
+from app.domain.models.task import Task
+
+# Filas leídas por viaje al cursor de servidor y escritas por fragmento de la
+# respuesta: la memoria del worker queda acotada por este valor.
+EXPORT_BATCH_SIZE = 1000
+# Cuerpo de una importación que se mantiene en memoria antes de volcarse a disco.
+IMPORT_SPOOL_SIZE = 8 * 1024 * 1024
+
+CSV_FIELDS = list(Task.model_fields)
+
+
+class FileFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    FileFormat.NDJSON: "application/x-ndjson",
+    FileFormat.CSV: "text/csv",
+}
+
+
+def _chunked(lines: Iterable[str], rows_per_chunk: int) -> Iterator[str]:
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= rows_per_chunk:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def _ndjson_lines(tasks: Iterable[Task]) -> Iterator[str]:
+    for task in tasks:
+        yield task.model_dump_json() + "\n"
+
+
+def _csv_lines(tasks: Iterable[Task], header: bool = True) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS)
+    if header:
+        writer.writeheader()
+    for task in tasks:
+        writer.writerow(task.model_dump(mode="json"))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+# header=False continúa un CSV ya empezado (exportación por lotes de un trabajo).
+def serialize_tasks(
+    tasks: Iterable[Task],
+    file_format: FileFormat,
+    rows_per_chunk: int = EXPORT_BATCH_SIZE,
+    header: bool = True,
+) -> Iterator[str]:
+    if file_format == FileFormat.CSV:
+        lines = _csv_lines(tasks, header)
+    else:
+        lines = _ndjson_lines(tasks)
+    return _chunked(lines, rows_per_chunk)
+
+
+# NDJSON devuelve cada línea sin decodificar (TaskCreate.model_validate_json la
+# valida en un solo paso); en CSV las celdas vacías se omiten para que se
+# apliquen los valores por defecto.
+def parse_tasks(lines: Iterable[str], file_format: FileFormat) -> Iterator[Any]:
+    if file_format == FileFormat.CSV:
+        for row in csv.DictReader(lines):
+            yield {key: value for key, value in row.items() if key and value != ""}
+    else:
+        for line in lines:
+            if line.strip():
+                yield line
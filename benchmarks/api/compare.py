@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+
+
+def change(before, after):
+    return (after - before) / before * 100 if before else 0.0
+
+
+# Compara dos resultados de benchmarks.api.run (p. ej. main frente a la rama) y
+# falla si algún escenario pierde más de --threshold % de RPS o gana más de
+# --threshold % de p95.
+def compare(baseline, current, threshold):
+    rows, regressions = [], []
+    for scenario, after in current["scenarios"].items():
+        before = baseline["scenarios"].get(scenario)
+        if not before or not before.get("requests") or not after.get("requests"):
+            continue
+        rps = change(before["rps"], after["rps"])
+        p95 = change(before["p95_ms"], after["p95_ms"])
+        p99 = change(before["p99_ms"], after["p99_ms"])
+        regressed = rps < -threshold or p95 > threshold
+        if regressed:
+            regressions.append(scenario)
+        rows.append(
+            f"{scenario:>13}  rps {before['rps']:>8} -> {after['rps']:>8} "
+            f"({rps:+6.1f}%)  p95 {p95:+6.1f}%  p99 {p99:+6.1f}%"
+            + ("  REGRESIÓN" if regressed else "")
+        )
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compara dos resultados de benchmarks.api.run por escenario."
+    )
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with open(args.baseline) as fh:
+        baseline = json.load(fh)
+    with open(args.current) as fh:
+        current = json.load(fh)
+    print(
+        f"{baseline.get('commit')} ({baseline['label']}) -> "
+        f"{current.get('commit')} ({current['label']})"
+    )
+    rows, regressions = compare(baseline, current, args.threshold)
+    print("\n".join(rows))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
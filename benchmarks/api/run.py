@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import httpx
+from benchmarks.api.scenarios import SCENARIOS, pick
+from benchmarks.api.seed import DEFAULT_DATABASE_URL, seed
+from benchmarks.cold_start import free_port, wait_for
+from benchmarks.load_test import percentile
+
+
+def latency_summary(latencies):
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+def git_commit():
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return output.stdout.strip() or None
+
+
+# "asgi" ejecuta la aplicación en el mismo proceso a través de httpx (sin red
+# ni uvicorn); "uvicorn" la arranca en un subproceso local. La aplicación lee
+# DATABASE_URL al importarse, por eso se importa después de fijarla.
+@asynccontextmanager
+async def open_client(args):
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    options = {"limits": limits, "timeout": args.timeout}
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, **options) as client:
+            yield client
+        return
+    env = {**os.environ, "DATABASE_URL": args.database_url}
+    if args.target == "asgi":
+        os.environ.update(env)
+        from app.infrastructure.api.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", **options
+        ) as client:
+            yield client
+        return
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.infrastructure.api.main:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        with httpx.Client(timeout=1) as probe:
+            if not wait_for(probe, f"{base_url}/readyz", time.perf_counter() + 60):
+                raise RuntimeError("uvicorn no llegó a estar listo en 60 s")
+        async with httpx.AsyncClient(base_url=base_url, **options) as client:
+            yield client
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def worker(client, scenario, data, rng, deadline, warmup_until, samples):
+    while time.perf_counter() < deadline:
+        name, operation = pick(scenario, rng)
+        method, path, body = operation(data, rng)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            error = response.status_code >= 400
+        except httpx.HTTPError:
+            error = True
+        end = time.perf_counter()
+        if start >= warmup_until:
+            samples.append((name, (end - start) * 1000, error))
+
+
+# Las operaciones calentadas no cuentan: el primer segundo incluye la
+# apertura de conexiones del pool y la compilación de consultas.
+async def run_scenario(client, scenario, data, args):
+    samples = []
+    start = time.perf_counter()
+    warmup_until = start + args.warmup
+    deadline = warmup_until + args.duration
+    await asyncio.gather(
+        *(
+            worker(
+                client,
+                scenario,
+                data,
+                random.Random(args.seed * 1000 + i),
+                deadline,
+                warmup_until,
+                samples,
+            )
+            for i in range(args.concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - warmup_until
+    by_operation = defaultdict(list)
+    for name, latency, _ in samples:
+        by_operation[name].append(latency)
+    latencies = [latency for _, latency, _ in samples]
+    if not latencies:
+        return {"requests": 0, "errors": 0, "rps": 0.0}
+    return {
+        **latency_summary(latencies),
+        "errors": sum(1 for _, _, error in samples if error),
+        "rps": round(len(samples) / elapsed, 1),
+        "operations": {
+            name: latency_summary(values)
+            for name, values in sorted(by_operation.items())
+        },
+    }
+
+
+async def run(args, data):
+    results = {}
+    async with open_client(args) as client:
+        for scenario in args.scenarios:
+            results[scenario] = await run_scenario(client, scenario, data, args)
+            summary = results[scenario]
+            print(
+                f"{scenario:>13}: {summary['rps']:>8} rps  "
+                f"p50 {summary.get('p50_ms')} ms  p95 {summary.get('p95_ms')} ms  "
+                f"p99 {summary.get('p99_ms')} ms  errores {summary['errors']}",
+                file=sys.stderr,
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Siembra una base desechable (borra y recrea las tablas) y mide RPS y "
+            "latencias p50/p95/p99 de la API en varios escenarios. Con SQLite sirve "
+            "para comparar commits entre sí; las cifras absolutas, con PostgreSQL."
+        )
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument(
+        "--target",
+        choices=["asgi", "uvicorn"],
+        default="asgi",
+        help="Aplicación en proceso (httpx + ASGI) o en un uvicorn local",
+    )
+    parser.add_argument(
+        "--base-url",
+        help="API ya en marcha (usa la misma base que --database-url para sembrar)",
+    )
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Repetible; por defecto todos",
+    )
+    parser.add_argument("--lists", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=200, help="Tareas por lista")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--workers", type=int, default=1, help="Workers de uvicorn")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="run")
+    parser.add_argument("--output", help="Fichero JSON con el resultado")
+    args = parser.parse_args()
+    args.scenarios = args.scenarios or list(SCENARIOS)
+
+    data = seed(args.database_url, args.lists, args.tasks, args.seed)
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    results = asyncio.run(run(args, data))
+    report = {
+        "label": args.label,
+        "commit": git_commit(),
+        "started_at": started_at,
+        "python": platform.python_version(),
+        "database": args.database_url.split(":", 1)[0],
+        "target": "external" if args.base_url else args.target,
+        "config": {
+            "lists": args.lists,
+            "tasks_per_list": args.tasks,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "seed": args.seed,
+        },
+        "scenarios": results,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
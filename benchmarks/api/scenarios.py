@@ -0,0 +1,94 @@
+from app.domain.models.task import TaskPriority, TaskStatus
+from benchmarks.api.seed import WORDS
+
+# Cada operación devuelve (método, ruta, cuerpo JSON) a partir de los datos
+# sembrados y un generador aleatorio propio del worker.
+
+
+def _list(data, rng):
+    return rng.choice(data["list_ids"])
+
+
+def _task(data, rng):
+    list_id = _list(data, rng)
+    return list_id, rng.choice(data["task_ids"][list_id])
+
+
+def create_task(data, rng):
+    body = {"title": f"{rng.choice(WORDS)} created", "priority": "high"}
+    return "POST", f"/todo-lists/{_list(data, rng)}/tasks/", body
+
+
+def get_task(data, rng):
+    list_id, task_id = _task(data, rng)
+    return "GET", f"/todo-lists/{list_id}/tasks/{task_id}", None
+
+
+def update_status(data, rng):
+    list_id, task_id = _task(data, rng)
+    status = rng.choice(list(TaskStatus)).value
+    return (
+        "PATCH",
+        f"/todo-lists/{list_id}/tasks/{task_id}/status?status={status}",
+        None,
+    )
+
+
+def get_list(data, rng):
+    return "GET", f"/lists/{_list(data, rng)}", None
+
+
+def list_lists(data, rng):
+    return "GET", "/lists/?limit=50", None
+
+
+def list_tasks(data, rng):
+    return "GET", f"/todo-lists/{_list(data, rng)}/tasks/?limit=50", None
+
+
+def filter_tasks(data, rng):
+    status = rng.choice(list(TaskStatus)).value
+    priority = rng.choice(list(TaskPriority)).value
+    query = f"status={status}&priority={priority}&limit=50"
+    return "GET", f"/todo-lists/{_list(data, rng)}/tasks/?{query}", None
+
+
+def search_tasks(data, rng):
+    return (
+        "GET",
+        f"/todo-lists/{_list(data, rng)}/tasks/search?q={rng.choice(WORDS)}",
+        None,
+    )
+
+
+def completion(data, rng):
+    return "GET", f"/todo-lists/{_list(data, rng)}/tasks/completion-percentage", None
+
+
+def stats(data, rng):
+    return "GET", f"/todo-lists/{_list(data, rng)}/tasks/stats", None
+
+
+# Pesos relativos de cada operación por escenario.
+SCENARIOS = {
+    "create-heavy": {create_task: 8, list_tasks: 1, get_task: 1},
+    "read-heavy": {get_task: 4, list_tasks: 3, get_list: 2, list_lists: 1},
+    "filter": {filter_tasks: 8, search_tasks: 2},
+    "completion": {completion: 6, stats: 3, list_lists: 1},
+    "mixed": {
+        get_task: 3,
+        list_tasks: 2,
+        filter_tasks: 2,
+        completion: 1,
+        stats: 1,
+        get_list: 1,
+        create_task: 1,
+        update_status: 1,
+    },
+}
+
+
+def pick(scenario, rng):
+    operations = SCENARIOS[scenario]
+    operation = rng.choices(list(operations), weights=list(operations.values()))[0]
+    return operation.__name__, operation
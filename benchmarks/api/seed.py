@@ -0,0 +1,93 @@
+import argparse
+import json
+import random
+import sys
+import time
+import uuid
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from app.domain.models.task import TaskCreate, TaskPriority, TaskStatus
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.models import TaskORM, ToDoListORM
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.shared.utils.time import get_utc_now
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark.db"
+
+# Vocabulario de los títulos: da resultados variados a las búsquedas y filtros.
+WORDS = (
+    "report invoice meeting review deploy email budget design release backup "
+    "call update plan draft fix"
+).split()
+
+
+def random_task(rng, index):
+    return TaskCreate(
+        title=f"{rng.choice(WORDS)} {rng.choice(WORDS)} {index}",
+        description=" ".join(rng.choices(WORDS, k=8)),
+        status=rng.choice(list(TaskStatus)),
+        priority=rng.choice(list(TaskPriority)),
+    )
+
+
+# Borra y recrea el esquema y carga lists × tasks_per_list tareas. Las tareas
+# entran con TaskRepository.copy_many (COPY en PostgreSQL), igual que la
+# importación, así que sembrar 100.000 filas tarda segundos.
+def seed(database_url, lists, tasks_per_list, seed_value=0):
+    rng = random.Random(seed_value)
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    now = get_utc_now()
+    list_ids = [uuid.uuid4() for _ in range(lists)]
+    try:
+        with Session(engine) as db:
+            db.execute(
+                insert(ToDoListORM.__table__),
+                [
+                    {"id": list_id, "name": f"List {i}", "created_at": now}
+                    for i, list_id in enumerate(list_ids)
+                ],
+            )
+            db.commit()
+            tasks = TaskRepository(db)
+            for list_id in list_ids:
+                data = [random_task(rng, i) for i in range(tasks_per_list)]
+                tasks.copy_many(list_id, data)
+            rows = db.execute(select(TaskORM.todo_list_id, TaskORM.id)).all()
+    finally:
+        engine.dispose()
+    task_ids = {str(list_id): [] for list_id in list_ids}
+    for list_id, task_id in rows:
+        task_ids[str(list_id)].append(str(task_id))
+    return {"list_ids": [str(list_id) for list_id in list_ids], "task_ids": task_ids}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Siembra una base desechable con N listas × M tareas."
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--lists", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=100, help="Tareas por lista")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    data = seed(args.database_url, args.lists, args.tasks, args.seed)
+    elapsed = time.perf_counter() - started
+    total = sum(len(ids) for ids in data["task_ids"].values())
+    print(
+        json.dumps(
+            {
+                "lists": len(data["list_ids"]),
+                "tasks": total,
+                "seconds": round(elapsed, 2),
+            }
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
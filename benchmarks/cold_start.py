@@ -0,0 +1,117 @@
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import httpx
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(client, url, deadline):
+    while time.perf_counter() < deadline:
+        try:
+            if client.get(url).status_code == 200:
+                return True
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    return False
+
+
+# Arranca uvicorn en un puerto libre y mide cuánto tarda en responder /healthz
+# (proceso listo para recibir tráfico) y /readyz (base de datos y pool listos).
+def measure_once(env, timeout):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.infrastructure.api.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    try:
+        deadline = start + timeout
+        with httpx.Client(timeout=1) as client:
+            healthy = wait_for(client, f"{base_url}/healthz", deadline)
+            healthz_ms = (time.perf_counter() - start) * 1000 if healthy else None
+            ready = healthy and wait_for(client, f"{base_url}/readyz", deadline)
+            readyz_ms = (time.perf_counter() - start) * 1000 if ready else None
+    finally:
+        process.terminate()
+        process.wait()
+    return healthz_ms, readyz_ms
+
+
+def summary(values):
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+    return {
+        "median_ms": round(statistics.median(values), 1),
+        "max_ms": round(max(values), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Mide el arranque en frío de la API: tiempo hasta que /healthz y "
+            "/readyz responden 200. Falla si /healthz supera --target-ms."
+        )
+    )
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--target-ms", type=float, default=2000)
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="Arranca con DB_CREATE_SCHEMA=true (p. ej. contra SQLite)",
+    )
+    parser.add_argument("--output", help="Ruta opcional para guardar el JSON")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.database_url:
+        env["DATABASE_URL"] = args.database_url
+    if args.create_schema:
+        env["DB_CREATE_SCHEMA"] = "true"
+
+    healthz, readyz = [], []
+    for _ in range(args.runs):
+        healthz_ms, readyz_ms = measure_once(env, args.timeout)
+        healthz.append(healthz_ms)
+        readyz.append(readyz_ms)
+
+    report = {
+        "runs": args.runs,
+        "target_ms": args.target_ms,
+        "healthz": summary(healthz),
+        "readyz": summary(readyz),
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+    if report["healthz"] is None or report["healthz"]["max_ms"] > args.target_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+import httpx
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed(client, tasks):
+    todo_list = (await client.post("/lists/", json={"name": "load test"})).json()
+    list_id = todo_list["id"]
+    task_ids = []
+    for i in range(tasks):
+        response = await client.post(
+            f"/todo-lists/{list_id}/tasks/", json={"title": f"Task {i}"}
+        )
+        task_ids.append(response.json()["id"])
+    return list_id, task_ids
+
+
+async def worker(client, list_id, task_ids, deadline, latencies, errors):
+    paths = [
+        f"/todo-lists/{list_id}/tasks/?limit=20",
+        f"/todo-lists/{list_id}/tasks/stats",
+        f"/lists/{list_id}",
+    ]
+    while time.perf_counter() < deadline:
+        path = random.choice(
+            paths + [f"/todo-lists/{list_id}/tasks/{random.choice(task_ids)}"]
+        )
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError as exc:
+            errors.append(type(exc).__name__)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def run(args):
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        list_id, task_ids = await seed(client, args.tasks)
+        latencies, errors = [], []
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(
+            *(
+                worker(client, list_id, task_ids, deadline, latencies, errors)
+                for _ in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start
+    return {
+        "label": args.label,
+        "concurrency": args.concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Prueba de carga de lectura contra una API en marcha. Ejecútala una vez "
+            "con DB_MODE=sync y otra con DB_MODE=async para comparar ambos modos."
+        )
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--label", default="run")
+    parser.add_argument("--output", help="Fichero JSON al que añadir el resultado")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, "a") as fh:
+            fh.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+import httpx
+from benchmarks.api.run import latency_summary
+from benchmarks.api.seed import seed
+
+DEFAULT_DATABASE_URL = "sqlite:///./projection.db"
+DEFAULT_FIELDS = "id,title,status"
+
+
+def decode(raw, content_encoding):
+    if content_encoding == "gzip":
+        return gzip.decompress(raw)
+    if content_encoding == "br":
+        import brotli
+
+        return brotli.decompress(raw)
+    return raw
+
+
+# Recorre la lista entera página a página. Los bytes son los del cuerpo tal
+# como viajan (comprimido si procede); las cabeceras no se cuentan.
+async def walk(client, list_id, fields, encoding, limit, latencies):
+    params = {"limit": limit}
+    if fields:
+        params["fields"] = fields
+    headers = {"Accept-Encoding": encoding}
+    total_bytes = 0
+    while True:
+        start = time.perf_counter()
+        async with client.stream(
+            "GET", f"/todo-lists/{list_id}/tasks/", params=params, headers=headers
+        ) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        total_bytes += len(raw)
+        body = json.loads(decode(raw, response.headers.get("content-encoding")))
+        if not body["next_cursor"]:
+            return total_bytes
+        params = {**params, "after": body["next_cursor"]}
+
+
+async def run(args, list_id):
+    os.environ["DATABASE_URL"] = args.database_url
+    from app.infrastructure.api.compression import ENCODINGS
+    from app.infrastructure.api.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=args.timeout
+    ) as client:
+        for fields in (None, args.fields):
+            for encoding in ("identity",) + ENCODINGS:
+                await walk(client, list_id, fields, encoding, args.limit, [])
+                latencies, sizes = [], []
+                for _ in range(args.rounds):
+                    sizes.append(
+                        await walk(
+                            client, list_id, fields, encoding, args.limit, latencies
+                        )
+                    )
+                name = f"{'fields' if fields else 'full'}/{encoding}"
+                results[name] = {"bytes": sizes[-1], **latency_summary(latencies)}
+                print(
+                    f"{name:>16}: {sizes[-1]:>10} bytes  "
+                    f"p50 {results[name]['p50_ms']} ms  "
+                    f"p95 {results[name]['p95_ms']} ms",
+                    file=sys.stderr,
+                )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Siembra una lista de N tareas (borra y recrea las tablas) y mide los "
+            "bytes de la respuesta y la latencia p50/p95 por página del listado, "
+            "con y sin fields= y con cada codificación que ofrece el servidor."
+        )
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--fields", default=DEFAULT_FIELDS)
+    parser.add_argument("--limit", type=int, default=500, help="Tareas por página")
+    parser.add_argument("--rounds", type=int, default=5, help="Recorridos por caso")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="Fichero JSON con el resultado")
+    args = parser.parse_args()
+
+    data = seed(args.database_url, 1, args.tasks)
+    results = asyncio.run(run(args, data["list_ids"][0]))
+    report = {
+        "database": args.database_url.split(":", 1)[0],
+        "config": {
+            "tasks": args.tasks,
+            "fields": args.fields,
+            "limit": args.limit,
+            "rounds": args.rounds,
+        },
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from app.domain.models.pagination import Page
+from app.domain.models.task import Task, TaskPriority, TaskStatus
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.responses import model_response
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.models import TaskORM
+from app.infrastructure.repositories import queries
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.shared.utils.cursor import build_page
+from app.shared.utils.time import get_utc_now
+
+PAGE_FIELD = create_response_field(name="response", type_=Page[Task])
+
+
+def seed(db, rows):
+    todo_list = ToDoListRepository(db).create(ToDoListCreate(name="serialization"))
+    now = get_utc_now()
+    db.execute(
+        queries.load_tasks(),
+        [
+            {
+                "id": uuid.uuid4(),
+                "todo_list_id": todo_list.id,
+                "title": f"Task {i}",
+                "description": "Descripción de la tarea",
+                "status": TaskStatus.PENDING,
+                "priority": TaskPriority.MEDIUM,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ],
+    )
+    db.commit()
+    return todo_list.id
+
+
+# Camino anterior: objetos del ORM convertidos con __dict__ y respuesta
+# validada de nuevo por response_model y codificada con json.dumps.
+def fetch_before(db, list_id, rows):
+    db.expunge_all()
+    query = (
+        select(TaskORM)
+        .where(TaskORM.todo_list_id == list_id)
+        .order_by(TaskORM.created_at, TaskORM.id)
+        .limit(rows + 1)
+    )
+    objs = db.execute(query).scalars().all()
+    return build_page([Task(**obj.__dict__) for obj in objs], rows)
+
+
+def encode_before(page):
+    content = asyncio.run(
+        serialize_response(field=PAGE_FIELD, response_content=page, is_coroutine=True)
+    )
+    return JSONResponse(content).body
+
+
+# Camino actual: filas de Core y respuesta ya renderizada con orjson.
+def fetch_after(db, list_id, rows):
+    return TaskRepository(db).list_page_by_filters(list_id, limit=rows)
+
+
+def encode_after(page):
+    return model_response(page).body
+
+
+def measure(fn, repeat, rows):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return round(statistics.median(timings) * 1_000_000 / rows, 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Mide el coste por fila de construir y serializar una respuesta de N "
+            "tareas con el camino anterior (ORM + response_model + json) y el "
+            "actual (Core + orjson)."
+        )
+    )
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Ruta opcional para guardar el JSON")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    report = {"rows": args.rows, "repeat": args.repeat, "unit": "us/row"}
+    with Session(engine) as db:
+        list_id = seed(db, args.rows)
+        page_before = fetch_before(db, list_id, args.rows)
+        page_after = fetch_after(db, list_id, args.rows)
+        assert json.loads(encode_before(page_before)) == json.loads(
+            encode_after(page_after)
+        )
+        for phase, fetch, encode, page in (
+            ("before", fetch_before, encode_before, page_before),
+            ("after", fetch_after, encode_after, page_after),
+        ):
+            report[phase] = {
+                "fetch": measure(
+                    lambda: fetch(db, list_id, args.rows), args.repeat, args.rows
+                ),
+                "encode": measure(lambda: encode(page), args.repeat, args.rows),
+            }
+            report[phase]["total"] = round(
+                report[phase]["fetch"] + report[phase]["encode"], 3
+            )
+
+    print(f"{'':>8} {'fetch':>8} {'encode':>8} {'total':>8}  (us/fila)")
+    for phase in ("before", "after"):
+        result = report[phase]
+        print(
+            f"{phase:>8} {result['fetch']:>8} {result['encode']:>8} "
+            f"{result['total']:>8}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
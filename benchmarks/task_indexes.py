@@ -0,0 +1,159 @@
+import argparse
+import json
+import os
+import statistics
+import time
+from sqlalchemy import create_engine, text
+from app.infrastructure.db.base import Base
+from app.infrastructure.db import models  # noqa: F401
+
+INDEXES = {
+    "ix_tasks_list_status_priority": "tasks (todo_list_id, status, priority)",
+    "ix_tasks_list_created_at_id": "tasks (todo_list_id, created_at, id)",
+    "ix_todo_lists_created_at_id": "todo_lists (created_at, id)",
+    "ix_tasks_list_status_priority_rank_id": (
+        "tasks (todo_list_id, status, priority_rank, id)"
+    ),
+}
+
+# Consultas equivalentes a las que emiten los repositorios en las rutas calientes.
+QUERIES = {
+    "list_by_filters": (
+        "SELECT * FROM tasks WHERE todo_list_id = :list_id "
+        "AND status = 'PENDING' AND priority = 'HIGH'"
+    ),
+    "list_page": (
+        "SELECT * FROM tasks WHERE todo_list_id = :list_id "
+        "ORDER BY created_at, id LIMIT 51"
+    ),
+    # GET /todo-lists/{id}/tasks?status=pending&sort=-priority&limit=20
+    "top_priority": (
+        "SELECT * FROM tasks WHERE todo_list_id = :list_id AND status = 'PENDING' "
+        "ORDER BY priority_rank DESC, id DESC LIMIT 21"
+    ),
+    "get_by_id": "SELECT * FROM tasks WHERE todo_list_id = :list_id AND id = :task_id",
+    "completion": (
+        "SELECT count(*), count(*) FILTER (WHERE status = 'COMPLETED') "
+        "FROM tasks WHERE todo_list_id = :list_id"
+    ),
+}
+
+
+def seed(conn, rows, lists):
+    Base.metadata.drop_all(conn)
+    Base.metadata.create_all(conn)
+    conn.execute(
+        text(
+            "INSERT INTO todo_lists (id, name, created_at, updated_at) "
+            "SELECT gen_random_uuid(), 'List ' || g, now(), now() "
+            "FROM generate_series(1, :lists) g"
+        ),
+        {"lists": lists},
+    )
+    conn.execute(
+        text(
+            "INSERT INTO tasks (id, title, status, priority, created_at, updated_at, "
+            "todo_list_id) "
+            "SELECT gen_random_uuid(), 'Task ' || g, "
+            "(ARRAY['PENDING','IN_PROGRESS','COMPLETED'])[1 + g % 3]::taskstatus, "
+            "(ARRAY['LOW','MEDIUM','HIGH'])[1 + (g / 3) % 3]::taskpriority, "
+            "now() - g * interval '1 second', now(), "
+            "ids[1 + g % array_length(ids, 1)] "
+            "FROM generate_series(1, :rows) g, "
+            "(SELECT array_agg(id) AS ids FROM todo_lists) l"
+        ),
+        {"rows": rows},
+    )
+    conn.execute(text("ANALYZE tasks"))
+    conn.execute(text("ANALYZE todo_lists"))
+
+
+def drop_indexes(conn):
+    for name in INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+def create_indexes(conn):
+    for name, target in INDEXES.items():
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+    conn.execute(text("ANALYZE tasks"))
+    conn.execute(text("ANALYZE todo_lists"))
+
+
+def measure(conn, params, repeat):
+    results = {}
+    for name, sql in QUERIES.items():
+        plan = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params).scalars()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(text(sql), params).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            "plan": list(plan),
+            "median_ms": round(statistics.median(timings), 3),
+            "max_ms": round(max(timings), 3),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Siembra tasks con N filas y compara planes y tiempos de las consultas "
+            "de filtrado con y sin los índices compuestos. Borra y recrea las tablas "
+            "de la base indicada: úsalo solo contra una base desechable."
+        )
+    )
+    parser.add_argument(
+        "--database-url", default=os.getenv("BENCHMARK_DATABASE_URL"), required=False
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--lists", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Ruta opcional para guardar el JSON")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url o BENCHMARK_DATABASE_URL es obligatorio")
+
+    engine = create_engine(args.database_url)
+    with engine.begin() as conn:
+        seed(conn, args.rows, args.lists)
+        params = dict(
+            conn.execute(
+                text(
+                    "SELECT todo_list_id AS list_id, id AS task_id FROM tasks "
+                    "ORDER BY random() LIMIT 1"
+                )
+            )
+            .mappings()
+            .one()
+        )
+
+    report = {"rows": args.rows, "lists": args.lists}
+    with engine.begin() as conn:
+        drop_indexes(conn)
+        conn.execute(text("ANALYZE tasks"))
+        report["before"] = measure(conn, params, args.repeat)
+    with engine.begin() as conn:
+        create_indexes(conn)
+        report["after"] = measure(conn, params, args.repeat)
+
+    for phase in ("before", "after"):
+        print(f"== {phase}")
+        for name, result in report[phase].items():
+            print(f"-- {name}: median {result['median_ms']} ms")
+            print("\n".join(result["plan"]))
+    print("== resumen (mediana ms)")
+    for name in QUERIES:
+        before = report["before"][name]["median_ms"]
+        after = report["after"][name]["median_ms"]
+        print(f"{name:>16}: {before:>10} -> {after:>8}")
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-08-07 12:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "todo_lists",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        "tasks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("title", sa.String(100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "IN_PROGRESS", "COMPLETED", name="taskstatus"),
+            nullable=True,
+        ),
+        sa.Column(
+            "priority",
+            sa.Enum("LOW", "MEDIUM", "HIGH", name="taskpriority"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "todo_list_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("todo_lists.id"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("tasks")
+    op.drop_table("todo_lists")
+    sa.Enum(name="taskpriority").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="taskstatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,48 @@
+"""task filter and pagination indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-08-20 12:00:00
+
+"""
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# CREATE INDEX CONCURRENTLY no puede ejecutarse dentro de una transacción, por
+# eso cada índice se crea en un bloque autocommit: la tabla sigue aceptando
+# escrituras mientras se construye. Si la construcción falla deja un índice
+# INVALID con ese nombre que IF NOT EXISTS daría por bueno; se borra antes de
+# crearlo para que reintentar la migración lo reconstruya.
+INDEXES = [
+    ("ix_tasks_list_status_priority", "tasks", ["todo_list_id", "status", "priority"]),
+    ("ix_tasks_list_created_at_id", "tasks", ["todo_list_id", "created_at", "id"]),
+    ("ix_todo_lists_created_at_id", "todo_lists", ["created_at", "id"]),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,35 @@
+"""tasks foreign key with on delete cascade
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-09-02 12:00:00
+
+"""
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+# La restricción se recrea como NOT VALID (sin recorrer la tabla) y se valida
+# después; VALIDATE CONSTRAINT no bloquea las escrituras sobre tasks.
+def upgrade():
+    op.execute("ALTER TABLE tasks DROP CONSTRAINT tasks_todo_list_id_fkey")
+    op.execute(
+        "ALTER TABLE tasks ADD CONSTRAINT tasks_todo_list_id_fkey "
+        "FOREIGN KEY (todo_list_id) REFERENCES todo_lists (id) "
+        "ON DELETE CASCADE NOT VALID"
+    )
+    op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT tasks_todo_list_id_fkey")
+
+
+def downgrade():
+    op.execute("ALTER TABLE tasks DROP CONSTRAINT tasks_todo_list_id_fkey")
+    op.execute(
+        "ALTER TABLE tasks ADD CONSTRAINT tasks_todo_list_id_fkey "
+        "FOREIGN KEY (todo_list_id) REFERENCES todo_lists (id) NOT VALID"
+    )
+    op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT tasks_todo_list_id_fkey")
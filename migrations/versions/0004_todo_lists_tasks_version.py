@@ -0,0 +1,56 @@
+"""todo_lists.tasks_version maintained by statement-level triggers on tasks
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-09-09 12:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+# Desde PostgreSQL 11, ADD COLUMN con un DEFAULT constante no reescribe la tabla.
+def upgrade():
+    op.add_column(
+        "todo_lists",
+        sa.Column("tasks_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_tasks_version() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                UPDATE todo_lists SET tasks_version = tasks_version + 1
+                WHERE id IN (SELECT DISTINCT todo_list_id FROM old_rows);
+            ELSE
+                UPDATE todo_lists SET tasks_version = tasks_version + 1
+                WHERE id IN (SELECT DISTINCT todo_list_id FROM new_rows);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for event_name, transition in (
+        ("insert", "NEW TABLE AS new_rows"),
+        ("update", "NEW TABLE AS new_rows"),
+        ("delete", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            f"CREATE TRIGGER tasks_version_{event_name} AFTER {event_name.upper()} "
+            f"ON tasks REFERENCING {transition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_tasks_version()"
+        )
+
+
+def downgrade():
+    for event_name in ("insert", "update", "delete"):
+        op.execute(f"DROP TRIGGER IF EXISTS tasks_version_{event_name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS bump_tasks_version()")
+    op.drop_column("todo_lists", "tasks_version")
@@ -0,0 +1,47 @@
+"""full-text and trigram search over tasks
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-09-16 12:00:00
+
+"""
+
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+# Añadir una columna generada STORED reescribe la tabla; los índices, en cambio,
+# se construyen con CONCURRENTLY para no bloquear las escrituras (y se borran
+# antes por si un intento fallido los dejó INVALID, ver 0002).
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_search_vector")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_search_vector "
+            "ON tasks USING gin (search_vector)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_title_trgm")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_title_trgm "
+            "ON tasks USING gin (title gin_trgm_ops)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_title_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_search_vector")
+    op.drop_column("tasks", "search_vector")
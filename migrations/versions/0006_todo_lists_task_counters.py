@@ -0,0 +1,107 @@
+"""denormalized task counters on todo_lists maintained by triggers
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-09-23 12:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+COUNTERS = ["total_tasks", "pending_tasks", "in_progress_tasks", "completed_tasks"]
+
+APPLY_COUNTS = """
+    UPDATE todo_lists l SET
+        total_tasks = l.total_tasks + d.total_tasks,
+        pending_tasks = l.pending_tasks + d.pending_tasks,
+        in_progress_tasks = l.in_progress_tasks + d.in_progress_tasks,
+        completed_tasks = l.completed_tasks + d.completed_tasks
+    FROM (
+        SELECT
+            todo_list_id,
+            sum(delta) AS total_tasks,
+            coalesce(sum(delta) FILTER (WHERE status = 'PENDING'), 0) AS pending_tasks,
+            coalesce(sum(delta) FILTER (WHERE status = 'IN_PROGRESS'), 0)
+                AS in_progress_tasks,
+            coalesce(sum(delta) FILTER (WHERE status = 'COMPLETED'), 0)
+                AS completed_tasks
+        FROM ({deltas}) AS changes GROUP BY todo_list_id
+    ) AS d
+    WHERE l.id = d.todo_list_id AND (
+        d.total_tasks <> 0 OR d.pending_tasks <> 0
+        OR d.in_progress_tasks <> 0 OR d.completed_tasks <> 0
+    );
+"""
+
+NEW_ROWS = "SELECT todo_list_id, status, 1 AS delta FROM new_rows"
+OLD_ROWS = "SELECT todo_list_id, status, -1 AS delta FROM old_rows"
+
+
+# Todo corre en la transacción de la migración: ADD COLUMN bloquea todo_lists
+# hasta el final, así que ninguna escritura de tareas se cuela entre el
+# recálculo inicial y la creación de los triggers.
+def upgrade():
+    for column in COUNTERS:
+        op.add_column(
+            "todo_lists",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION apply_task_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {APPLY_COUNTS.format(deltas=NEW_ROWS)}
+            ELSIF TG_OP = 'DELETE' THEN
+                {APPLY_COUNTS.format(deltas=OLD_ROWS)}
+            ELSE
+                {APPLY_COUNTS.format(deltas=f"{NEW_ROWS} UNION ALL {OLD_ROWS}")}
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for event_name, transition in (
+        ("insert", "NEW TABLE AS new_rows"),
+        ("update", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("delete", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            f"CREATE TRIGGER task_counts_{event_name} AFTER {event_name.upper()} "
+            f"ON tasks REFERENCING {transition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION apply_task_counts()"
+        )
+    op.execute(
+        """
+        UPDATE todo_lists l SET
+            total_tasks = c.total_tasks,
+            pending_tasks = c.pending_tasks,
+            in_progress_tasks = c.in_progress_tasks,
+            completed_tasks = c.completed_tasks
+        FROM (
+            SELECT
+                todo_list_id,
+                count(*) AS total_tasks,
+                count(*) FILTER (WHERE status = 'PENDING') AS pending_tasks,
+                count(*) FILTER (WHERE status = 'IN_PROGRESS') AS in_progress_tasks,
+                count(*) FILTER (WHERE status = 'COMPLETED') AS completed_tasks
+            FROM tasks GROUP BY todo_list_id
+        ) AS c
+        WHERE l.id = c.todo_list_id
+        """
+    )
+
+
+def downgrade():
+    for event_name in ("insert", "update", "delete"):
+        op.execute(f"DROP TRIGGER IF EXISTS task_counts_{event_name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS apply_task_counts()")
+    for column in reversed(COUNTERS):
+        op.drop_column("todo_lists", column)
@@ -0,0 +1,63 @@
+"""priority ordinal and indexes for sorted task listings
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-09-30 12:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+PRIORITY_RANK = (
+    "CASE priority WHEN 'LOW' THEN 0 WHEN 'MEDIUM' THEN 1 WHEN 'HIGH' THEN 2 END"
+)
+
+INDEXES = [
+    ("ix_tasks_list_priority_rank_id", ["todo_list_id", "priority_rank", "id"]),
+    (
+        "ix_tasks_list_status_priority_rank_id",
+        ["todo_list_id", "status", "priority_rank", "id"],
+    ),
+    ("ix_tasks_list_updated_at_id", ["todo_list_id", "updated_at", "id"]),
+    ("ix_tasks_list_title_id", ["todo_list_id", "title", "id"]),
+]
+
+
+# Como en 0005, la columna generada reescribe la tabla y los índices se
+# construyen con CONCURRENTLY, borrando antes los que dejara un intento fallido.
+def upgrade():
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "priority_rank",
+            sa.SmallInteger(),
+            sa.Computed(PRIORITY_RANK, persisted=True),
+        ),
+    )
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+            op.create_index(name, "tasks", columns, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    op.drop_column("tasks", "priority_rank")
@@ -0,0 +1,130 @@
+"""change_version sequence and task tombstones for the change feed
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-10-07 12:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+# Las filas existentes quedan con change_version = 0: una sincronización inicial
+# (sin since) las devuelve igualmente, ordenadas por id. ADD COLUMN con DEFAULT
+# constante no reescribe las tablas.
+def upgrade():
+    op.execute("CREATE SEQUENCE IF NOT EXISTS change_versions")
+    for table in ("todo_lists", "tasks"):
+        op.add_column(
+            table,
+            sa.Column(
+                "change_version", sa.BigInteger(), nullable=False, server_default="0"
+            ),
+        )
+    op.create_table(
+        "task_tombstones",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("todo_list_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("change_version", sa.BigInteger(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_task_tombstones_list_change_version",
+        "task_tombstones",
+        ["todo_list_id", "change_version", "task_id"],
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION stamp_todo_list_change() RETURNS trigger AS $$
+        BEGIN
+            NEW.change_version := nextval('change_versions');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER todo_lists_change_version BEFORE INSERT OR UPDATE "
+        "ON todo_lists FOR EACH ROW EXECUTE FUNCTION stamp_todo_list_change()"
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION stamp_task_change() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM 1 FROM todo_lists WHERE id = OLD.todo_list_id
+                FOR NO KEY UPDATE;
+                RETURN OLD;
+            END IF;
+            PERFORM 1 FROM todo_lists WHERE id = NEW.todo_list_id FOR NO KEY UPDATE;
+            NEW.change_version := nextval('change_versions');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER tasks_change_version BEFORE INSERT OR UPDATE OR DELETE "
+        "ON tasks FOR EACH ROW EXECUTE FUNCTION stamp_task_change()"
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION record_task_tombstones() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO task_tombstones
+                (task_id, todo_list_id, change_version, deleted_at)
+            SELECT o.id, o.todo_list_id, nextval('change_versions'),
+                   now() AT TIME ZONE 'utc'
+            FROM old_rows o
+            WHERE EXISTS (SELECT 1 FROM todo_lists l WHERE l.id = o.todo_list_id);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER task_tombstones AFTER DELETE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION record_task_tombstones()"
+    )
+    # Como en 0002: un intento fallido deja el índice INVALID y se rehace.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_list_change_version_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_tasks_list_change_version_id",
+            "tasks",
+            ["todo_list_id", "change_version", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_list_change_version_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("DROP TRIGGER IF EXISTS task_tombstones ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS tasks_change_version ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS todo_lists_change_version ON todo_lists")
+    op.execute("DROP FUNCTION IF EXISTS record_task_tombstones()")
+    op.execute("DROP FUNCTION IF EXISTS stamp_task_change()")
+    op.execute("DROP FUNCTION IF EXISTS stamp_todo_list_change()")
+    op.drop_table("task_tombstones")
+    for table in ("tasks", "todo_lists"):
+        op.drop_column(table, "change_version")
+    op.execute("DROP SEQUENCE IF EXISTS change_versions")
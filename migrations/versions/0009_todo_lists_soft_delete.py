@@ -0,0 +1,69 @@
+"""todo_lists.deleted_at for soft delete and background purge
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-10-14 12:00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+TOMBSTONES_FUNCTION = """
+        CREATE OR REPLACE FUNCTION record_task_tombstones() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO task_tombstones
+                (task_id, todo_list_id, change_version, deleted_at)
+            SELECT o.id, o.todo_list_id, nextval('change_versions'),
+                   now() AT TIME ZONE 'utc'
+            FROM old_rows o
+            WHERE EXISTS (
+                SELECT 1 FROM todo_lists l
+                WHERE l.id = o.todo_list_id{condition}
+            );
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+
+
+# Columna nullable sin DEFAULT: no reescribe la tabla. El índice parcial solo
+# contiene las listas pendientes de purgar; se borra antes de crearlo por si un
+# intento fallido lo dejó INVALID (ver 0002).
+def upgrade():
+    op.add_column("todo_lists", sa.Column("deleted_at", sa.DateTime(), nullable=True))
+    op.execute(TOMBSTONES_FUNCTION.format(condition=" AND l.deleted_at IS NULL"))
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_todo_lists_deleted_at",
+            table_name="todo_lists",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_todo_lists_deleted_at",
+            "todo_lists",
+            ["deleted_at"],
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+# Las listas aún sin purgar se borran antes de quitar la columna: si no,
+# volverían a aparecer.
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_todo_lists_deleted_at",
+            table_name="todo_lists",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("DELETE FROM todo_lists WHERE deleted_at IS NOT NULL")
+    op.execute(TOMBSTONES_FUNCTION.format(condition=""))
+    op.drop_column("todo_lists", "deleted_at")
@@ -1,9 +1,16 @@
 import pytest
 from uuid import uuid4
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.postgres import get_db
 from app.shared.utils.time import get_utc_now
 from app.domain.models.todo_list import ToDoList
 from app.domain.models.task import Task, TaskStatus, TaskPriority
 
+
 @pytest.fixture
 def sample_todo_list():
     return ToDoList(
@@ -14,6 +21,7 @@ def sample_todo_list():
         updated_at=get_utc_now()
     )
 
+
 @pytest.fixture
 def sample_task(sample_todo_list):
     return Task(
@@ -26,3 +34,47 @@ def sample_task(sample_todo_list):
         created_at=get_utc_now(),
         updated_at=get_utc_now()
     )
+
+
+# Base SQLite en un fichero temporal por prueba, con el esquema completo
+# (triggers incluidos).
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(sqlite_engine):
+    return sessionmaker(bind=sqlite_engine)
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+# Sentencias SQL ejecutadas sobre sqlite_engine desde que se pide el fixture.
+@pytest.fixture
+def statements(sqlite_engine):
+    executed = []
+    event.listen(sqlite_engine, "before_cursor_execute", lambda *args: executed.append(args[2]))
+    return executed
+
+
+# api_client(router, ...) monta los routers en una aplicación cuya get_db
+# devuelve db_session.
+@pytest.fixture
+def api_client(db_session):
+    def build(*routers):
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+        app.dependency_overrides[get_db] = lambda: db_session
+        return TestClient(app)
+
+    return build
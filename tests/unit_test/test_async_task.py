@@ -0,0 +1,165 @@
+import asyncio
+import importlib
+import pytest
+from uuid import uuid4
+from fastapi.testclient import TestClient
+from starlette.routing import Match
+from app.shared.utils.time import get_utc_now
+from app.domain.models.task import TaskCreate, TaskUpdate, TaskStatus, TaskPriority
+from app.domain.models.todo_list import ToDoList, ToDoListCreate, ToDoListUpdate
+from app.domain.exceptions.custom_exceptions import (
+    TaskNotFoundException,
+    ToDoListNotFoundException,
+)
+from app.application.use_cases.async_task_use_case import AsyncTaskUseCase
+from app.application.use_cases.async_todo_list_use_case import AsyncToDoListUseCase
+from app.infrastructure.api import main
+from app.infrastructure.api.routers import async_task_router, task_router
+from app.infrastructure.db.postgres import get_db
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from tests.unit_test.test_task import MockTaskRepository
+from tests.unit_test.test_todo_list import MockToDoListRepository
+
+
+class AsyncMockRepository:
+    # Expone los métodos de un mock síncrono como corrutinas
+    def __init__(self, repository):
+        self.repository = repository
+
+    def __getattr__(self, name):
+        method = getattr(self.repository, name)
+
+        async def wrapper(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return wrapper
+
+
+@pytest.fixture
+def list_repository():
+    return MockToDoListRepository()
+
+
+@pytest.fixture
+def async_task_use_case(list_repository):
+    return AsyncTaskUseCase(
+        task_repository=AsyncMockRepository(MockTaskRepository()),
+        todo_list_repository=AsyncMockRepository(list_repository),
+    )
+
+
+@pytest.fixture
+def async_todo_list_use_case(list_repository):
+    return AsyncToDoListUseCase(AsyncMockRepository(list_repository))
+
+
+def add_list(list_repository):
+    now = get_utc_now()
+    todo_list = ToDoList(
+        id=uuid4(), name="Test List", description="desc", created_at=now, updated_at=now
+    )
+    list_repository.add(todo_list)
+    return todo_list.id
+
+
+def test_async_task_lifecycle(async_task_use_case, list_repository):
+    # Given
+    todo_list_id = add_list(list_repository)
+
+    async def scenario():
+        created = await async_task_use_case.create_task(
+            todo_list_id, TaskCreate(title="Test Task")
+        )
+        updated = await async_task_use_case.update_task(
+            todo_list_id, created.id, TaskUpdate(priority=TaskPriority.HIGH)
+        )
+        completed = await async_task_use_case.change_status(
+            todo_list_id, created.id, TaskStatus.COMPLETED
+        )
+        page = await async_task_use_case.list_tasks(todo_list_id)
+        percentage = await async_task_use_case.get_completion_percentage(todo_list_id)
+        await async_task_use_case.delete_task(todo_list_id, created.id)
+        return updated, completed, page, percentage, created.id
+
+    # When
+    updated, completed, page, percentage, task_id = asyncio.run(scenario())
+
+    # Then
+    assert updated.priority == TaskPriority.HIGH
+    assert completed.status == TaskStatus.COMPLETED
+    assert [task.id for task in page.items] == [task_id]
+    assert percentage == 100.0
+    with pytest.raises(TaskNotFoundException):
+        asyncio.run(async_task_use_case.get_task(todo_list_id, task_id))
+
+
+def test_async_create_task_in_non_existent_list(async_task_use_case):
+    # When/Then
+    with pytest.raises(ToDoListNotFoundException):
+        asyncio.run(
+            async_task_use_case.create_task(uuid4(), TaskCreate(title="Test Task"))
+        )
+
+
+def test_async_todo_list_lifecycle(async_todo_list_use_case):
+    async def scenario():
+        created = await async_todo_list_use_case.create_list(
+            ToDoListCreate(name="Test List")
+        )
+        updated = await async_todo_list_use_case.update_list(
+            created.id, ToDoListUpdate(name="Updated List")
+        )
+        page = await async_todo_list_use_case.list_all()
+        await async_todo_list_use_case.delete_list(created.id)
+        return updated, page, created.id
+
+    # When
+    updated, page, list_id = asyncio.run(scenario())
+
+    # Then
+    assert updated.name == "Updated List"
+    assert [lst.id for lst in page.items] == [list_id]
+    with pytest.raises(ToDoListNotFoundException):
+        asyncio.run(async_todo_list_use_case.get_list(list_id))
+
+
+@pytest.fixture
+def async_mode_app(monkeypatch, session_factory, db_session):
+    monkeypatch.setenv("DB_MODE", "async")
+    app = importlib.reload(main).app
+    monkeypatch.setattr(task_router, "SessionLocal", session_factory)
+    app.dependency_overrides[get_db] = lambda: db_session
+    yield app
+    monkeypatch.undo()
+    importlib.reload(main)
+
+
+def test_sync_only_task_routes_are_reachable_in_async_mode(async_mode_app, db_session):
+    # Given
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    TaskRepository(db_session).create_many(todo_list.id, [TaskCreate(title="Exported")])
+    client = TestClient(async_mode_app)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": f"/todo-lists/{todo_list.id}/tasks/{uuid4()}",
+    }
+
+    # When
+    exported = client.get(f"/todo-lists/{todo_list.id}/tasks/export")
+    imported = client.post(
+        f"/todo-lists/{todo_list.id}/tasks/import", content=b'{"title": "Imported"}\n'
+    )
+    route = next(
+        route
+        for route in async_mode_app.routes
+        if route.matches(scope)[0] == Match.FULL
+    )
+
+    # Then
+    assert exported.status_code == 200
+    assert '"title":"Exported"' in exported.text.replace(" ", "")
+    assert imported.status_code == 200
+    assert imported.json()["imported"] == 1
+    assert route.endpoint.__module__ == async_task_router.__name__
@@ -0,0 +1,156 @@
+import pytest
+from fnmatch import fnmatch
+from uuid import uuid4
+from app.domain.models.task import TaskCreate, TaskUpdate, TaskBatchUpdateItem
+from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate
+from app.application.use_cases.task_use_case import TaskUseCase
+from app.infrastructure.cache.backends import MemoryCache, RedisCache
+from app.infrastructure.repositories.cached_task_repository import CachedTaskRepository
+from app.infrastructure.repositories.cached_todo_list_repository import (
+    CachedToDoListRepository,
+)
+from tests.unit_test.test_task import MockTaskRepository
+from tests.unit_test.test_todo_list import MockToDoListRepository
+
+
+class FakeRedis:
+    # Subconjunto de la API de redis-py que usa RedisCache, sin expiración.
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in self.data if fnmatch(key, match)]
+
+
+class CountingToDoListRepository(MockToDoListRepository):
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def get_by_id(self, list_id, *args, **kwargs):
+        self.lookups += 1
+        return super().get_by_id(list_id)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "redis":
+        return RedisCache(FakeRedis())
+    return MemoryCache(max_size=100, ttl=60)
+
+
+def test_memory_cache_evicts_least_recently_used_and_expired_entries():
+    # Given
+    cache = MemoryCache(max_size=2, ttl=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+
+    # When
+    cache.set("c", "3")
+    expired = MemoryCache(max_size=2, ttl=-1)
+    expired.set("a", "1")
+
+    # Then
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert expired.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (
+        2,
+        1,
+        1,
+        2,
+    )
+
+
+def test_cached_list_lookup_skips_repository_until_invalidated(cache):
+    # Given
+    repository = CountingToDoListRepository()
+    cached = CachedToDoListRepository(repository, cache)
+    todo_list = cached.create(ToDoListCreate(name="List"))
+
+    # When
+    first = cached.get_by_id(todo_list.id).name
+    second = cached.get_by_id(todo_list.id).name
+    cached.update(todo_list.id, ToDoListUpdate(name="Renamed"))
+    renamed = cached.get_by_id(todo_list.id)
+
+    # Then
+    assert first == second == "List"
+    assert renamed.name == "Renamed"
+    assert repository.lookups == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_task_use_case_checks_list_once_with_cache(cache):
+    # Given
+    list_repository = CountingToDoListRepository()
+    use_case = TaskUseCase(
+        CachedTaskRepository(MockTaskRepository(), cache),
+        CachedToDoListRepository(list_repository, cache),
+    )
+    todo_list = list_repository.create(ToDoListCreate(name="List"))
+
+    # When
+    use_case.create_task(todo_list.id, TaskCreate(title="Task"))
+    for _ in range(3):
+        use_case.list_tasks(todo_list.id)
+
+    # Then
+    # La creación invalida la lista cacheada (sus contadores cambian); las
+    # lecturas posteriores vuelven a consultarla una sola vez.
+    assert list_repository.lookups == 2
+
+
+def test_task_writes_invalidate_cached_tasks(cache):
+    # Given
+    list_repository = MockToDoListRepository()
+    cached_lists = CachedToDoListRepository(list_repository, cache)
+    cached_tasks = CachedTaskRepository(MockTaskRepository(), cache)
+    todo_list = cached_lists.create(ToDoListCreate(name="List"))
+    first = cached_tasks.create(todo_list.id, TaskCreate(title="First"))
+    second = cached_tasks.create(todo_list.id, TaskCreate(title="Second"))
+    cached_tasks.get_by_id(todo_list.id, first.id)
+    cached_tasks.get_by_id(todo_list.id, second.id)
+
+    # When
+    cached_tasks.update(todo_list.id, first.id, TaskUpdate(title="Updated"))
+    updated = cached_tasks.get_by_id(todo_list.id, first.id)
+    cached_tasks.update_many(
+        todo_list.id, [TaskBatchUpdateItem(id=second.id, title="Batch")]
+    )
+    batch_updated = cached_tasks.get_by_id(todo_list.id, second.id)
+    cached_lists.delete(todo_list.id)
+
+    # Then
+    assert updated.title == "Updated"
+    assert batch_updated.title == "Batch"
+    assert cache.get(f"task:{todo_list.id}:{second.id}") is None
+    assert cache.get(f"todo_list:{todo_list.id}") is None
+
+
+def test_redis_cache_uses_prefixed_keys():
+    # Given
+    client = FakeRedis()
+    cache = RedisCache(client, prefix="test:")
+    list_id = uuid4()
+
+    # When
+    cache.set(f"task:{list_id}:1", "a")
+    cache.set(f"task:{list_id}:2", "b")
+    cache.set("todo_list:1", "c")
+    cache.delete_prefix(f"task:{list_id}:")
+
+    # Then
+    assert client.data == {"test:todo_list:1": "c"}
@@ -0,0 +1,136 @@
+from uuid import UUID, uuid4
+import pytest
+from sqlalchemy import event, func, select
+from app.domain.models.task import TaskCreate, TaskStatus, TaskUpdate
+from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate
+from app.infrastructure.api.routers import changes_router
+from app.infrastructure.db.models import TaskTombstoneORM
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(changes_router.router)
+
+
+@pytest.fixture
+def todo_list(db_session):
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    TaskRepository(db_session).create_many(
+        todo_list.id, [TaskCreate(title=f"Task {i}") for i in range(5)]
+    )
+    return todo_list
+
+
+def sync(client, list_id, since=None, limit=50):
+    params = {"limit": limit} if since is None else {"since": since, "limit": limit}
+    response = client.get(f"/todo-lists/{list_id}/changes", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_initial_sync_pages_through_every_task(client, todo_list):
+    # When
+    first = sync(client, todo_list.id, limit=3)
+    second = sync(client, todo_list.id, first["next_token"], limit=3)
+
+    # Then
+    assert first["todo_list"]["total_tasks"] == 5
+    assert len(first["upserted"]) == 3 and first["has_more"] is True
+    assert len(second["upserted"]) == 2 and second["has_more"] is False
+    assert {task["title"] for task in first["upserted"] + second["upserted"]} == {
+        f"Task {i}" for i in range(5)
+    }
+
+
+def test_sync_returns_only_changes_since_token_including_deletes(
+    db_session, client, todo_list
+):
+    # Given
+    tasks = TaskRepository(db_session)
+    token = sync(client, todo_list.id)["next_token"]
+    existing = [UUID(task["id"]) for task in sync(client, todo_list.id)["upserted"]]
+    updated = tasks.update(
+        todo_list.id, existing[0], TaskUpdate(status=TaskStatus.COMPLETED)
+    )
+    tasks.delete(todo_list.id, existing[1])
+    created = tasks.create(todo_list.id, TaskCreate(title="Milk"))
+
+    # When
+    changes = sync(client, todo_list.id, token)
+
+    # Then
+    assert [task["id"] for task in changes["upserted"]] == [
+        str(updated.id),
+        str(created.id),
+    ]
+    assert changes["upserted"][0]["status"] == "completed"
+    assert changes["deleted"] == [str(existing[1])]
+    assert changes["todo_list"]["completed_tasks"] == 1
+    assert sync(client, todo_list.id, changes["next_token"]) == {
+        "todo_list": None,
+        "upserted": [],
+        "deleted": [],
+        "next_token": changes["next_token"],
+        "has_more": False,
+    }
+
+
+def test_list_edits_show_up_without_task_changes(db_session, client, todo_list):
+    # Given
+    token = sync(client, todo_list.id)["next_token"]
+
+    # When
+    ToDoListRepository(db_session).update(todo_list.id, ToDoListUpdate(name="Errands"))
+    changes = sync(client, todo_list.id, token)
+
+    # Then
+    assert changes["todo_list"]["name"] == "Errands"
+    assert changes["upserted"] == [] and changes["deleted"] == []
+
+
+def test_sync_cost_depends_on_changes_not_list_size(
+    db_session, sqlite_engine, client, todo_list
+):
+    # Given
+    tasks = TaskRepository(db_session)
+    tasks.create_many(todo_list.id, [TaskCreate(title=f"Bulk {i}") for i in range(500)])
+    token = sync(client, todo_list.id, limit=500)
+    while token["has_more"]:
+        token = sync(client, todo_list.id, token["next_token"], limit=500)
+    changed = tasks.create(todo_list.id, TaskCreate(title="New"))
+    statements = []
+    event.listen(
+        sqlite_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+
+    # When
+    changes = sync(client, todo_list.id, token["next_token"])
+
+    # Then
+    assert [task["id"] for task in changes["upserted"]] == [str(changed.id)]
+    assert len(statements) == 2
+
+
+def test_deleting_a_list_leaves_no_tombstones(db_session, todo_list):
+    # When
+    ToDoListRepository(db_session).delete(todo_list.id)
+
+    # Then
+    assert (
+        db_session.execute(select(func.count()).select_from(TaskTombstoneORM)).scalar()
+        == 0
+    )
+
+
+def test_invalid_token_and_unknown_list_are_rejected(client, todo_list):
+    # When
+    invalid = client.get(
+        f"/todo-lists/{todo_list.id}/changes", params={"since": "not-a-token"}
+    )
+    missing = client.get(f"/todo-lists/{uuid4()}/changes")
+
+    # Then
+    assert invalid.status_code == 400
+    assert missing.status_code == 404
@@ -0,0 +1,93 @@
+import gzip
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from app.infrastructure.api.compression import CompressionMiddleware, choose_encoding
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/items")
+    def items(size: int):
+        return [{"title": "Task"}] * size
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("x" * 1000)
+
+    @app.get("/export")
+    def export():
+        return StreamingResponse(
+            (b'{"title": "Task"}\n' for _ in range(100)),
+            media_type="application/x-ndjson",
+        )
+
+    return TestClient(app)
+
+
+def test_choose_encoding_follows_quality_values():
+    # When / Then
+    assert choose_encoding("gzip, br") == "br"
+    assert choose_encoding("gzip;q=1, br;q=0.5") == "gzip"
+    assert choose_encoding("br;q=0, *") == "gzip"
+    assert choose_encoding("identity") is None
+    assert choose_encoding("") is None
+
+
+def test_brotli_is_preferred_and_decompresses_to_the_original_body(client):
+    # Given
+    headers = {"Accept-Encoding": "gzip, br"}
+
+    # When
+    with client.stream(
+        "GET", "/items", params={"size": 50}, headers=headers
+    ) as response:
+        raw = b"".join(response.iter_raw())
+    identity = client.get(
+        "/items", params={"size": 50}, headers={"Accept-Encoding": "identity"}
+    )
+
+    # Then
+    assert response.headers["content-encoding"] == "br"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert brotli.decompress(raw) == identity.content
+
+
+def test_responses_over_the_threshold_are_gzipped(client):
+    # Given
+    headers = {"Accept-Encoding": "gzip"}
+
+    # When
+    large = client.get("/items", params={"size": 50}, headers=headers)
+    small = client.get("/items", params={"size": 1}, headers=headers)
+    identity = client.get(
+        "/items", params={"size": 50}, headers={"Accept-Encoding": "identity"}
+    )
+    text = client.get("/text", headers=headers)
+
+    # Then
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.headers["vary"] == "Accept-Encoding"
+    assert int(large.headers["content-length"]) < len(identity.content)
+    assert large.json() == identity.json()
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in identity.headers
+    assert "content-encoding" not in text.headers
+
+
+def test_streaming_responses_are_compressed_in_chunks(client):
+    # When
+    with client.stream(
+        "GET", "/export", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    # Then
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw) == b'{"title": "Task"}\n' * 100
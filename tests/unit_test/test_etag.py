@@ -0,0 +1,98 @@
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+from app.domain.models.task import (
+    TaskCreate,
+    TaskUpdate,
+    TaskStatus,
+    TaskBatchUpdateItem,
+)
+from app.domain.models.todo_list import ToDoListCreate, ToDoListUpdate
+from app.domain.exceptions.custom_exceptions import (
+    PreconditionFailedException,
+    TaskNotFoundException,
+)
+from app.application.use_cases.task_use_case import TaskUseCase
+from app.application.use_cases.todo_list_use_case import ToDoListUseCase
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.shared.utils.etag import (
+    etag_matches,
+    parse_if_match,
+    timestamp_etag,
+    version_etag,
+)
+
+
+def test_timestamp_etag_round_trips_through_if_match():
+    # Given
+    updated_at = datetime(2025, 9, 1, 12, 30, 15, 123456)
+    aware = updated_at.replace(tzinfo=timezone.utc)
+
+    # When
+    etag = timestamp_etag(updated_at)
+
+    # Then
+    assert etag == timestamp_etag(aware)
+    assert parse_if_match(f'W/"x", {etag}') == [updated_at]
+    assert parse_if_match("*") is None
+    assert parse_if_match('"not-hex"') == []
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert not etag_matches(None, etag)
+    assert version_etag(1, "a") != version_etag(1, "b") != version_etag(2, "b")
+
+
+def test_task_writes_bump_list_tasks_version(db_session):
+    # Given
+    lists = ToDoListRepository(db_session)
+    tasks = TaskRepository(db_session)
+    todo_list = lists.create(ToDoListCreate(name="List"))
+    other = lists.create(ToDoListCreate(name="Other"))
+
+    # When
+    task = tasks.create(todo_list.id, TaskCreate(title="Task"))
+    after_create = lists.get_tasks_version(todo_list.id)
+    created = tasks.create_many(
+        todo_list.id, [TaskCreate(title="A"), TaskCreate(title="B")]
+    )
+    tasks.update_many(
+        todo_list.id,
+        [TaskBatchUpdateItem(id=created[0].id, status=TaskStatus.COMPLETED)],
+    )
+    tasks.delete(todo_list.id, task.id)
+    lists.update(todo_list.id, ToDoListUpdate(name="Renamed"))
+
+    # Then
+    assert after_create == 1
+    assert lists.get_tasks_version(todo_list.id) > after_create + 2
+    assert lists.get_tasks_version(other.id) == 0
+    assert lists.get_tasks_version(uuid4()) is None
+
+
+def test_if_match_rejects_stale_updates(db_session):
+    # Given
+    lists = ToDoListRepository(db_session)
+    task_use_case = TaskUseCase(TaskRepository(db_session), lists)
+    list_use_case = ToDoListUseCase(lists)
+    todo_list = lists.create(ToDoListCreate(name="List"))
+    task = task_use_case.create_task(todo_list.id, TaskCreate(title="Task"))
+    stale = parse_if_match(timestamp_etag(task.updated_at))
+
+    # When
+    updated = task_use_case.update_task(
+        todo_list.id, task.id, TaskUpdate(title="First"), stale
+    )
+
+    # Then
+    assert updated.title == "First"
+    with pytest.raises(PreconditionFailedException):
+        task_use_case.change_status(todo_list.id, task.id, TaskStatus.COMPLETED, stale)
+    with pytest.raises(TaskNotFoundException):
+        task_use_case.update_task(todo_list.id, uuid4(), TaskUpdate(title="X"), stale)
+    with pytest.raises(PreconditionFailedException):
+        list_use_case.update_list(todo_list.id, ToDoListUpdate(name="X"), [])
+    current = parse_if_match(timestamp_etag(todo_list.updated_at))
+    assert (
+        list_use_case.update_list(todo_list.id, ToDoListUpdate(name="X"), current).name
+        == "X"
+    )
@@ -0,0 +1,72 @@
+import pytest
+from app.domain.models.task import TaskCreate, TaskStatus
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers import todo_list_router
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(todo_list_router.router)
+
+
+def create_lists(db_session, count):
+    lists, tasks = ToDoListRepository(db_session), TaskRepository(db_session)
+    created = []
+    for i in range(count):
+        todo_list = lists.create(ToDoListCreate(name=f"List {i}"))
+        tasks.create_many(
+            todo_list.id,
+            [
+                TaskCreate(
+                    title=f"Task {j}",
+                    status=TaskStatus.COMPLETED if j % 2 else TaskStatus.PENDING,
+                )
+                for j in range(4)
+            ],
+        )
+        created.append(todo_list)
+    return created
+
+
+def test_include_tasks_uses_constant_number_of_queries(db_session, client, statements):
+    # Given
+    create_lists(db_session, 2)
+    statements.clear()
+    few = client.get("/lists/", params={"include": "tasks", "tasks_limit": 2})
+    few_queries = len(statements)
+    create_lists(db_session, 8)
+    statements.clear()
+
+    # When
+    many = client.get("/lists/", params={"include": "tasks", "tasks_limit": 2})
+
+    # Then
+    assert len(few.json()["items"]) == 2
+    assert len(many.json()["items"]) == 10
+    assert len(statements) == few_queries == 2
+    assert all(len(item["tasks"]) == 2 for item in many.json()["items"])
+    assert all(
+        task["todo_list_id"] == item["id"]
+        for item in many.json()["items"]
+        for task in item["tasks"]
+    )
+
+
+def test_include_tasks_filters_by_status_and_works_for_one_list(db_session, client):
+    # Given
+    todo_list = create_lists(db_session, 1)[0]
+
+    # When
+    detail = client.get(
+        f"/lists/{todo_list.id}",
+        params={"include": "tasks", "tasks_status": "completed"},
+    )
+    plain = client.get(f"/lists/{todo_list.id}")
+
+    # Then
+    assert {task["title"] for task in detail.json()["tasks"]} == {"Task 1", "Task 3"}
+    assert "ETag" not in detail.headers
+    assert "tasks" not in plain.json()
+    assert plain.json()["total_tasks"] == 4
@@ -0,0 +1,210 @@
+import threading
+from datetime import timedelta
+from uuid import UUID, uuid4
+import pytest
+from sqlalchemy import update
+from app.domain.models.task import TaskCreate, TaskStatus
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers import jobs_router
+from app.infrastructure.db.models import JobORM
+from app.infrastructure.jobs import handlers
+from app.infrastructure.jobs.worker import work_once
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.shared.utils.time import get_utc_now
+
+
+@pytest.fixture
+def client(api_client, tmp_path, monkeypatch):
+    monkeypatch.setattr(handlers, "JOBS_EXPORT_DIR", str(tmp_path / "exports"))
+    return api_client(jobs_router.router)
+
+
+@pytest.fixture
+def todo_list(db_session):
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    statuses = [
+        TaskStatus.PENDING,
+        TaskStatus.PENDING,
+        TaskStatus.IN_PROGRESS,
+        TaskStatus.PENDING,
+        TaskStatus.COMPLETED,
+    ]
+    TaskRepository(db_session).create_many(
+        todo_list.id,
+        [
+            TaskCreate(title=f"Task {i}", status=status)
+            for i, status in enumerate(statuses)
+        ],
+    )
+    return todo_list
+
+
+class StopAfter:
+    def __init__(self, checks):
+        self.checks = checks
+
+    def is_set(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def enqueue(client, list_id, **body):
+    response = client.post(f"/todo-lists/{list_id}/jobs", json=body)
+    assert response.status_code == 202
+    return response
+
+
+def run_all(session_factory, batch_size=2):
+    while work_once(session_factory, batch_size):
+        pass
+
+
+def test_enqueue_returns_202_with_location_and_queued_job(client, todo_list):
+    # When
+    response = enqueue(client, todo_list.id, kind="status_change", status="completed")
+    job = client.get(response.headers["Location"]).json()
+
+    # Then
+    assert job["status"] == "queued" and job["kind"] == "status_change"
+    assert job["params"] == {"status": "completed", "from_status": None}
+    assert (
+        client.post(f"/todo-lists/{uuid4()}/jobs", json={"kind": "export"}).status_code
+        == 404
+    )
+    assert (
+        client.post(
+            f"/todo-lists/{todo_list.id}/jobs", json={"kind": "unknown"}
+        ).status_code
+        == 422
+    )
+    assert client.get(f"/jobs/{uuid4()}").status_code == 404
+
+
+def test_status_change_job_updates_matching_tasks_in_batches(
+    db_session, client, session_factory, todo_list
+):
+    # Given
+    response = enqueue(
+        client,
+        todo_list.id,
+        kind="status_change",
+        status="completed",
+        from_status="pending",
+    )
+
+    # When
+    run_all(session_factory)
+    job = client.get(response.headers["Location"]).json()
+
+    # Then
+    assert job["status"] == "succeeded" and job["attempts"] == 1
+    assert (
+        job["total"] == 3 and job["processed"] == 3 and job["result"] == {"updated": 3}
+    )
+    refreshed = ToDoListRepository(db_session).get_by_id(todo_list.id)
+    assert (
+        refreshed.completed_tasks,
+        refreshed.in_progress_tasks,
+        refreshed.pending_tasks,
+    ) == (4, 1, 0)
+
+
+def test_duplicate_job_resumes_from_its_checkpoint(
+    db_session, client, session_factory, todo_list
+):
+    # Given
+    response = enqueue(client, todo_list.id, kind="duplicate_list")
+
+    # When
+    work_once(session_factory, 2, stop=StopAfter(2))
+    interrupted = client.get(response.headers["Location"]).json()
+    run_all(session_factory)
+    job = client.get(response.headers["Location"]).json()
+
+    # Then
+    assert interrupted["status"] == "queued" and interrupted["processed"] == 2
+    assert (
+        job["status"] == "succeeded" and job["attempts"] == 2 and job["processed"] == 5
+    )
+    copy_id = UUID(job["result"]["todo_list_id"])
+    copied = TaskRepository(db_session).list_by_filters(copy_id)
+    assert ToDoListRepository(db_session).get_by_id(copy_id).name == "Copy of Groceries"
+    assert sorted(task.title for task in copied) == [f"Task {i}" for i in range(5)]
+
+
+def test_export_job_writes_a_file_served_by_download(
+    client, session_factory, todo_list
+):
+    # Given
+    response = enqueue(client, todo_list.id, kind="export", format="csv")
+    job_url = response.headers["Location"]
+    not_ready = client.get(f"{job_url}/download")
+
+    # When
+    run_all(session_factory)
+    download = client.get(f"{job_url}/download")
+
+    # Then
+    assert not_ready.status_code == 409
+    assert download.status_code == 200
+    assert download.headers["content-type"].startswith("text/csv")
+    lines = download.text.splitlines()
+    assert lines[0].startswith("title,") and len(lines) == 6
+    assert client.get(job_url).json()["result"]["rows"] == 5
+
+
+def test_job_fails_when_its_list_is_deleted(
+    db_session, client, session_factory, todo_list
+):
+    # Given
+    response = enqueue(client, todo_list.id, kind="export")
+    ToDoListRepository(db_session).delete(todo_list.id)
+
+    # When
+    run_all(session_factory)
+    job = client.get(response.headers["Location"]).json()
+
+    # Then
+    assert job["status"] == "failed" and "not found" in job["error"]
+    assert client.get(f"{response.headers['Location']}/download").status_code == 409
+
+
+def test_stale_running_job_is_reclaimed_until_attempts_run_out(
+    db_session, client, session_factory, todo_list
+):
+    # Given
+    response = enqueue(client, todo_list.id, kind="status_change", status="completed")
+    job_id = UUID(response.json()["id"])
+    stale = get_utc_now() - timedelta(hours=1)
+    db_session.execute(
+        update(JobORM)
+        .where(JobORM.id == job_id)
+        .values(status="RUNNING", attempts=3, heartbeat_at=stale)
+    )
+    db_session.commit()
+
+    # When
+    claimed = work_once(session_factory, 2, max_attempts=3)
+    job = client.get(response.headers["Location"]).json()
+
+    # Then
+    assert claimed is True
+    assert job["status"] == "failed" and job["attempts"] == 4
+    assert work_once(session_factory, 2) is False
+
+
+def test_stopping_requeues_a_claimed_job_without_work(
+    client, session_factory, todo_list
+):
+    # Given
+    response = enqueue(client, todo_list.id, kind="status_change", status="completed")
+    stop = threading.Event()
+    stop.set()
+
+    # When
+    work_once(session_factory, 2, stop=stop)
+    job = client.get(response.headers["Location"]).json()
+
+    # Then
+    assert job["status"] == "queued" and job["processed"] == 0 and job["attempts"] == 1
@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect
+from app.infrastructure.db.lifecycle import (
+    DatabaseState,
+    backoff_delay,
+    connect_with_backoff,
+    start_database,
+)
+from app.infrastructure.db.pool import TimedQueuePool
+from app.infrastructure.api.routers import health_router
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'lifecycle.db'}", poolclass=TimedQueuePool, pool_size=3
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_connect_with_backoff_retries_until_database_answers():
+    # Given
+    state = DatabaseState()
+    calls = []
+
+    def check():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("not yet")
+
+    # When
+    asyncio.run(connect_with_backoff(check, attempts=5, base_delay=0, db_state=state))
+
+    # Then
+    assert state.attempts == 3
+    assert state.error is None
+    assert [backoff_delay(i, 0.5, 8) for i in range(1, 7)] == [0.5, 1, 2, 4, 8, 8]
+
+
+def test_connect_with_backoff_gives_up_after_max_attempts():
+    # Given
+    state = DatabaseState()
+
+    def check():
+        raise ConnectionError("down")
+
+    # When/Then
+    with pytest.raises(ConnectionError):
+        asyncio.run(
+            connect_with_backoff(check, attempts=2, base_delay=0, db_state=state)
+        )
+    assert state.attempts == 2
+    assert "down" in state.error
+
+
+def test_start_database_creates_schema_on_demand_and_warms_pool(engine):
+    # Given
+    state = DatabaseState()
+
+    # When
+    asyncio.run(
+        start_database(engine, create_schema=True, warm_connections=3, db_state=state)
+    )
+
+    # Then
+    assert state.ready
+    assert {"tasks", "todo_lists"} <= set(inspect(engine).get_table_names())
+    assert engine.pool.checkedin() == 3
+
+
+def test_health_and_readiness_probes(engine, monkeypatch):
+    # Given
+    state = DatabaseState()
+    monkeypatch.setattr(health_router, "state", state)
+    monkeypatch.setattr(health_router, "engine", engine)
+    app = FastAPI()
+    app.include_router(health_router.router)
+    client = TestClient(app)
+
+    # When
+    starting = client.get("/readyz")
+    state.ready = True
+    ready = client.get("/readyz")
+
+    # Then
+    assert client.get("/healthz").json() == {"status": "ok"}
+    assert starting.status_code == 503
+    assert starting.json()["status"] == "starting"
+    assert ready.status_code == 200
+    assert ready.json()["status"] == "ready"
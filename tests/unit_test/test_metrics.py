@@ -0,0 +1,143 @@
+import logging
+import pytest
+from sqlalchemy.exc import OperationalError
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers import metrics_router, todo_list_router
+from app.infrastructure.metrics import sql
+from app.infrastructure.metrics.registry import (
+    Registry,
+    db_query_duration,
+    http_requests,
+)
+from app.infrastructure.metrics.request_timing import TimingMiddleware
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+
+
+@pytest.fixture
+def sqlite_engine(sqlite_engine):
+    sql.instrument_engine(sqlite_engine)
+    return sqlite_engine
+
+
+@pytest.fixture
+def client(api_client):
+    client = api_client(todo_list_router.router, metrics_router.router)
+    client.app.add_middleware(TimingMiddleware)
+    return client
+
+
+def server_timing(response):
+    entries = {}
+    for entry in response.headers["Server-Timing"].split(", "):
+        name, *params = entry.split(";")
+        entries[name] = dict(param.split("=", 1) for param in params)
+    return entries
+
+
+def test_server_timing_reports_phases_and_query_count(db_session, client):
+    # Given
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+
+    # When
+    response = client.get(f"/lists/{todo_list.id}")
+
+    # Then
+    timing = server_timing(response)
+    assert response.status_code == 200
+    assert {"total", "routing", "di", "db", "app", "serialize"} <= set(timing)
+    assert timing["db"]["desc"] == '"1 queries"'
+    assert float(timing["total"]["dur"]) >= float(timing["db"]["dur"])
+
+
+def test_metrics_endpoint_exposes_requests_by_route_template(db_session, client):
+    # Given
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    before = http_requests.value(method="GET", route="/lists/{list_id}", status="200")
+    client.get(f"/lists/{todo_list.id}")
+
+    # When
+    response = client.get("/metrics")
+
+    # Then
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        http_requests.value(method="GET", route="/lists/{list_id}", status="200")
+        == before + 1
+    )
+    assert (
+        'http_requests_total{method="GET",route="/lists/{list_id}",status="200"}'
+        in response.text
+    )
+    assert (
+        'http_request_db_queries_bucket{method="GET",route="/lists/{list_id}",le="+Inf"}'
+        in response.text
+    )
+    assert 'db_pool_checked_out{engine="sync"}' in response.text
+
+
+def test_slow_query_log_includes_statement_parameters_and_route(
+    db_session, client, caplog, monkeypatch
+):
+    # Given
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    monkeypatch.setattr(sql, "SLOW_QUERY_MS", 0.000001)
+
+    # When
+    with caplog.at_level(logging.WARNING, logger="app.sql.slow"):
+        client.get(f"/lists/{todo_list.id}")
+
+    # Then
+    [record] = caplog.records
+    assert "route=/lists/{list_id}" in record.getMessage()
+    assert "FROM todo_lists" in record.getMessage()
+    assert todo_list.id.hex in record.getMessage()
+
+
+def test_slow_query_log_can_omit_parameters(db_session, client, caplog, monkeypatch):
+    # Given
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    monkeypatch.setattr(sql, "SLOW_QUERY_MS", 0.000001)
+    monkeypatch.setattr(sql, "SLOW_QUERY_LOG_PARAMS", False)
+
+    # When
+    with caplog.at_level(logging.WARNING, logger="app.sql.slow"):
+        client.get(f"/lists/{todo_list.id}")
+
+    # Then
+    assert "parameters=<omitted>" in caplog.records[0].getMessage()
+    assert todo_list.id.hex not in caplog.records[0].getMessage()
+
+
+def test_registry_renders_cumulative_histogram_and_escapes_labels():
+    # Given
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+    counter = registry.counter("events_total", "Events.")
+
+    # When
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value, route="/a")
+    counter.inc(route='say "hi"')
+
+    # Then
+    text = registry.render()
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+    assert 'events_total{route="say \\"hi\\""} 1' in text
+
+
+def test_failed_statements_leave_no_timing_state_on_the_connection(sqlite_engine):
+    # Given
+    before = db_query_duration.count()
+
+    with sqlite_engine.connect() as connection:
+        # When
+        with pytest.raises(OperationalError):
+            connection.exec_driver_sql("SELECT * FROM missing_table")
+        connection.exec_driver_sql("SELECT 1")
+
+        # Then
+        assert "query_start" not in connection.info
+    assert db_query_duration.count() == before + 1
@@ -0,0 +1,99 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError
+from app.infrastructure.api.routers import internal_router
+from app.infrastructure.db.pool import (
+    PoolMetrics,
+    TimedQueuePool,
+    get_pool_stats,
+    register_engine,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_metrics_histogram_is_cumulative():
+    # Given
+    metrics = PoolMetrics()
+
+    # When
+    metrics.observe_wait(0.5)
+    metrics.observe_wait(30)
+    metrics.observe_wait(20000, timed_out=True)
+    snapshot = metrics.snapshot()
+
+    # Then
+    assert snapshot["checkouts"] == 2
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_ms_histogram"]["1"] == 1
+    assert snapshot["wait_ms_histogram"]["50"] == 2
+    assert snapshot["wait_ms_histogram"]["+Inf"] == 3
+
+
+def test_timed_pool_reports_checkouts_and_timeouts(engine):
+    # Given
+    register_engine("test", engine)
+    connection = engine.connect()
+
+    # When
+    busy = get_pool_stats()["test"]
+    with pytest.raises(TimeoutError):
+        engine.connect()
+    connection.close()
+    idle = get_pool_stats()["test"]
+
+    # Then
+    assert busy["checked_out"] == 1
+    assert idle["checked_out"] == 0
+    assert idle["checkouts"] == 1
+    assert idle["timeouts"] == 1
+
+
+def test_pool_stats_report_the_max_overflow_of_each_engine(engine, tmp_path):
+    # Given
+    other = create_engine(
+        f"sqlite:///{tmp_path / 'other.db'}", poolclass=TimedQueuePool, max_overflow=3
+    )
+    register_engine("test", engine)
+    register_engine("other", other)
+
+    # When
+    stats = get_pool_stats()
+
+    # Then
+    assert stats["test"]["max_overflow"] == 0
+    assert stats["other"]["max_overflow"] == 3
+    other.dispose()
+
+
+def test_internal_endpoints_require_the_shared_token(monkeypatch):
+    # Given
+    app = FastAPI()
+    app.include_router(internal_router.router)
+    client = TestClient(app)
+
+    # When
+    disabled = client.get("/internal/pool")
+    monkeypatch.setattr(internal_router, "INTERNAL_API_TOKEN", "secret")
+    missing = client.get("/internal/pool")
+    wrong = client.get("/internal/pool", headers={"Authorization": "Bearer other"})
+    allowed = client.get("/internal/pool", headers={"Authorization": "Bearer secret"})
+
+    # Then
+    assert disabled.status_code == 404
+    assert missing.status_code == 401 and wrong.status_code == 401
+    assert missing.headers["www-authenticate"] == "Bearer"
+    assert allowed.status_code == 200 and "pools" in allowed.json()
@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy import event
+from app.domain.models.task import TaskCreate, TaskPriority
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers import task_router
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(task_router.router)
+
+
+@pytest.fixture
+def todo_list(db_session):
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    priorities = [TaskPriority.LOW, TaskPriority.MEDIUM, TaskPriority.HIGH]
+    TaskRepository(db_session).create_many(
+        todo_list.id,
+        [
+            TaskCreate(
+                title=f"Task {i}", description="x" * 200, priority=priorities[i % 3]
+            )
+            for i in range(5)
+        ],
+    )
+    return todo_list
+
+
+def test_fields_are_pushed_down_into_the_select(
+    db_session, sqlite_engine, client, todo_list
+):
+    # Given
+    statements = []
+    event.listen(
+        sqlite_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+
+    # When
+    response = client.get(
+        f"/todo-lists/{todo_list.id}/tasks/",
+        params={"fields": "title,status", "limit": 2},
+    )
+
+    # Then
+    assert response.status_code == 200
+    body = response.json()
+    assert [set(item) for item in body["items"]] == [
+        {"title", "status"},
+        {"title", "status"},
+    ]
+    page = [sql for sql in statements if "LIMIT" in sql][-1]
+    assert "description" not in page.split("FROM")[0]
+    follow = client.get(
+        f"/todo-lists/{todo_list.id}/tasks/",
+        params={"fields": "title,status", "after": body["next_cursor"], "limit": 2},
+    )
+    titles = {item["title"] for item in body["items"] + follow.json()["items"]}
+    assert len(titles) == 4
+
+
+def test_projection_keeps_sorted_pagination(client, todo_list):
+    # Given
+    params = {"fields": "title", "sort": "-priority,title", "limit": 3}
+
+    # When
+    first = client.get(f"/todo-lists/{todo_list.id}/tasks/", params=params).json()
+    second = client.get(
+        f"/todo-lists/{todo_list.id}/tasks/",
+        params={**params, "after": first["next_cursor"]},
+    ).json()
+
+    # Then
+    assert first["items"] == [
+        {"title": "Task 2"},
+        {"title": "Task 1"},
+        {"title": "Task 4"},
+    ]
+    assert second["items"] == [{"title": "Task 0"}, {"title": "Task 3"}]
+    assert second["next_cursor"] is None
+
+
+def test_fields_change_the_etag_and_unknown_fields_are_rejected(client, todo_list):
+    # Given
+    url = f"/todo-lists/{todo_list.id}/tasks/"
+
+    # When
+    full = client.get(url)
+    projected = client.get(url, params={"fields": "id"})
+    invalid = client.get(url, params={"fields": "id,secret"})
+
+    # Then
+    assert full.headers["etag"] != projected.headers["etag"]
+    assert set(projected.json()["items"][0]) == {"id"}
+    assert len(full.json()["items"][0]) == 8
+    assert invalid.status_code == 400
+    assert invalid.json()["detail"] == "Invalid fields: 'id,secret'."
@@ -0,0 +1,239 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from app.shared.utils.time import get_utc_now
+from uuid import uuid4
+from app.application.use_cases.task_use_case import TaskUseCase
+from app.domain.exceptions.custom_exceptions import ToDoListNotFoundException
+from app.domain.models.task import TaskCreate, TaskPriority, TaskStatus, TaskUpdate
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers import internal_router
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.lifecycle import DatabaseState
+from app.infrastructure.db.models import TaskORM, TaskTombstoneORM, ToDoListORM
+from app.infrastructure.db.purge import PurgeState, purge_batch, run_purger
+from app.infrastructure.repositories import queries
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+
+
+@pytest.fixture
+def todo_list(db_session):
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    TaskRepository(db_session).create_many(
+        todo_list.id, [TaskCreate(title=f"Task {i}") for i in range(5)]
+    )
+    return todo_list
+
+
+def count(db_session, model, **filters):
+    return db_session.execute(
+        select(func.count()).select_from(model).filter_by(**filters)
+    ).scalar()
+
+
+def test_deleted_list_and_its_tasks_disappear_before_the_purge(db_session, todo_list):
+    # Given
+    lists, tasks = ToDoListRepository(db_session), TaskRepository(db_session)
+    task = tasks.list_by_filters(todo_list.id)[0]
+
+    # When
+    deleted = lists.delete(todo_list.id)
+
+    # Then
+    assert deleted is True
+    assert lists.get_by_id(todo_list.id) is None
+    assert lists.get_tasks_version(todo_list.id) is None
+    assert todo_list.id not in {item.id for item in lists.list_page().items}
+    assert tasks.get_by_id(todo_list.id, task.id) is None
+    assert tasks.update(todo_list.id, task.id, TaskUpdate(title="Late")) is None
+    assert tasks.delete(todo_list.id, task.id) is False
+    assert lists.delete(todo_list.id) is False
+    assert count(db_session, TaskORM, todo_list_id=todo_list.id) == 5
+
+
+def test_purge_deletes_tasks_in_bounded_batches_and_then_the_list(
+    db_session, todo_list
+):
+    # Given
+    tasks = TaskRepository(db_session)
+    tasks.delete(todo_list.id, tasks.list_by_filters(todo_list.id)[0].id)
+    ToDoListRepository(db_session).delete(todo_list.id)
+    progress = PurgeState()
+    remaining = []
+
+    # When
+    while purge_batch(db_session, batch_size=2, purge_state=progress):
+        remaining.append(count(db_session, TaskORM, todo_list_id=todo_list.id))
+
+    # Then
+    assert remaining == [2, 0, 0]
+    assert (
+        progress.batches == 3
+        and progress.tasks_purged == 4
+        and progress.lists_purged == 1
+    )
+    assert count(db_session, ToDoListORM, id=todo_list.id) == 0
+    assert count(db_session, TaskTombstoneORM, todo_list_id=todo_list.id) == 0
+    assert progress.current_list is None
+
+
+def test_purge_leaves_live_lists_alone(db_session, todo_list):
+    # Given
+    other = ToDoListRepository(db_session).create(ToDoListCreate(name="Other"))
+    ToDoListRepository(db_session).delete(other.id)
+
+    # When
+    while purge_batch(db_session, batch_size=100, purge_state=PurgeState()):
+        pass
+
+    # Then
+    assert count(db_session, TaskORM, todo_list_id=todo_list.id) == 5
+    assert ToDoListRepository(db_session).get_by_id(todo_list.id) is not None
+
+
+def test_progress_endpoint_reports_pending_lists_and_remaining_tasks(
+    db_session, api_client, todo_list, monkeypatch
+):
+    # Given
+    monkeypatch.setattr(internal_router, "INTERNAL_API_TOKEN", "secret")
+    client = api_client(internal_router.router)
+    client.headers["Authorization"] = "Bearer secret"
+    ToDoListRepository(db_session).delete(todo_list.id)
+    purge_batch(db_session, batch_size=2, purge_state=PurgeState())
+
+    # When
+    response = client.get("/internal/purge")
+
+    # Then
+    assert response.status_code == 200
+    [pending] = response.json()["pending"]
+    assert pending["id"] == str(todo_list.id) and pending["remaining_tasks"] == 3
+    assert "tasks_purged" in response.json()["purger"]
+
+
+def test_background_purger_runs_until_nothing_is_left(
+    db_session, session_factory, todo_list
+):
+    # Given
+    ToDoListRepository(db_session).delete(todo_list.id)
+    ready = DatabaseState()
+    ready.ready = True
+    progress = PurgeState()
+
+    async def purge_for_a_while():
+        purger = asyncio.create_task(
+            run_purger(
+                session_factory,
+                interval=0.01,
+                batch_size=2,
+                purge_state=progress,
+                db_state=ready,
+            )
+        )
+        while progress.lists_purged == 0:
+            await asyncio.sleep(0.01)
+        running = progress.running
+        purger.cancel()
+        return running
+
+    # When
+    running = asyncio.run(asyncio.wait_for(purge_for_a_while(), timeout=10))
+
+    # Then
+    assert running is True and progress.running is False
+    assert progress.tasks_purged == 5 and progress.error is None
+    assert count(db_session, ToDoListORM, id=todo_list.id) == 0
+
+
+def test_inserts_into_a_deleted_list_are_rejected_even_after_a_stale_existence_check(
+    db_session, todo_list
+):
+    # Given
+    tasks = TaskRepository(db_session)
+    ToDoListRepository(db_session).delete(todo_list.id)
+
+    class StaleListRepository:
+        # Como una caché que aún no ha visto el borrado
+        def get_by_id(self, list_id):
+            return todo_list
+
+    use_case = TaskUseCase(tasks, StaleListRepository())
+    now = get_utc_now()
+    row = {
+        "id": uuid4(),
+        "todo_list_id": todo_list.id,
+        "title": "Late",
+        "description": None,
+        "status": TaskStatus.PENDING,
+        "priority": TaskPriority.LOW,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+    # When
+    created = tasks.create(todo_list.id, TaskCreate(title="Late"))
+    created_many = tasks.create_many(todo_list.id, [TaskCreate(title="Late")])
+    copied = tasks.copy_many(todo_list.id, [TaskCreate(title="Late")])
+    loaded = db_session.execute(queries.load_tasks(), [row]).rowcount
+
+    # Then
+    assert created is None and created_many is None and copied is None
+    assert loaded == 0
+    assert count(db_session, TaskORM, title="Late") == 0
+    with pytest.raises(ToDoListNotFoundException):
+        use_case.create_task(todo_list.id, TaskCreate(title="Late"))
+    with pytest.raises(ToDoListNotFoundException):
+        use_case.create_tasks(todo_list.id, [{"title": "Late"}])
+    with pytest.raises(ToDoListNotFoundException):
+        use_case.import_tasks(todo_list.id, ['{"title": "Late"}'])
+
+
+# Los bloqueos de fila solo existen en PostgreSQL: estas pruebas se ejecutan si
+# TEST_POSTGRES_URL apunta a una base desechable (p. ej. la de docker-compose).
+@pytest.fixture
+def postgres_engine():
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.mark.parametrize("load", ["create_many", "copy_many"])
+def test_concurrent_loads_into_one_list_queue_instead_of_deadlocking(
+    postgres_engine, load
+):
+    # Given
+    with Session(postgres_engine) as db:
+        list_id = ToDoListRepository(db).create(ToDoListCreate(name="Groceries")).id
+    first = Session(postgres_engine)
+    first.execute(queries.lock_live_todo_list(list_id))
+
+    def second_load():
+        with Session(postgres_engine) as db:
+            repository = TaskRepository(db)
+            return getattr(repository, load)(list_id, [TaskCreate(title="Second")])
+
+    # When
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        second = pool.submit(second_load)
+        time.sleep(0.5)
+        queued = not second.done()
+        TaskRepository(first).create_many(list_id, [TaskCreate(title="First")])
+        loaded = second.result(timeout=10)
+    first.close()
+
+    # Then
+    assert queued
+    assert loaded is not None
+    with Session(postgres_engine) as db:
+        assert count(db, TaskORM, todo_list_id=list_id) == 2
@@ -0,0 +1,201 @@
+from uuid import uuid4
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import Session, sessionmaker
+from app.domain.models.task import TaskCreate
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers import task_router, todo_list_router
+from app.infrastructure.cache.backends import MemoryCache
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.models import ToDoListORM
+from app.infrastructure.db.postgres import get_db
+from app.infrastructure.db.routing import (
+    READ_ONLY,
+    SAFE_METHODS,
+    ReplicaSelector,
+    RoutingSession,
+)
+from app.infrastructure.repositories.cached_todo_list_repository import (
+    with_todo_list_cache,
+)
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+
+todo_lists = ToDoListORM.__table__
+
+
+def create_database(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def engines(tmp_path):
+    engines = [
+        create_database(tmp_path / name)
+        for name in ("primary.db", "replica0.db", "replica1.db")
+    ]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+# Cada base guarda la misma lista con un nombre distinto, para saber cuál ha
+# respondido; las réplicas hacen de copias que todavía no han recibido escrituras.
+@pytest.fixture
+def list_id(engines):
+    list_id = uuid4()
+    for engine, name in zip(engines, ("primary", "replica0", "replica1")):
+        with engine.begin() as connection:
+            connection.execute(insert(todo_lists).values(id=list_id, name=name))
+    return list_id
+
+
+@pytest.fixture
+def factory(engines):
+    primary, *replicas = engines
+    return sessionmaker(
+        class_=RoutingSession, bind=primary, replicas=ReplicaSelector(replicas)
+    )
+
+
+@pytest.fixture
+def client(factory):
+    def routed_db(request: Request):
+        db = factory(info={READ_ONLY: request.method in SAFE_METHODS})
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(todo_list_router.router)
+    app.include_router(task_router.router)
+    app.dependency_overrides[get_db] = routed_db
+    return TestClient(app)
+
+
+def name_in(engine, list_id):
+    with engine.connect() as connection:
+        return connection.execute(
+            select(todo_lists.c.name).where(todo_lists.c.id == list_id)
+        ).scalar()
+
+
+def test_get_requests_read_from_replicas_round_robin(client, list_id):
+    # When
+    names = [client.get(f"/lists/{list_id}").json()["name"] for _ in range(4)]
+
+    # Then
+    assert names == ["replica0", "replica1", "replica0", "replica1"]
+
+
+def test_writes_go_to_the_primary(client, engines, list_id):
+    # When
+    response = client.put(f"/lists/{list_id}", json={"name": "renamed"})
+
+    # Then
+    primary, *replicas = engines
+    assert response.status_code == 200
+    assert name_in(primary, list_id) == "renamed"
+    assert [name_in(replica, list_id) for replica in replicas] == [
+        "replica0",
+        "replica1",
+    ]
+
+
+def test_write_requests_check_existence_on_the_primary(client, engines):
+    # Given
+    primary, *_ = engines
+    created = ToDoListRepository(sessionmaker(bind=primary)()).create(
+        ToDoListCreate(name="Only on primary")
+    )
+
+    # When
+    response = client.post(f"/todo-lists/{created.id}/tasks/", json={"title": "Milk"})
+
+    # Then
+    assert response.status_code == 201
+
+
+def test_include_tasks_reads_lists_and_tasks_from_the_same_replica(
+    client, engines, list_id
+):
+    # Given
+    for engine, name in zip(engines, ("primary", "replica0", "replica1")):
+        with Session(engine) as db:
+            TaskRepository(db).create(list_id, TaskCreate(title=f"Task on {name}"))
+
+    # When
+    response = client.get("/lists/", params={"include": "tasks"})
+
+    # Then
+    item = response.json()["items"][0]
+    assert item["name"].startswith("replica")
+    assert [task["title"] for task in item["tasks"]] == [f"Task on {item['name']}"]
+
+
+def test_reads_after_a_write_in_the_same_session_stay_on_the_primary(
+    factory, engines, list_id
+):
+    # Given
+    db = factory(info={READ_ONLY: True})
+    assert (
+        db.execute(select(todo_lists.c.name).where(todo_lists.c.id == list_id)).scalar()
+        == "replica0"
+    )
+
+    # When
+    db.execute(
+        update(todo_lists).where(todo_lists.c.id == list_id).values(name="written")
+    )
+    name = db.execute(
+        select(todo_lists.c.name).where(todo_lists.c.id == list_id)
+    ).scalar()
+
+    # Then
+    assert name == "written"
+    db.rollback()
+    db.close()
+
+
+def test_without_replicas_everything_uses_the_primary(engines, list_id):
+    # Given
+    primary, *_ = engines
+    db = sessionmaker(
+        class_=RoutingSession, bind=primary, replicas=ReplicaSelector([])
+    )(info={READ_ONLY: True})
+
+    # When
+    name = db.execute(
+        select(todo_lists.c.name).where(todo_lists.c.id == list_id)
+    ).scalar()
+
+    # Then
+    assert name == "primary"
+    db.close()
+
+
+def test_replica_reads_are_not_cached(factory, list_id, monkeypatch):
+    # Given
+    cache = MemoryCache(max_size=10, ttl=60)
+    monkeypatch.setattr(
+        "app.infrastructure.repositories.cached_todo_list_repository.get_cache",
+        lambda: cache,
+    )
+    replica_read = with_todo_list_cache(
+        ToDoListRepository(factory(info={READ_ONLY: True}))
+    )
+    primary_read = with_todo_list_cache(ToDoListRepository(factory()))
+
+    # When
+    replica_read.get_by_id(list_id)
+    cached_after_replica = cache.stats()["size"]
+    primary_read.get_by_id(list_id)
+
+    # Then
+    assert cached_after_replica == 0
+    assert cache.stats()["size"] == 1
@@ -0,0 +1,34 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+from app.domain.models.batch import BatchItemError, BatchResult
+from app.domain.models.pagination import Page
+from app.domain.models.task import Task, TaskPriority, TaskStatus
+from app.infrastructure.api.responses import model_response
+
+
+def test_model_response_matches_pydantic_json():
+    # Given
+    now = datetime(2025, 9, 1, 12, 0, 0, 123456)
+    task = Task(
+        id=uuid4(),
+        todo_list_id=uuid4(),
+        title="Task",
+        status=TaskStatus.COMPLETED,
+        priority=TaskPriority.HIGH,
+        created_at=now,
+        updated_at=now,
+    )
+    page = Page[Task](items=[task], next_cursor="abc")
+    batch = BatchResult[Task](
+        items=[task], errors=[BatchItemError(index=1, detail=[{"loc": ["title"]}])]
+    )
+
+    # When
+    responses = [model_response(page), model_response(batch, headers={"ETag": '"v1"'})]
+
+    # Then
+    assert json.loads(responses[0].body) == json.loads(page.model_dump_json())
+    assert json.loads(responses[1].body) == json.loads(batch.model_dump_json())
+    assert responses[1].headers["etag"] == '"v1"'
+    assert responses[0].media_type == "application/json"
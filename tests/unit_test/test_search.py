@@ -0,0 +1,144 @@
+import pytest
+from uuid import uuid4
+from unittest.mock import MagicMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from app.domain.models.task import Task, TaskCreate
+from app.domain.models.todo_list import ToDoListCreate
+from app.domain.exceptions.custom_exceptions import ToDoListNotFoundException
+from app.application.use_cases.task_search_use_case import TaskSearchUseCase
+from app.infrastructure.api.routers import search_router
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.postgres import get_db
+from app.infrastructure.repositories import queries
+from app.infrastructure.repositories.memory_task_search_repository import (
+    InMemoryTaskSearchRepository,
+    TaskIndexStore,
+)
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.infrastructure.search.inverted_index import InvertedIndex
+from app.shared.utils.search import prefix_tsquery
+from app.shared.utils.time import get_utc_now
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_task(title, description=None):
+    now = get_utc_now()
+    return Task(
+        id=uuid4(),
+        todo_list_id=uuid4(),
+        title=title,
+        description=description,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_inverted_index_matches_prefixes_and_typos_ranking_titles_first():
+    # Given
+    in_title = make_task("Buy milk", "From the store")
+    in_description = make_task("Groceries", "buy milk and bread")
+    other = make_task("Call mom")
+    index = InvertedIndex([in_title, in_description, other])
+
+    # When
+    prefix = index.search("bu mil")
+    typo = index.search("milc")
+
+    # Then
+    ranked = sorted(prefix, key=lambda hit: -hit.rank)
+    assert [hit.id for hit in ranked] == [in_title.id, in_description.id]
+    assert {hit.id for hit in typo} == {in_title.id, in_description.id}
+    assert index.search("milk phone") == []
+    assert len(index) == 3
+
+
+def test_in_memory_search_paginates_and_follows_writes(db):
+    # Given
+    lists, tasks = ToDoListRepository(db), TaskRepository(db)
+    first = lists.create(ToDoListCreate(name="First"))
+    second = lists.create(ToDoListCreate(name="Second"))
+    tasks.create_many(first.id, [TaskCreate(title=f"Report {i}") for i in range(3)])
+    tasks.create(second.id, TaskCreate(title="Weekly report"))
+    repository = InMemoryTaskSearchRepository(db, TaskIndexStore())
+
+    # When
+    page = repository.search("rep", first.id, limit=2)
+    rest = repository.search("rep", first.id, limit=2, after=page.next_cursor)
+    tasks.create(first.id, TaskCreate(title="Reply to email"))
+    everywhere = repository.search("rep")
+
+    # Then
+    assert len(page.items) == 2 and page.next_cursor
+    assert len(rest.items) == 1 and rest.next_cursor is None
+    assert {hit.id for hit in page.items + rest.items}.isdisjoint(
+        {hit.id for hit in everywhere.items if hit.todo_list_id == second.id}
+    )
+    assert len(everywhere.items) == 5
+
+
+def test_search_use_case_checks_list_and_skips_empty_queries():
+    # Given
+    search_repository, todo_list_repository = MagicMock(), MagicMock()
+    todo_list_repository.get_by_id.return_value = None
+    use_case = TaskSearchUseCase(search_repository, todo_list_repository)
+
+    # When/Then
+    with pytest.raises(ToDoListNotFoundException):
+        use_case.search_tasks("milk", uuid4())
+    assert use_case.search_tasks("!!!").items == []
+    search_repository.search.assert_not_called()
+
+
+def test_postgres_search_query_uses_both_indexes():
+    # Given
+    text = "buy mi"
+
+    # When
+    sql = str(
+        queries.search_tasks(text, uuid4(), 10, None).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    # Then
+    assert prefix_tsquery("Buy, mi!") == "buy:* & mi:*"
+    assert "tasks.search_vector @@ to_tsquery('simple'::regconfig" in sql
+    assert "<%% tasks.title" in sql
+    assert "ORDER BY anon_1.rank DESC, anon_1.id" in sql
+
+
+def test_search_endpoints(db):
+    # Given
+    todo_list = ToDoListRepository(db).create(ToDoListCreate(name="List"))
+    TaskRepository(db).create(todo_list.id, TaskCreate(title="Write report"))
+    app = FastAPI()
+    app.include_router(search_router.router)
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    # When
+    scoped = client.get(
+        f"/todo-lists/{todo_list.id}/tasks/search", params={"q": "report"}
+    )
+    global_search = client.get("/tasks/search", params={"q": "wri"})
+    missing = client.get(f"/todo-lists/{uuid4()}/tasks/search", params={"q": "report"})
+
+    # Then
+    assert scoped.status_code == 200
+    assert scoped.json()["items"][0]["title"] == "Write report"
+    assert global_search.json()["items"][0]["rank"] > 0
+    assert missing.status_code == 404
@@ -0,0 +1,114 @@
+from uuid import uuid4
+import pytest
+from sqlalchemy import event
+from app.domain.models.batch import MAX_BATCH_SIZE
+from app.domain.models.task import TaskCreate, TaskPriority, TaskStatus
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers import task_router
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(task_router.router)
+
+
+@pytest.fixture
+def todo_list(db_session):
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    statuses = [TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED]
+    priorities = [TaskPriority.LOW, TaskPriority.HIGH]
+    TaskRepository(db_session).create_many(
+        todo_list.id,
+        [
+            TaskCreate(
+                title=f"Task {i}", status=statuses[i % 3], priority=priorities[i % 2]
+            )
+            for i in range(12)
+        ],
+    )
+    return todo_list
+
+
+def transition(client, list_id, body):
+    return client.post(f"/todo-lists/{list_id}/tasks/status:transition", json=body)
+
+
+def test_transition_updates_matching_tasks_with_a_single_update(
+    db_session, sqlite_engine, client, todo_list
+):
+    # Given
+    statements = []
+    event.listen(
+        sqlite_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+
+    # When
+    response = transition(
+        client,
+        todo_list.id,
+        {"source": {"status": ["in_progress"]}, "target": "completed"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"updated": 4}
+    assert [s.split()[0] for s in statements] == ["SELECT", "UPDATE"]
+    refreshed = ToDoListRepository(db_session).get_by_id(todo_list.id)
+    assert (
+        refreshed.pending_tasks,
+        refreshed.in_progress_tasks,
+        refreshed.completed_tasks,
+    ) == (4, 0, 8)
+
+
+def test_transition_combines_filters_and_skips_tasks_already_in_target(
+    db_session, client, todo_list
+):
+    # Given
+    tasks = TaskRepository(db_session).list_by_filters(todo_list.id)
+    chosen = [str(task.id) for task in tasks[:6]]
+
+    # When
+    reset = transition(
+        client,
+        todo_list.id,
+        {"source": {"priority": ["high"], "ids": chosen}, "target": "pending"},
+    )
+    everything = transition(client, todo_list.id, {"target": "pending"})
+
+    # Then
+    expected = {
+        str(task.id)
+        for task in tasks[:6]
+        if task.priority == TaskPriority.HIGH and task.status != TaskStatus.PENDING
+    }
+    assert reset.json()["updated"] == len(expected)
+    assert {
+        str(task.id)
+        for task in TaskRepository(db_session).list_by_filters(
+            todo_list.id, status=TaskStatus.PENDING
+        )
+    } >= expected
+    assert everything.json()["updated"] == 8 - len(expected)
+    assert ToDoListRepository(db_session).get_by_id(todo_list.id).pending_tasks == 12
+
+
+def test_transition_rejects_unknown_lists_and_oversized_id_filters(client, todo_list):
+    # When
+    missing = transition(client, uuid4(), {"target": "completed"})
+    oversized = transition(
+        client,
+        todo_list.id,
+        {
+            "source": {"ids": [str(uuid4()) for _ in range(MAX_BATCH_SIZE + 1)]},
+            "target": "completed",
+        },
+    )
+    invalid = transition(client, todo_list.id, {"target": "archived"})
+
+    # Then
+    assert missing.status_code == 404
+    assert oversized.status_code == 413
+    assert invalid.status_code == 422
@@ -1,10 +1,17 @@
+import csv
+import io
 import pytest
 from uuid import UUID, uuid4
 from datetime import datetime
 from app.shared.utils.time import get_utc_now
-from app.domain.models.task import Task, TaskCreate, TaskUpdate, TaskStatus, TaskPriority
-from app.domain.exceptions.custom_exceptions import TaskNotFoundException
+from app.domain.models.batch import MAX_BATCH_SIZE
+from app.domain.models.task import Task, TaskCreate, TaskUpdate, TaskStatus, TaskPriority, TaskStats
+from app.domain.exceptions.custom_exceptions import TaskNotFoundException, InvalidCursorException, BatchTooLargeException, ToDoListNotFoundException
+from app.domain.models.todo_list import ToDoList
+from app.application.use_cases import task_use_case as task_use_case_module
 from app.application.use_cases.task_use_case import TaskUseCase
+from app.shared.utils.cursor import build_page, decode_cursor
+from app.shared.utils.task_io import FileFormat, parse_tasks, serialize_tasks
 from tests.unit_test.test_todo_list import MockToDoListRepository
 
 
@@ -34,10 +41,12 @@ class MockTaskRepository:
             raise TaskNotFoundException(task_id)
         return task
 
-    def update(self, todo_list_id: UUID, task_id: UUID, data: TaskUpdate, *args, **kwargs) -> Task:
+    def update(self, todo_list_id: UUID, task_id: UUID, data: TaskUpdate, if_match=None) -> Task:
         task = self.tasks.get(task_id)
         if not task or task.todo_list_id != todo_list_id:
             raise TaskNotFoundException(task_id)
+        if if_match is not None and task.updated_at not in if_match:
+            return None
         update_data = data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(task, key, value)
@@ -50,6 +59,7 @@ class MockTaskRepository:
             raise TaskNotFoundException(task_id)
         del self.tasks[task_id]
         return True
+
     def list_by_filters(self, todo_list_id=None, status=None, priority=None, *args, **kwargs):
         # Simple filter for compatibility
         results = list(self.tasks.values())
@@ -61,6 +71,41 @@ class MockTaskRepository:
             results = [t for t in results if t.priority == priority]
         return results
 
+    def list_page_by_filters(self, todo_list_id, status=None, priority=None, limit=50, after=None, sort=None, fields=None):
+        results = sorted(self.list_by_filters(todo_list_id, status, priority), key=lambda t: (t.created_at, t.id))
+        if after:
+            cursor = decode_cursor(after)
+            results = [t for t in results if (t.created_at, t.id) > cursor]
+        return build_page(results[:limit + 1], limit)
+
+    def get_stats(self, todo_list_id):
+        return TaskStats.from_counts(
+            (t.status, t.priority, 1) for t in self.list_by_filters(todo_list_id)
+        )
+
+    def create_many(self, todo_list_id, data):
+        return [self.create(todo_list_id, item) for item in data]
+
+    def update_many(self, todo_list_id, items):
+        return [
+            self.update(todo_list_id, item.id, TaskUpdate(**item.model_dump(exclude_unset=True, exclude={"id"})))
+            for item in items
+            if item.id in self.tasks and self.tasks[item.id].todo_list_id == todo_list_id
+        ]
+
+    def delete_many(self, todo_list_id, task_ids):
+        return [
+            task_id for task_id in task_ids
+            if task_id in self.tasks and self.tasks[task_id].todo_list_id == todo_list_id and self.delete(todo_list_id, task_id)
+        ]
+
+    def copy_many(self, todo_list_id, data):
+        self.copied_chunks = getattr(self, "copied_chunks", []) + [len(data)]
+        return len(self.create_many(todo_list_id, data))
+
+    def stream_by_list(self, todo_list_id, batch_size):
+        yield from self.list_by_filters(todo_list_id)
+
     def list_by_todo_list(self, todo_list_id: UUID) -> list[Task]:
         return [task for task in self.tasks.values() if task.todo_list_id == todo_list_id]
 
@@ -77,7 +122,6 @@ def task_use_case():
 def test_create_task(task_use_case):
     # Given
     todo_list_id = uuid4()
-    from app.domain.models.todo_list import ToDoList
     now = get_utc_now()
     todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
     task_use_case.list_repository.add(todo_list)
@@ -105,7 +149,6 @@ def test_create_task(task_use_case):
 def test_get_task(task_use_case):
     # Given
     todo_list_id = uuid4()
-    from app.domain.models.todo_list import ToDoList
     now = get_utc_now()
     todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
     task_use_case.list_repository.add(todo_list)
@@ -132,9 +175,6 @@ def test_get_non_existent_task(task_use_case):
     # Given
     non_existent_task_id = uuid4()
     non_existent_list_id = uuid4()
-    from app.domain.models.todo_list import ToDoList
-    now = get_utc_now()
-    todo_list = ToDoList(id=non_existent_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
     # No agregamos la lista al mock, para simular que no existe
 
     # When/Then
@@ -145,7 +185,6 @@ def test_get_non_existent_task(task_use_case):
 def test_update_task(task_use_case):
     # Given
     todo_list_id = uuid4()
-    from app.domain.models.todo_list import ToDoList
     now = get_utc_now()
     todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
     task_use_case.list_repository.add(todo_list)
@@ -177,7 +216,6 @@ def test_update_task(task_use_case):
 def test_delete_task(task_use_case):
     # Given
     todo_list_id = uuid4()
-    from app.domain.models.todo_list import ToDoList
     now = get_utc_now()
     todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
     task_use_case.list_repository.add(todo_list)
@@ -200,7 +238,6 @@ def test_delete_task(task_use_case):
 def test_list_tasks_by_todo_list(task_use_case):
     # Given
     todo_list_id = uuid4()
-    from app.domain.models.todo_list import ToDoList
     now = get_utc_now()
     todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
     task_use_case.list_repository.add(todo_list)
@@ -227,9 +264,228 @@ def test_list_tasks_by_todo_list(task_use_case):
     ))
 
     # When
-    list_tasks = task_use_case.list_tasks(todo_list_id)
+    list_tasks = task_use_case.list_tasks(todo_list_id).items
 
     # Then
     assert len(list_tasks) == 2
     assert any(task.id == task1.id for task in list_tasks)
     assert any(task.id == task2.id for task in list_tasks)
+
+
+def test_list_tasks_paginates_with_cursor(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+    created = [
+        task_use_case.create_task(todo_list_id, TaskCreate(title=f"Task {i}"))
+        for i in range(5)
+    ]
+
+    # When
+    first_page = task_use_case.list_tasks(todo_list_id, limit=2)
+    second_page = task_use_case.list_tasks(todo_list_id, limit=2, after=first_page.next_cursor)
+    last_page = task_use_case.list_tasks(todo_list_id, limit=2, after=second_page.next_cursor)
+
+    # Then
+    pages = first_page.items + second_page.items + last_page.items
+    assert len(first_page.items) == 2
+    assert len(last_page.items) == 1
+    assert last_page.next_cursor is None
+    assert {task.id for task in pages} == {task.id for task in created}
+
+
+def test_list_tasks_with_invalid_cursor(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+
+    # When/Then
+    with pytest.raises(InvalidCursorException):
+        task_use_case.list_tasks(todo_list_id, after="not-a-cursor")
+
+
+def test_get_task_stats(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+    for status, priority in [
+        (TaskStatus.COMPLETED, TaskPriority.HIGH),
+        (TaskStatus.COMPLETED, TaskPriority.LOW),
+        (TaskStatus.PENDING, TaskPriority.HIGH),
+        (TaskStatus.IN_PROGRESS, TaskPriority.MEDIUM),
+    ]:
+        task_use_case.create_task(todo_list_id, TaskCreate(title="Task", status=status, priority=priority))
+
+    # When
+    stats = task_use_case.get_stats(todo_list_id)
+
+    # Then
+    assert stats.total == 4
+    assert stats.by_status[TaskStatus.COMPLETED] == 2
+    assert stats.by_status[TaskStatus.PENDING] == 1
+    assert stats.by_priority[TaskPriority.HIGH] == 2
+    assert stats.by_priority[TaskPriority.MEDIUM] == 1
+    assert stats.completion_percentage == 50.0
+    assert task_use_case.get_completion_percentage(todo_list_id) == 50.0
+
+
+def test_get_completion_percentage_of_empty_list(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+
+    # When
+    percentage = task_use_case.get_completion_percentage(todo_list_id)
+
+    # Then
+    assert percentage == 0.0
+
+
+def test_change_task_status(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+    created_task = task_use_case.create_task(todo_list_id, TaskCreate(title="Test Task"))
+
+    # When
+    updated_task = task_use_case.change_status(todo_list_id, created_task.id, TaskStatus.IN_PROGRESS)
+
+    # Then
+    assert updated_task.status == TaskStatus.IN_PROGRESS
+    assert updated_task.priority == TaskPriority.MEDIUM
+
+
+def test_batch_create_tasks_reports_invalid_items(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+    items = [{"title": "Task 1"}, {"title": ""}, {"title": "Task 3", "priority": "high"}]
+
+    # When
+    result = task_use_case.create_tasks(todo_list_id, items)
+
+    # Then
+    assert [task.title for task in result.items] == ["Task 1", "Task 3"]
+    assert [error.index for error in result.errors] == [1]
+
+
+def test_batch_update_tasks_reports_missing_and_duplicated_ids(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+    task = task_use_case.create_task(todo_list_id, TaskCreate(title="Task 1"))
+    items = [
+        {"id": str(task.id), "status": "completed"},
+        {"id": str(task.id), "title": "Duplicated"},
+        {"id": str(uuid4()), "title": "Missing"},
+        {"title": "Without id"},
+    ]
+
+    # When
+    result = task_use_case.update_tasks(todo_list_id, items)
+
+    # Then
+    assert [updated.status for updated in result.items] == [TaskStatus.COMPLETED]
+    assert [error.index for error in result.errors] == [1, 2, 3]
+
+
+def test_batch_delete_tasks_reports_missing_ids(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+    task = task_use_case.create_task(todo_list_id, TaskCreate(title="Task 1"))
+    missing_id = uuid4()
+
+    # When
+    result = task_use_case.delete_tasks(todo_list_id, [task.id, missing_id])
+
+    # Then
+    assert result.items == [task.id]
+    assert [(error.index, error.id) for error in result.errors] == [(1, missing_id)]
+
+
+def test_batch_update_and_delete_of_missing_list(task_use_case):
+    # Given
+    missing_list_id = uuid4()
+
+    # When/Then
+    with pytest.raises(ToDoListNotFoundException):
+        task_use_case.update_tasks(missing_list_id, [{"id": str(uuid4()), "title": "Task"}])
+    with pytest.raises(ToDoListNotFoundException):
+        task_use_case.delete_tasks(missing_list_id, [uuid4()])
+
+
+def test_batch_rejects_too_many_items(task_use_case):
+    # Given
+    items = [{"title": "Task"}] * (MAX_BATCH_SIZE + 1)
+
+    # When/Then
+    with pytest.raises(BatchTooLargeException):
+        task_use_case.create_tasks(uuid4(), items)
+
+
+def test_export_tasks_as_ndjson_and_csv(task_use_case):
+    # Given
+    todo_list_id = uuid4()
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+    for i in range(3):
+        task_use_case.create_task(todo_list_id, TaskCreate(title=f"Task {i}", description="a,\"b\"\nc"))
+
+    # When
+    ndjson = list(serialize_tasks(task_use_case.export_tasks(todo_list_id, 2), FileFormat.NDJSON, rows_per_chunk=2))
+    csv_text = "".join(serialize_tasks(task_use_case.export_tasks(todo_list_id, 2), FileFormat.CSV))
+
+    # Then
+    assert len(ndjson) == 2
+    assert [Task.model_validate_json(line).title for line in "".join(ndjson).splitlines()] == ["Task 0", "Task 1", "Task 2"]
+    rows = list(csv.DictReader(io.StringIO(csv_text)))
+    assert [row["title"] for row in rows] == ["Task 0", "Task 1", "Task 2"]
+    assert rows[0]["description"] == "a,\"b\"\nc"
+
+
+def test_export_tasks_of_missing_list(task_use_case):
+    # When/Then
+    with pytest.raises(ToDoListNotFoundException):
+        task_use_case.export_tasks(uuid4(), 10)
+
+
+def test_import_tasks_in_chunks_and_reports_rejected_rows(task_use_case, monkeypatch):
+    # Given
+    todo_list_id = uuid4()
+    monkeypatch.setattr(task_use_case_module, "IMPORT_CHUNK_SIZE", 2)
+    now = get_utc_now()
+    todo_list = ToDoList(id=todo_list_id, name="Test List", description="desc", created_at=now, updated_at=now)
+    task_use_case.list_repository.add(todo_list)
+    ndjson = ['{"title": "Task 1"}\n', '{"title": ""}\n', "not json\n", '{"title": "Task 2", "priority": "high"}\n', "\n", '{"title": "Task 3"}\n']
+    csv_lines = ["title,description,status\n", "Task 4,,completed\n", ",desc,pending\n"]
+
+    # When
+    ndjson_report = task_use_case.import_tasks(todo_list_id, parse_tasks(ndjson, FileFormat.NDJSON))
+    csv_report = task_use_case.import_tasks(todo_list_id, parse_tasks(csv_lines, FileFormat.CSV))
+
+    # Then
+    assert (ndjson_report.imported, ndjson_report.rejected) == (3, 2)
+    assert [error.index for error in ndjson_report.errors] == [1, 2]
+    assert (csv_report.imported, csv_report.rejected) == (1, 1)
+    assert task_use_case.task_repository.copied_chunks == [2, 1, 1]
+    stats = task_use_case.get_stats(todo_list_id)
+    assert stats.total == 4
+    assert stats.by_status[TaskStatus.COMPLETED] == 1
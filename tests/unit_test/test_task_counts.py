@@ -0,0 +1,105 @@
+from sqlalchemy import update
+from app.domain.models.task import (
+    TaskCreate,
+    TaskUpdate,
+    TaskStatus,
+    TaskBatchUpdateItem,
+)
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers.todo_list_router import _list_etag
+from app.infrastructure.cli import repair_task_counts
+from app.infrastructure.db.models import ToDoListORM
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.shared.utils.etag import parse_if_match
+
+
+def counts(todo_list):
+    return (
+        todo_list.total_tasks,
+        todo_list.pending_tasks,
+        todo_list.in_progress_tasks,
+        todo_list.completed_tasks,
+    )
+
+
+def test_task_writes_keep_list_counters_in_sync(db_session):
+    # Given
+    lists, tasks = ToDoListRepository(db_session), TaskRepository(db_session)
+    todo_list = lists.create(ToDoListCreate(name="List"))
+    other = lists.create(ToDoListCreate(name="Other"))
+
+    # When
+    task = tasks.create(todo_list.id, TaskCreate(title="Task"))
+    created = tasks.create_many(
+        todo_list.id, [TaskCreate(title=f"Task {i}") for i in range(3)]
+    )
+    tasks.copy_many(
+        todo_list.id, [TaskCreate(title="Imported", status=TaskStatus.COMPLETED)]
+    )
+    tasks.update(todo_list.id, task.id, TaskUpdate(status=TaskStatus.COMPLETED))
+    tasks.update(todo_list.id, created[0].id, TaskUpdate(title="Renamed"))
+    tasks.update_many(
+        todo_list.id,
+        [TaskBatchUpdateItem(id=created[1].id, status=TaskStatus.IN_PROGRESS)],
+    )
+    tasks.delete_many(todo_list.id, [created[2].id])
+    page = lists.list_page()
+
+    # Then
+    current = lists.get_by_id(todo_list.id)
+    assert counts(current) == (4, 1, 1, 2)
+    assert current.completion_percentage == 50.0
+    assert current.updated_at == todo_list.updated_at
+    assert counts(lists.get_by_id(other.id)) == (0, 0, 0, 0)
+    assert [counts(item) for item in page.items] == [(4, 1, 1, 2), (0, 0, 0, 0)]
+
+    tasks.delete(todo_list.id, task.id)
+    assert counts(lists.get_by_id(todo_list.id)) == (3, 1, 1, 1)
+
+
+def test_repair_command_recomputes_drifted_counters(
+    db_session, session_factory, monkeypatch, capsys
+):
+    # Given
+    lists, tasks = ToDoListRepository(db_session), TaskRepository(db_session)
+    drifted = lists.create(ToDoListCreate(name="Drifted"))
+    healthy = lists.create(ToDoListCreate(name="Healthy"))
+    tasks.create_many(
+        drifted.id,
+        [TaskCreate(title="A"), TaskCreate(title="B", status=TaskStatus.COMPLETED)],
+    )
+    tasks.create(healthy.id, TaskCreate(title="C"))
+    db_session.execute(
+        update(ToDoListORM.__table__)
+        .where(ToDoListORM.id == drifted.id)
+        .values(total_tasks=7, completed_tasks=0)
+    )
+    db_session.commit()
+    monkeypatch.setattr(repair_task_counts, "SessionLocal", session_factory)
+    monkeypatch.setattr("sys.argv", ["repair_task_counts", "--batch-size", "1"])
+
+    # When
+    exit_code = repair_task_counts.main()
+
+    # Then
+    db_session.expire_all()
+    assert exit_code == 0
+    assert counts(lists.get_by_id(drifted.id)) == (2, 1, 0, 1)
+    assert counts(lists.get_by_id(healthy.id)) == (1, 1, 0, 0)
+    assert "2 listas revisadas, 1 corregidas" in capsys.readouterr().err
+
+
+def test_list_etag_changes_with_counters(db_session):
+    # Given
+    lists, tasks = ToDoListRepository(db_session), TaskRepository(db_session)
+    todo_list = lists.create(ToDoListCreate(name="List"))
+    before = _list_etag(todo_list)
+
+    # When
+    tasks.create(todo_list.id, TaskCreate(title="Task"))
+    after = _list_etag(lists.get_by_id(todo_list.id))
+
+    # Then
+    assert before != after
+    assert parse_if_match(after) == [todo_list.updated_at]
@@ -0,0 +1,157 @@
+from datetime import timedelta
+import pytest
+from sqlalchemy import update
+from app.domain.exceptions.custom_exceptions import InvalidSortException
+from app.domain.models.task import TaskCreate, TaskPriority, TaskSortField, TaskStatus
+from app.domain.models.todo_list import ToDoListCreate
+from app.infrastructure.api.routers import task_router
+from app.infrastructure.db.models import TaskORM
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.infrastructure.repositories.todo_list_repository import ToDoListRepository
+from app.shared.utils.sorting import parse_task_sort
+from app.shared.utils.time import get_utc_now
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(task_router.router)
+
+
+@pytest.fixture
+def todo_list(db_session):
+    todo_list = ToDoListRepository(db_session).create(ToDoListCreate(name="Groceries"))
+    priorities = [TaskPriority.LOW, TaskPriority.HIGH, TaskPriority.MEDIUM]
+    tasks = TaskRepository(db_session).create_many(
+        todo_list.id,
+        [
+            TaskCreate(
+                title=f"Task {i:02d}",
+                priority=priorities[i % 3],
+                status=TaskStatus.COMPLETED if i % 4 == 0 else TaskStatus.PENDING,
+            )
+            for i in range(12)
+        ],
+    )
+    # Fechas distintas y en orden inverso al título para que cada orden difiera.
+    now = get_utc_now()
+    for i, task in enumerate(tasks):
+        db_session.execute(
+            update(TaskORM.__table__)
+            .where(TaskORM.id == task.id)
+            .values(
+                created_at=now - timedelta(minutes=i),
+                updated_at=now + timedelta(minutes=i % 5),
+            )
+        )
+    db_session.commit()
+    return todo_list
+
+
+def fetch_all(client, list_id, sort, limit=5, **params):
+    items, after = [], None
+    while True:
+        response = client.get(
+            f"/todo-lists/{list_id}/tasks/",
+            params={"sort": sort, "limit": limit, "after": after, **params},
+        )
+        assert response.status_code == 200
+        items.extend(response.json()["items"])
+        after = response.json()["next_cursor"]
+        if after is None:
+            return items
+
+
+def test_parse_task_sort_reads_fields_and_directions():
+    # Given
+    sort = "priority, -created_at,title"
+
+    # When
+    keys = parse_task_sort(sort)
+
+    # Then
+    assert keys == [
+        (TaskSortField.PRIORITY, False),
+        (TaskSortField.CREATED_AT, True),
+        (TaskSortField.TITLE, False),
+    ]
+    assert parse_task_sort(None) is None
+
+
+@pytest.mark.parametrize("sort", ["", "name", "priority,priority", "--title"])
+def test_parse_task_sort_rejects_unknown_or_repeated_fields(sort):
+    # When / Then
+    with pytest.raises(InvalidSortException):
+        parse_task_sort(sort)
+
+
+@pytest.mark.parametrize(
+    "sort, key",
+    [
+        (
+            "-priority",
+            lambda t: (
+                -["low", "medium", "high"].index(t["priority"]),
+                [-b for b in bytes.fromhex(t["id"].replace("-", ""))],
+            ),
+        ),
+        (
+            "priority,-created_at",
+            lambda t: (
+                ["low", "medium", "high"].index(t["priority"]),
+                [-ord(c) for c in t["created_at"]],
+            ),
+        ),
+        ("updated_at,title", lambda t: (t["updated_at"], t["title"])),
+        ("-title", lambda t: [-ord(c) for c in t["title"]]),
+    ],
+)
+def test_sorted_pages_follow_requested_order_across_cursors(
+    client, todo_list, sort, key
+):
+    # When
+    items = fetch_all(client, todo_list.id, sort)
+
+    # Then
+    assert len(items) == 12
+    assert items == sorted(items, key=key)
+
+
+def test_priority_sort_uses_ordinal_and_combines_with_status_filter(client, todo_list):
+    # When
+    response = client.get(
+        f"/todo-lists/{todo_list.id}/tasks/",
+        params={"sort": "-priority", "status": "pending", "limit": 3},
+    )
+
+    # Then
+    items = response.json()["items"]
+    assert [item["priority"] for item in items] == ["high", "high", "high"]
+    assert all(item["status"] == "pending" for item in items)
+    assert response.json()["next_cursor"] is not None
+
+
+def test_cursor_from_another_sort_is_rejected(client, todo_list):
+    # Given
+    first = client.get(
+        f"/todo-lists/{todo_list.id}/tasks/", params={"sort": "title", "limit": 2}
+    ).json()
+
+    # When
+    response = client.get(
+        f"/todo-lists/{todo_list.id}/tasks/",
+        params={"sort": "priority,title", "after": first["next_cursor"]},
+    )
+
+    # Then
+    assert response.status_code == 400
+
+
+def test_invalid_sort_returns_400(client, todo_list):
+    # When
+    response = client.get(
+        f"/todo-lists/{todo_list.id}/tasks/", params={"sort": "description"}
+    )
+
+    # Then
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid sort: 'description'."
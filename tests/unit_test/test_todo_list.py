@@ -5,11 +5,13 @@ from app.shared.utils.time import get_utc_now
 from app.domain.models.todo_list import ToDoList, ToDoListCreate, ToDoListUpdate
 from app.domain.exceptions.custom_exceptions import ToDoListNotFoundException
 from app.application.use_cases.todo_list_use_case import ToDoListUseCase
+from app.shared.utils.cursor import build_page, decode_cursor
 
 
 class MockToDoListRepository:
     def __init__(self):
         self.lists = {}
+        self.tasks_versions = {}
 
     def create(self, data: ToDoListCreate) -> ToDoList:
         list_id = uuid4()
@@ -30,10 +32,12 @@ class MockToDoListRepository:
     def get_by_id(self, list_id: UUID, *args, **kwargs) -> ToDoList:
         return self.lists.get(list_id)
 
-    def update(self, list_id: UUID, data: ToDoListUpdate) -> ToDoList:
+    def update(self, list_id: UUID, data: ToDoListUpdate, if_match=None) -> ToDoList:
         if list_id not in self.lists:
             return None
         todo_list = self.lists[list_id]
+        if if_match is not None and todo_list.updated_at not in if_match:
+            return None
         update_data = data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(todo_list, key, value)
@@ -46,9 +50,19 @@ class MockToDoListRepository:
         del self.lists[list_id]
         return True
 
+    def get_tasks_version(self, list_id: UUID):
+        return self.tasks_versions.get(list_id, 0) if list_id in self.lists else None
+
     def list_all(self) -> list[ToDoList]:
         return list(self.lists.values())
 
+    def list_page(self, limit=50, after=None):
+        results = sorted(self.lists.values(), key=lambda lst: (lst.created_at, lst.id))
+        if after:
+            cursor = decode_cursor(after)
+            results = [lst for lst in results if (lst.created_at, lst.id) > cursor]
+        return build_page(results[:limit + 1], limit)
+
 
 @pytest.fixture
 def todo_list_use_case():
@@ -149,9 +163,25 @@ def test_list_all_todo_lists(todo_list_use_case):
     ))
 
     # When
-    all_lists = todo_list_use_case.list_all()
+    all_lists = todo_list_use_case.list_all().items
 
     # Then
     assert len(all_lists) == 2
     assert any(lst.id == list1.id for lst in all_lists)
     assert any(lst.id == list2.id for lst in all_lists)
+
+
+def test_list_all_todo_lists_paginated(todo_list_use_case):
+    # Given
+    for i in range(3):
+        todo_list_use_case.create_list(ToDoListCreate(name=f"List {i}"))
+
+    # When
+    first_page = todo_list_use_case.list_all(limit=2)
+    second_page = todo_list_use_case.list_all(limit=2, after=first_page.next_cursor)
+
+    # Then
+    assert len(first_page.items) == 2
+    assert first_page.next_cursor is not None
+    assert len(second_page.items) == 1
+    assert second_page.next_cursor is None